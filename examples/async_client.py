@@ -0,0 +1,49 @@
+import asyncio
+
+from beamngpy import AsyncBeamNGpy, BeamNGpy, Scenario, Vehicle
+from beamngpy.sensors import Electrics, Lidar
+
+
+async def run(vehicles, lidar):
+    async with AsyncBeamNGpy("localhost", 25252) as abng:
+        await asyncio.gather(*(abng.vehicles.connect(v) for v in vehicles))
+
+        for _ in range(20):
+            await abng.control.step(30)
+
+            # All the requests are sent before waiting for any of the responses.
+            readings = await asyncio.gather(
+                abng.sensors.poll_lidar(lidar),
+                abng.vehicles.get_states([v.vid for v in vehicles]),
+                *(abng.sensors.poll(v, "electrics") for v in vehicles),
+            )
+            points = readings[0]["pointCloud"]
+            speeds = [v.sensors["electrics"]["wheelspeed"] for v in vehicles]
+            print(f"LiDAR points: {len(points)}, wheel speeds: {speeds}")
+
+
+if __name__ == "__main__":
+    # The regular BeamNGpy instance launches the simulator and sets up the scenario and sensors.
+    beamng = BeamNGpy("localhost", 25252)
+    beamng.open()
+
+    scenario = Scenario("tech_ground", "async_client")
+    vehicles = [Vehicle(f"car{i}", model="etk800") for i in range(8)]
+    for i, vehicle in enumerate(vehicles):
+        vehicle.sensors.attach("electrics", Electrics())
+        scenario.add_vehicle(vehicle, pos=(-20 + i * 5, 0, 0))
+    scenario.make(beamng)
+
+    beamng.settings.set_deterministic(60)
+    beamng.scenario.load(scenario)
+    beamng.scenario.start()
+    beamng.control.pause()
+    for vehicle in vehicles:
+        vehicle.ai.set_mode("random")
+
+    lidar = Lidar("lidar", beamng, vehicles[0], is_visualised=False)
+
+    asyncio.run(run(vehicles, lidar))
+
+    lidar.remove()
+    beamng.disconnect()
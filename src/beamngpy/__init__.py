@@ -1,6 +1,6 @@
 import os
 
-from beamngpy.beamng import BeamNGpy
+from beamngpy.beamng import AsyncBeamNGpy, BeamNGpy
 from beamngpy.logging import config_logging, set_up_simple_logging
 from beamngpy.misc import vec3
 from beamngpy.misc.quat import angle_to_quat
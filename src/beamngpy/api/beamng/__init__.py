@@ -1,3 +1,4 @@
+from .asynchronous import AsyncApi, AsyncControlApi, AsyncSensorsApi, AsyncVehiclesApi
 from .base import Api
 from .camera import CameraApi
 from .control import ControlApi
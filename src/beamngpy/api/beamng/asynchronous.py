@@ -0,0 +1,277 @@
+from __future__ import annotations
+
+import asyncio
+from typing import TYPE_CHECKING, Dict, Iterable, List
+
+from beamngpy.connection.async_connection import AsyncConnection, AsyncResponse
+from beamngpy.logging import BNGError, _generate_docstring
+from beamngpy.types import Float3, StrDict
+
+if TYPE_CHECKING:
+    from beamngpy.beamng import AsyncBeamNGpy
+    from beamngpy.sensors import Camera, Lidar
+    from beamngpy.vehicle import Vehicle
+
+
+class AsyncApi:
+    """
+    A base API class from which all the asyncio APIs communicating with the simulator derive.
+
+    Args:
+        beamng: An instance of the asyncio simulator client.
+    """
+
+    def __init__(self, beamng: AsyncBeamNGpy):
+        self._beamng = beamng
+        self._send = beamng._send
+        self._message = beamng._message
+        self._logger = beamng.logger
+        self.__doc__ = _generate_docstring(self)
+
+
+class AsyncControlApi(AsyncApi):
+    """
+    The asyncio version of :class:`.ControlApi`, allowing control of the flow of the simulation.
+
+    Args:
+        beamng: An instance of the asyncio simulator client.
+    """
+
+    async def step(self, count: int, wait: bool = True) -> None:
+        """
+        Advances the simulation the given amount of steps, assuming it is
+        currently paused. If the wait flag is set, this coroutine finishes when
+        the simulator has finished simulating the desired amount of steps.
+
+        Args:
+            count: The amount of steps to simulate.
+            wait: Optional. Whether to wait for the steps to be
+                  simulated. Defaults to True.
+
+        Raises:
+            BNGError: If the wait flag is set but the simulator doesn't respond
+                      appropriately.
+        """
+        data: StrDict = dict(type="Step", count=count)
+        data["ack"] = wait
+        resp = await self._send(data)
+        if wait:
+            await resp.ack("Stepped")
+        self._logger.info(f"Advancing the simulation by {count} steps.")
+
+    async def pause(self) -> None:
+        """
+        Sends a pause request to BeamNG.*, finishing when the simulation is paused.
+        """
+        data = dict(type="Pause")
+        await (await self._send(data)).ack("Paused")
+        self._logger.info("Pausing the simulation.")
+
+    async def resume(self) -> None:
+        """
+        Sends a resume request to BeamNG.*, finishing when the simulation is resumed.
+        """
+        data = dict(type="Resume")
+        await (await self._send(data)).ack("Resumed")
+        self._logger.info("Resuming the simulation.")
+
+    async def get_gamestate(self) -> Dict[str, str]:
+        """
+        Retrieves the current game state of the simulator. See :func:`.ControlApi.get_gamestate`
+        for the description of the returned dictionary.
+
+        Returns:
+            The game state as a dictionary.
+        """
+        data = dict(type="GameStateRequest")
+        return await (await self._send(data)).recv("GameState")
+
+    async def queue_lua_command(self, chunk: str, response: bool = False) -> StrDict:
+        """
+        Executes one lua chunk in the game engine VM.
+
+        Args:
+            chunk: lua chunk as a string
+            response: If True, then the response is sent back to BeamNGpy.
+        """
+        data = dict(type="QueueLuaCommandGE")
+        data["chunk"] = chunk
+        data["resp"] = response
+        resp = await (await self._send(data)).recv("ExecutedLuaChunkGE")
+        return resp.get("resp", None)
+
+
+class AsyncVehiclesApi(AsyncApi):
+    """
+    The asyncio version of :class:`.VehiclesApi`. Besides the vehicle queries, it manages the
+    asyncio connections to the vehicles, which are independent of :attr:`.Vehicle.connection`.
+
+    Args:
+        beamng: An instance of the asyncio simulator client.
+    """
+
+    def __init__(self, beamng: AsyncBeamNGpy):
+        super().__init__(beamng)
+        self._connections: Dict[str, AsyncConnection] = {}
+
+    async def start_connection(
+        self, vehicle: Vehicle, extensions: List[str] | None
+    ) -> StrDict:
+        connection_msg: StrDict = {"type": "StartVehicleConnection"}
+        connection_msg["vid"] = vehicle.vid
+        if extensions is not None:
+            connection_msg["exts"] = extensions
+        return await (await self._send(connection_msg)).recv("StartVehicleConnection")
+
+    async def connect(self, vehicle: Vehicle) -> AsyncConnection:
+        """
+        Opens an asyncio connection to the given vehicle. The connection is used by
+        :func:`AsyncSensorsApi.poll` and can be retrieved using :func:`get_connection`.
+
+        Args:
+            vehicle: The vehicle to connect to.
+
+        Returns:
+            The connection to the vehicle.
+        """
+        connection = self._connections.get(vehicle.vid)
+        if connection and connection.is_connected():
+            return connection
+
+        port = vehicle.port
+        if port is None:
+            resp = await self.start_connection(vehicle, vehicle.extensions)
+            assert resp["vid"] == vehicle.vid
+            port = int(resp["result"])
+        connection = AsyncConnection(self._beamng.host, port)
+        if not await connection.connect(log_tries=False):
+            raise BNGError(f"Cannot connect to the vehicle {vehicle.vid}.")
+        self._connections[vehicle.vid] = connection
+        self._logger.info(f"Vehicle {vehicle.vid} connected to simulation.")
+        return connection
+
+    def get_connection(self, vehicle: Vehicle | str) -> AsyncConnection:
+        """
+        Returns the asyncio connection to the given vehicle opened by :func:`connect`.
+
+        Args:
+            vehicle: The vehicle or its ID.
+        """
+        vid = vehicle if isinstance(vehicle, str) else vehicle.vid
+        if vid not in self._connections:
+            raise BNGError(f"The vehicle {vid} is not connected!")
+        return self._connections[vid]
+
+    async def disconnect(self, vehicle: Vehicle | str) -> None:
+        """
+        Closes the asyncio connection to the given vehicle.
+
+        Args:
+            vehicle: The vehicle or its ID.
+        """
+        vid = vehicle if isinstance(vehicle, str) else vehicle.vid
+        connection = self._connections.pop(vid, None)
+        if connection:
+            await connection.disconnect()
+
+    async def disconnect_all(self) -> None:
+        """
+        Closes the asyncio connections to all the vehicles.
+        """
+        await asyncio.gather(*(self.disconnect(vid) for vid in list(self._connections)))
+
+    async def get_states(self, vehicles: Iterable[str]) -> Dict[str, Dict[str, Float3]]:
+        """
+        Gets the states of the vehicles provided as the argument to this function.
+        The returned state includes position, direction vectors and the velocities.
+
+        Args:
+            vehicles: A list of the vehicle IDs to query state from.
+
+        Returns:
+            A mapping of the vehicle IDs to their state stored as a dictionary
+            with [``pos``, ``dir``, ``up``, ``vel``] keys.
+        """
+        data: StrDict = dict(type="UpdateScenario")
+        data["vehicles"] = list(vehicles)
+        resp = await (await self._send(data)).recv("ScenarioUpdate")
+        return resp["vehicles"]
+
+
+class AsyncSensorsApi(AsyncApi):
+    """
+    An API for polling sensors over the asyncio connections. The sensors themselves are
+    created and removed with a regular :class:`.BeamNGpy` instance connected to the same simulator.
+
+    Args:
+        beamng: An instance of the asyncio simulator client.
+    """
+
+    async def poll(self, vehicle: Vehicle, *sensor_names: str) -> None:
+        """
+        The asyncio version of :func:`.Sensors.poll`. Updates the vehicle's sensor readings. The vehicle
+        has to be connected using :func:`AsyncVehiclesApi.connect` first.
+
+        Args:
+            vehicle: The vehicle whose sensors are polled.
+            sensor_names: Names of sensors to poll. If none are provided, then all attached sensors
+                          are polled.
+        """
+        sensors = vehicle.sensors
+        if not sensor_names:
+            sensor_names = tuple(sensors.data.keys())
+
+        engine_reqs, vehicle_reqs = sensors._encode_requests(sensor_names)
+        responses: List[AsyncResponse] = []
+        if engine_reqs["sensors"]:
+            responses.append(await self._send(engine_reqs))
+        if vehicle_reqs["sensors"]:
+            connection = self._beamng.vehicles.get_connection(vehicle)
+            responses.append(await connection.send(vehicle_reqs))
+
+        sensor_data = dict()
+        for resp in await asyncio.gather(*(r.recv("SensorData") for r in responses)):
+            sensor_data.update(resp["data"])
+        sensors._update_readings(sensor_data)
+
+    async def poll_camera(self, camera: Camera) -> StrDict:
+        """
+        The asyncio version of :func:`.Camera.poll`.
+
+        Args:
+            camera: The camera sensor to poll.
+
+        Returns:
+            A dictionary with the values as processed images and the
+            ``colour``, ``annotation`` and ``depth`` keys.
+        """
+        data = dict(
+            type="PollCamera",
+            name=camera.name,
+            isUsingSharedMemory=camera.is_using_shared_memory,
+        )
+        raw_readings = (await (await self._send(data)).recv())["data"]
+        return camera._binary_to_image(camera._read_shared_memory(raw_readings))
+
+    async def poll_lidar(self, lidar: Lidar) -> StrDict:
+        """
+        The asyncio version of :func:`.Lidar.poll`.
+
+        Args:
+            lidar: The LiDAR sensor to poll.
+
+        Returns:
+            A dictionary with the ``pointCloud`` and ``colours`` keys.
+        """
+        if lidar.is_using_shared_memory and lidar.is_streaming:
+            raw_readings = lidar._read_shared_memory(None)
+        else:
+            data = dict(
+                type="PollLidar",
+                name=lidar.name,
+                isUsingSharedMemory=lidar.is_using_shared_memory,
+            )
+            raw_readings = (await (await self._send(data)).recv())["data"]
+            if lidar.is_using_shared_memory:
+                raw_readings = lidar._read_shared_memory(raw_readings)
+        return lidar._convert_binary_to_array(raw_readings)
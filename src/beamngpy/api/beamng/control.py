@@ -1,8 +1,12 @@
 from __future__ import annotations
 
-from typing import Dict
+from typing import Any, Dict, Iterable, List
 
+from beamngpy.connection import CommBase, Response
+from beamngpy.logging import BNGDisconnectedError
+from beamngpy.sensors import Camera, Lidar
 from beamngpy.types import StrDict
+from beamngpy.vehicle import Vehicle
 
 from .base import Api
 
@@ -41,6 +45,97 @@ class ControlApi(Api):
             resp.ack("Stepped")
         self._logger.info(f"Advancing the simulation by {count} steps.")
 
+    def step_and_poll(
+        self,
+        count: int,
+        sensors: Iterable[Vehicle | CommBase] = (),
+        controls: Dict[Vehicle, StrDict] | None = None,
+    ) -> List[Any]:
+        """
+        Applies the vehicle controls, advances the simulation the given amount of steps and
+        polls the given sensors, all in a single call meant for lockstep control loops. It
+        replaces the sequence of :func:`.Vehicle.control`, :func:`step`,
+        :func:`.Vehicle.sensors.poll` and :func:`.Camera.poll`/:func:`.Lidar.poll` calls, which
+        all wait for the response of the simulator before sending the next request.
+
+        The controls of all vehicles are sent together and their acknowledgements are awaited
+        before stepping. The step request is then pipelined with the poll requests of the game
+        engine sensors, which the simulator answers right after the steps have been simulated.
+        The vehicle-side sensors are requested from all the vehicles at once as soon as the steps
+        are done. This makes one round-trip for the controls, one for the steps and one for the
+        vehicle sensors, regardless of the number of vehicles and sensors.
+
+        Args:
+            count: The amount of steps to simulate.
+            sensors: The vehicles whose attached sensors should be polled, and the standalone
+                     sensors (e.g. :class:`.Camera` or :class:`.Lidar`) to poll.
+            controls: Optional. The controls to apply before stepping, as a dictionary from the
+                      vehicles to the keyword arguments of :func:`.Vehicle.control`.
+
+        Returns:
+            The readings in the order of ``sensors``. For vehicles, the :class:`.Sensors` object
+            of the vehicle with the updated readings is returned, for the standalone sensors the
+            return value of their ``poll`` function.
+
+        Example:
+
+        .. code-block:: python
+
+            for _ in range(100):
+                vehicle_sensors, images = bng.control.step_and_poll(
+                    10, sensors=[vehicle, camera], controls={vehicle: dict(throttle=0.5)}
+                )
+        """
+        connection = self._beamng.connection
+        if not connection:
+            raise BNGDisconnectedError("The simulator is not connected!")
+        sensors = list(sensors)
+        vehicles = [sensor for sensor in sensors if isinstance(sensor, Vehicle)]
+
+        if controls:
+            with self._beamng.batch(vehicles=controls.keys()):
+                for vehicle, control in controls.items():
+                    vehicle.control(**control)
+
+        # the requests to the game engine are processed after the steps are simulated
+        engine_request, engine_keys, vehicle_requests = (
+            self._beamng.vehicles._encode_sensor_requests(vehicles, ())
+        )
+        engine_response: Response | None = None
+        poll_responses: Dict[int, Response | None] = {}
+        with connection.pipeline():
+            step = self._send(dict(type="Step", count=count, ack=True))
+            if engine_keys:
+                engine_response = self._send(engine_request)
+            for index, sensor in enumerate(sensors):
+                if isinstance(sensor, (Camera, Lidar)):
+                    poll_responses[index] = sensor._send_poll()
+        step.ack("Stepped")
+        self._logger.info(f"Advancing the simulation by {count} steps.")
+
+        # the vehicle connections are independent of the game engine one, so the vehicle
+        # sensors are requested only after the steps are done
+        vehicle_responses = [
+            (vehicle, vehicle._send(request)) for vehicle, request in vehicle_requests
+        ]
+        self._beamng.vehicles._collect_sensor_data(
+            vehicles, engine_response, engine_keys, vehicle_responses
+        )
+
+        readings: List[Any] = []
+        for index, sensor in enumerate(sensors):
+            if isinstance(sensor, Vehicle):
+                readings.append(sensor.sensors)
+            elif isinstance(sensor, Camera):
+                raw_readings = sensor._collect_poll(poll_responses[index])
+                readings.append(sensor._binary_to_image(raw_readings))
+            elif isinstance(sensor, Lidar):
+                raw_readings = sensor._collect_poll(poll_responses[index])
+                readings.append(sensor._convert_binary_to_array(raw_readings))
+            else:
+                readings.append(sensor.poll())  # type: ignore
+        return readings
+
     def pause(self) -> None:
         """
         Sends a pause request to BeamNG.*, blocking until the simulation is
@@ -255,9 +255,11 @@ class ScenarioApi(Api):
         self._send(data).ack("ScenarioRestarted")
 
         self._beamng._scenario._load_existing_vehicles()
-        for vehicle in self._beamng._scenario.vehicles.values():
-            if vehicle.vid in vehicles_to_reconnect and not vehicle.is_connected():
-                vehicle.connect(self._beamng)
+        self._beamng.vehicles.connect_all(
+            vehicle
+            for vehicle in self._beamng._scenario.vehicles.values()
+            if vehicle.vid in vehicles_to_reconnect
+        )
 
     def stop(self) -> None:
         """
@@ -1,7 +1,10 @@
 from __future__ import annotations
 
-from typing import Dict, Iterable, List
+from concurrent.futures import ThreadPoolExecutor
+from time import perf_counter
+from typing import Dict, Iterable, List, Tuple
 
+from beamngpy.connection import Response
 from beamngpy.misc.colors import coerce_color, rgba_to_str
 from beamngpy.types import Float3, Quat, StrDict
 from beamngpy.vehicle import Vehicle
@@ -17,14 +20,69 @@ class VehiclesApi(Api):
         beamng: An instance of the simulator.
     """
 
-    def start_connection(
+    def _send_start_connection(
         self, vehicle: Vehicle, extensions: List[str] | None
-    ) -> StrDict:
+    ) -> Response:
         connection_msg: StrDict = {"type": "StartVehicleConnection"}
         connection_msg["vid"] = vehicle.vid
         if extensions is not None:
             connection_msg["exts"] = extensions
-        return self._send(connection_msg).recv("StartVehicleConnection")
+        return self._send(connection_msg)
+
+    def start_connection(
+        self, vehicle: Vehicle, extensions: List[str] | None
+    ) -> StrDict:
+        return self._send_start_connection(vehicle, extensions).recv(
+            "StartVehicleConnection"
+        )
+
+    def connect_all(
+        self, vehicles: Iterable[Vehicle], max_workers: int | None = None
+    ) -> None:
+        """
+        Connects all the given vehicles to BeamNGpy at once. This is much faster than connecting
+        the vehicles one by one using :func:`.Vehicle.connect`: the ports of all the vehicles are
+        requested from the simulator in a single batch and the vehicle sockets are then connected
+        concurrently. Vehicles which are already connected are skipped.
+
+        Args:
+            vehicles: The vehicles to connect.
+            max_workers: The maximum number of vehicles being connected at the same time.
+                         If None, then defaults to the number of vehicles, up to 32.
+        """
+        start_time = perf_counter()
+        vehicles = [vehicle for vehicle in vehicles if not vehicle.is_connected()]
+        if not vehicles:
+            return
+
+        # Request the ports of all the vehicles which do not have one yet.
+        needs_port = [
+            vehicle for vehicle in vehicles if vehicle._create_connection(self._beamng)
+        ]
+        with self._beamng.connection.pipeline():
+            responses = [
+                self._send_start_connection(vehicle, vehicle.extensions)
+                for vehicle in needs_port
+            ]
+        for vehicle, resp in zip(needs_port, responses):
+            vehicle._set_connection_port(resp.recv("StartVehicleConnection"))
+
+        # Connect the vehicle sockets concurrently, the sensors are connected afterwards.
+        if max_workers is None:
+            max_workers = min(32, len(vehicles))
+        with ThreadPoolExecutor(max_workers=max_workers) as executor:
+            futures = [
+                executor.submit(vehicle.connection.connect_to_vehicle, vehicle)
+                for vehicle in vehicles
+            ]
+            for future in futures:
+                future.result()
+        for vehicle in vehicles:
+            vehicle._connect_sensors(self._beamng)
+
+        self._logger.info(
+            f"Connected {len(vehicles)} vehicles in {perf_counter() - start_time:.2f} s."
+        )
 
     def spawn(
         self,
@@ -222,6 +280,83 @@ class VehiclesApi(Api):
         resp = self._send(data).recv("ScenarioUpdate")
         return resp["vehicles"]
 
+    def poll_sensors(self, vehicles: Iterable[Vehicle], *sensor_names: str) -> None:
+        """
+        Updates the sensor readings of multiple vehicles at once, like calling :func:`.Sensors.poll`
+        for each of them, but in about one round-trip to the simulator: the engine-side requests of
+        all the vehicles are merged into a single request, and the requests to all the vehicles are
+        sent before waiting for any of the responses.
+
+        Args:
+            vehicles: The vehicles whose sensors are polled. They have to be connected.
+            sensor_names: Names of sensors to poll. If none are provided, then all the sensors
+                          attached to each vehicle are polled. Sensors which are not attached
+                          to a vehicle are skipped for that vehicle.
+        """
+        vehicles = list(vehicles)
+        engine_request, engine_keys, vehicle_requests = self._encode_sensor_requests(
+            vehicles, sensor_names
+        )
+        vehicle_responses = [
+            (vehicle, vehicle._send(request)) for vehicle, request in vehicle_requests
+        ]
+        engine_response = self._send(engine_request) if engine_keys else None
+        self._collect_sensor_data(
+            vehicles, engine_response, engine_keys, vehicle_responses
+        )
+
+    @staticmethod
+    def _encode_sensor_requests(
+        vehicles: List[Vehicle], sensor_names: Iterable[str]
+    ) -> Tuple[StrDict, Dict[str, Tuple[Vehicle, str]], List[Tuple[Vehicle, StrDict]]]:
+        """
+        Encodes the sensor requests of multiple vehicles, see :func:`poll_sensors`.
+
+        Returns:
+            A tuple of the merged engine request, the mapping of its keys to the vehicles and
+            sensor names, and the list of the vehicle requests.
+        """
+        engine_sensors: StrDict = {}
+        engine_keys: Dict[str, Tuple[Vehicle, str]] = {}
+        vehicle_requests: List[Tuple[Vehicle, StrDict]] = []
+        for index, vehicle in enumerate(vehicles):
+            names = [
+                name
+                for name in (sensor_names or vehicle.sensors.data.keys())
+                if name in vehicle.sensors.data
+            ]
+            engine_reqs, vehicle_reqs = vehicle.sensors._encode_requests(names)
+            # the sensor names are only unique per vehicle, so the merged keys are prefixed
+            for name, request in engine_reqs["sensors"].items():
+                key = f"{index}:{name}"
+                engine_sensors[key] = request
+                engine_keys[key] = (vehicle, name)
+            if vehicle_reqs["sensors"]:
+                vehicle_requests.append((vehicle, vehicle_reqs))
+        engine_request = dict(type="SensorRequest", sensors=engine_sensors)
+        return engine_request, engine_keys, vehicle_requests
+
+    @staticmethod
+    def _collect_sensor_data(
+        vehicles: List[Vehicle],
+        engine_response: Response | None,
+        engine_keys: Dict[str, Tuple[Vehicle, str]],
+        vehicle_responses: List[Tuple[Vehicle, Response]],
+    ) -> None:
+        """
+        Waits for the responses to the requests encoded by :func:`_encode_sensor_requests`
+        and updates the sensor readings of the vehicles.
+        """
+        sensor_data: Dict[str, StrDict] = {vehicle.vid: {} for vehicle in vehicles}
+        for vehicle, response in vehicle_responses:
+            sensor_data[vehicle.vid].update(response.recv("SensorData")["data"])
+        if engine_response:
+            for key, data in engine_response.recv("SensorData")["data"].items():
+                vehicle, name = engine_keys[key]
+                sensor_data[vehicle.vid][name] = data
+        for vehicle in vehicles:
+            vehicle.sensors._update_readings(sensor_data[vehicle.vid])
+
     def get_current_info(self, include_config: bool = True) -> Dict[str, StrDict]:
         """
         Queries the currently active vehicles in the simulator.
@@ -1 +1,2 @@
+from .async_beamng import AsyncBeamNGpy
 from .beamng import BeamNGpy
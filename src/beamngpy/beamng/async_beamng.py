@@ -0,0 +1,96 @@
+from __future__ import annotations
+
+import logging
+from typing import Any
+
+from beamngpy.api.beamng.asynchronous import (
+    AsyncControlApi,
+    AsyncSensorsApi,
+    AsyncVehiclesApi,
+)
+from beamngpy.connection.async_connection import AsyncConnection, AsyncResponse
+from beamngpy.logging import LOGGER_ID, BNGError
+from beamngpy.types import StrDict
+
+
+class AsyncBeamNGpy:
+    """
+    An asyncio client of the BeamNG simulator. It talks the same protocol as :class:`.BeamNGpy`,
+    but all the communication is done using coroutines, so that many requests can be in flight
+    at the same time without blocking the thread.
+
+    This class only connects to an already running simulator, it does not launch one. It is meant to
+    be used alongside a :class:`.BeamNGpy` instance, which is used to launch the simulator, set up the
+    scenario and create the sensors, while the time-critical calls (stepping, polling the sensors) are
+    done with this client.
+
+    Args:
+        host: The host to connect to.
+        port: The port to connect to.
+
+    Attributes
+    ----------
+        control: AsyncControlApi
+            The API module to control the flow of the simulation.
+            See :class:`.AsyncControlApi` for details.
+        vehicles: AsyncVehiclesApi
+            The API module to query and connect to the vehicles.
+            See :class:`.AsyncVehiclesApi` for details.
+        sensors: AsyncSensorsApi
+            The API module to poll the sensors.
+            See :class:`.AsyncSensorsApi` for details.
+    """
+
+    def __init__(self, host: str, port: int):
+        self.logger = logging.getLogger(f"{LOGGER_ID}.AsyncBeamNGpy")
+        self.logger.setLevel(logging.DEBUG)
+        self.host = host
+        self.port = port
+        self.connection: AsyncConnection | None = None
+
+        self.control = AsyncControlApi(self)
+        self.vehicles = AsyncVehiclesApi(self)
+        self.sensors = AsyncSensorsApi(self)
+
+    async def open(
+        self, tries: int | None = None, timeout: float | None = None
+    ) -> AsyncBeamNGpy:
+        """
+        Connects to the running simulator on the configured host and port.
+
+        Args:
+            tries: Optional. The maximum number of connection attempts.
+            timeout: The time budget of the connection attempts in seconds. Defaults to
+                     :attr:`.MessageCodec.RETRY_TIMEOUT`.
+        """
+        self.connection = AsyncConnection(self.host, self.port)
+        if not await self.connection.connect(tries=tries, timeout=timeout):
+            self.connection = None
+            raise BNGError(f"Cannot connect to BeamNG.tech at ({self.host}, {self.port}).")
+        self.logger.info("AsyncBeamNGpy successfully connected to BeamNG.")
+        return self
+
+    async def disconnect(self) -> None:
+        """
+        Disconnects from the simulator and from all the vehicles connected by this instance.
+        """
+        await self.vehicles.disconnect_all()
+        if self.connection:
+            await self.connection.disconnect()
+            self.connection = None
+
+    async def _send(self, data: StrDict) -> AsyncResponse:
+        if not self.connection:
+            raise BNGError("Not connected to the simulator!")
+        return await self.connection.send(data)
+
+    async def _message(self, req: str, **kwargs: Any) -> Any:
+        if not self.connection:
+            raise BNGError("Not connected to the simulator!")
+        return await self.connection.message(req, **kwargs)
+
+    async def __aenter__(self):
+        return await self.open()
+
+    async def __aexit__(self, exc_type, exc_val, exc_tb):
+        await self.disconnect()
@@ -5,9 +5,10 @@ import os
 import platform
 import signal
 import subprocess
+from contextlib import contextmanager
 from pathlib import Path
-from time import sleep
-from typing import TYPE_CHECKING, Any, List
+from time import perf_counter, sleep
+from typing import TYPE_CHECKING, Any, Iterable, Iterator, List
 
 from beamngpy.api.beamng import (
     CameraApi,
@@ -30,6 +31,7 @@ from beamngpy.types import StrDict
 if TYPE_CHECKING:
     from beamngpy.connection import Response
     from beamngpy.scenario import Scenario
+    from beamngpy.vehicle import Vehicle
 
 
 module_logger = logging.getLogger(f"{LOGGER_ID}.beamng")
@@ -70,6 +72,9 @@ class BeamNGpy:
 
                This option is applicable only when the process is launched by this instance
                of BeamNGpy, as it sets a launch argument of the process. Defaults to False.
+        receiver_thread: If True, then the connections to the simulator and to the vehicles use a dedicated
+                         thread to receive the responses, which allows using a single instance of BeamNGpy
+                         from multiple threads at once. See :class:`.Connection` for details. Defaults to False.
 
     Attributes
     ----------
@@ -117,6 +122,7 @@ class BeamNGpy:
         user: str | None = None,
         quit_on_close: bool = True,
         debug: bool | None = None,
+        receiver_thread: bool = False,
     ):
         self.logger = logging.getLogger(f"{LOGGER_ID}.BeamNGpy")
         self.logger.setLevel(logging.DEBUG)
@@ -129,6 +135,7 @@ class BeamNGpy:
         self.process = None
         self.quit_on_close = quit_on_close
         self._debug = debug
+        self.receiver_thread = receiver_thread
         self.connection: Connection | None = None
         self._scenario: Scenario | None = None
         self._host_os: str | None = None
@@ -155,6 +162,7 @@ class BeamNGpy:
         launch: bool = True,
         debug: bool | None = None,
         listen_ip: str = "127.0.0.1",
+        launch_timeout: float = 300.0,
         **opts: str,
     ) -> BeamNGpy:
         """
@@ -177,8 +185,15 @@ class BeamNGpy:
                 of BeamNGpy, as it sets a launch argument of the process. Defaults to False.
             listen_ip: The IP address that the BeamNG process will be listening on. Only relevant when ``launch`` is True.
                      Set to ``*`` if you want BeamNG to listen on ALL network interfaces.
+            launch_timeout: The maximum time in seconds to wait for a launched process to become ready.
+                            Only relevant when ``launch`` is True. Defaults to 300 seconds.
+
+        Raises:
+            BNGError: If the launched process exits or does not become ready in time.
         """
-        self.connection = Connection(self.host, self.port)
+        self.connection = Connection(
+            self.host, self.port, receiver_thread=self.receiver_thread
+        )
 
         # try to connect to existing instance
         connected = self.connection.connect_to_beamng(tries=1, log_tries=False)
@@ -202,8 +217,7 @@ class BeamNGpy:
             arg_list.extend(("-tcom-listen-ip", listen_ip))
 
             self._start_beamng(extensions, *arg_list, **opts)
-            sleep(10)
-            self.connection.connect_to_beamng()
+            self._wait_for_launch(launch_timeout)
         self._load_system_info()
         return self
 
@@ -235,6 +249,61 @@ class BeamNGpy:
             self._scenario = None
         self._kill_beamng()
 
+    @contextmanager
+    def batch(self, vehicles: Iterable[Vehicle] | None = None) -> Iterator[None]:
+        """
+        A context manager which pipelines the requests sent to the simulator and to the given vehicles.
+        The requests are queued and sent together when the context exits, and only then the
+        acknowledgements of all of them are awaited, so that issuing many commands costs about
+        a single round-trip instead of one round-trip per command. See :func:`.Connection.pipeline`
+        for the details.
+
+        Args:
+            vehicles: The vehicles whose requests should be pipelined. If None, then all connected
+                      vehicles of the currently loaded scenario are used.
+
+        Example:
+
+        .. code-block:: python
+
+            with bng.batch():
+                for vehicle in vehicles:
+                    vehicle.set_lights(headlights=1)
+                    vehicle.control(throttle=0.5)
+                    vehicle.ai.set_speed(10)
+        """
+        if vehicles is None:
+            vehicles = self._scenario.vehicles.values() if self._scenario else []
+        connections = [self.connection] if self.connection else []
+        connections.extend(
+            vehicle.connection for vehicle in vehicles if vehicle.is_connected()
+        )
+
+        for connection in connections:
+            connection._begin_pipeline()
+        failed = False
+        try:
+            yield
+        except BaseException:
+            failed = True
+            raise
+        finally:
+            error: Exception | None = None
+            # send the queued requests over all the connections first and only then wait for the responses
+            for connection in connections:
+                if connection._pipeline.depth == 1:
+                    try:
+                        connection.flush()
+                    except Exception as err:
+                        error = error or err
+            for connection in connections:
+                try:
+                    connection._end_pipeline(raise_errors=not failed)
+                except Exception as err:
+                    error = error or err
+            if error is not None and not failed:
+                raise error
+
     def _load_system_info(self) -> None:
         info = self.system.get_info()
         paths = self.system.get_environment_paths()
@@ -331,6 +400,7 @@ class BeamNGpy:
         self.get_part_annotations = self.vehicles.get_part_annotations
         self.get_current_vehicles_info = self.vehicles.get_current_info
         self.get_current_vehicles = self.vehicles.get_current
+        self.poll_sensors = self.vehicles.poll_sensors
 
         self.platoon = PlatoonApi(self)
 
@@ -471,6 +541,34 @@ class BeamNGpy:
             self.process = subprocess.Popen(call, stdin=subprocess.PIPE)
         self.logger.info("Started BeamNG.")
 
+    def _wait_for_launch(self, timeout: float) -> None:
+        """
+        Waits for the launched BeamNG.* process to become ready by probing its port with
+        exponentially increasing delays, until the connection succeeds, the process exits
+        or the timeout elapses.
+
+        Args:
+            timeout: The maximum time to wait in seconds.
+        """
+        assert self.connection
+        start_time = perf_counter()
+        delay = Connection.RETRY_DELAY_MIN
+        while not self.connection.connect_to_beamng(tries=1, log_tries=False):
+            if self.process is not None and self.process.poll() is not None:
+                raise BNGError(
+                    f"The BeamNG process exited with code {self.process.returncode} before it was ready."
+                )
+            remaining = timeout - (perf_counter() - start_time)
+            if remaining <= 0:
+                raise BNGError(
+                    f"BeamNG did not become ready at ({self.host}, {self.port}) in {timeout:g} seconds."
+                )
+            sleep(min(delay, remaining))
+            delay = min(2 * delay, Connection.RETRY_DELAY_MAX)
+        self.logger.info(
+            f"BeamNGpy successfully connected to BeamNG, the launch took {perf_counter() - start_time:.2f} s."
+        )
+
     def __enter__(self):
         self.open()
         return self
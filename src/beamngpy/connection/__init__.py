@@ -1,4 +1,15 @@
+from .async_connection import AsyncConnection, AsyncResponse
+from .codec import MessageCodec
 from .comm_base import CommBase
 from .connection import Connection, Response
+from .stats import ConnectionStats
 
-__all__ = ["Connection", "Response", "CommBase"]
+__all__ = [
+    "AsyncConnection",
+    "AsyncResponse",
+    "Connection",
+    "ConnectionStats",
+    "MessageCodec",
+    "Response",
+    "CommBase",
+]
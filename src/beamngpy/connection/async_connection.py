@@ -0,0 +1,203 @@
+from __future__ import annotations
+
+import asyncio
+from struct import pack, unpack
+from typing import Any, Dict
+
+from beamngpy.logging import BNGDisconnectedError, BNGError, BNGValueError
+from beamngpy.types import StrDict
+
+from .codec import MessageCodec
+from .connection import Response
+from .prefixed_length_socket import PrefixedLengthSocket
+
+
+class AsyncConnection(MessageCodec):
+    """
+    The asyncio counterpart of the :class:`.Connection` class. It uses the same length-prefixed
+    Messagepack protocol and shares the encoding of the messages with it (see :class:`.MessageCodec`),
+    but the sending and receiving functions are coroutines. Responses are
+    read by a background task and dispatched to the awaiting requests by their ID, so any number
+    of requests can be in flight at the same time.
+
+    Args:
+        host: The host to connect to.
+        port: The port to connect to.
+    """
+
+    def __init__(self, host: str, port: int | None = None):
+        super().__init__(host, port)
+        self._reader: asyncio.StreamReader | None = None
+        self._writer: asyncio.StreamWriter | None = None
+        self._reader_task: asyncio.Task | None = None
+        self._pending: Dict[int, asyncio.Future] = {}
+
+    async def connect(
+        self,
+        tries: int | None = None,
+        log_tries: bool = True,
+        timeout: float | None = None,
+    ) -> bool:
+        """
+        Opens the connection to the configured host and port and exchanges the protocol version.
+        Upon failure, connections are re-attempted until the time budget runs out, see :func:`.Connection.connect_to_beamng`.
+
+        Args:
+            tries: Optional. The maximum number of connection attempts.
+            log_tries: True if the connection logs should be propagated to the caller. Defaults to True.
+            timeout: The time budget of the connection attempts in seconds. Defaults to :attr:`RETRY_TIMEOUT`.
+
+        Returns:
+            True if the connection was successful, False otherwise.
+        """
+        if not self.port:
+            raise BNGError("The simulator port is not set!")
+
+        if log_tries:
+            self.logger.info(f"Connecting to BeamNG.tech at: ({self.host}, {self.port})")
+        delays = self._retry_delays(tries, timeout)
+        while True:
+            try:
+                self._reader, self._writer = await asyncio.open_connection(
+                    self.host, self.port
+                )
+                break
+            except (ConnectionRefusedError, ConnectionAbortedError) as err:
+                delay = next(delays, None)
+                if log_tries:
+                    self.logger.error(
+                        "Error connecting to BeamNG.tech."
+                        + ("" if delay is None else f" Retrying in {delay:.2f} s.")
+                    )
+                    self.logger.exception(err)
+                if delay is None:
+                    break
+                await asyncio.sleep(delay)
+        if not self._writer:
+            return False
+
+        self._reader_task = asyncio.get_running_loop().create_task(self._read_loop())
+        await self.hello()
+        return True
+
+    async def disconnect(self) -> None:
+        """
+        Closes the connection and cancels all the pending requests.
+        """
+        if self._reader_task:
+            self._reader_task.cancel()
+            try:
+                await self._reader_task
+            except asyncio.CancelledError:
+                pass
+            self._reader_task = None
+        if self._writer:
+            self._writer.close()
+            try:
+                await self._writer.wait_closed()
+            except ConnectionError:
+                pass
+            self._writer = None
+            self._reader = None
+        self._fail_pending(BNGDisconnectedError("The connection was closed."))
+
+    def is_connected(self) -> bool:
+        return self._writer is not None
+
+    def _fail_pending(self, err: Exception) -> None:
+        for future in self._pending.values():
+            if not future.done():
+                future.set_exception(err)
+        self._pending.clear()
+
+    async def _read_loop(self) -> None:
+        assert self._reader
+        header_bytes = PrefixedLengthSocket.HEADER_BYTES
+        try:
+            while True:
+                length = unpack("!I", await self._reader.readexactly(header_bytes))[0]
+                _id, message = self._decode_message(
+                    await self._reader.readexactly(length)
+                )
+                future = self._pending.pop(_id, None)
+                if future is None:
+                    self.received_messages[_id] = message
+                elif not future.done():
+                    future.set_result(message)
+        except asyncio.IncompleteReadError:
+            self._fail_pending(
+                BNGDisconnectedError("The simulator ended the connection.")
+            )
+        except Exception as err:
+            self._fail_pending(err)
+
+    async def send(self, data: StrDict) -> AsyncResponse:
+        """
+        Encodes the given data using Messagepack and sends the resulting bytes over the connection.
+        NOTE: messages are prefixed by the message length value.
+
+        Args:
+            data: The data to encode and send
+
+        Returns:
+            A handle which can be awaited for the response.
+        """
+        if not self._writer:
+            raise BNGError("Cannot send, not connected to the simulator.")
+        req_id, packed_data = self._pack_data(data)
+        self._writer.write(pack("!I", len(packed_data)) + packed_data)
+        await self._writer.drain()
+        return AsyncResponse(self, req_id)
+
+    async def recv(self, req_id: int) -> StrDict | BNGError | BNGValueError:
+        if req_id in self.received_messages:
+            return self.received_messages.pop(req_id)
+        if not self._reader_task or self._reader_task.done():
+            raise BNGError("Cannot receive, not connected to the simulator.")
+        future = asyncio.get_running_loop().create_future()
+        self._pending[req_id] = future
+        try:
+            return await future
+        finally:
+            self._pending.pop(req_id, None)
+
+    async def message(self, req: str, **kwargs: Any) -> Any:
+        """
+        Generic message function which is parameterized with the type of message to send and all parameters that are to be embedded in the request.
+        Responses are expected to have the same type as the request. If this is not the case, an error is raised.
+
+        Args:
+            req (str): The request type.
+
+        Returns:
+            The response received from the simulator as a dictionary.
+        """
+        kwargs["type"] = req
+        resp = await (await self.send(kwargs)).recv(type=req)
+        if "result" in resp:
+            return resp["result"]
+        return None
+
+    async def hello(self) -> None:
+        """
+        First function called after connections. Exchanges the protocol version with the connected simulator and raises an error upon mismatch.
+        """
+        data = dict(type="Hello")
+        data["protocolVersion"] = self.PROTOCOL_VERSION
+        resp = await (await self.send(data)).recv("Hello")
+        self._check_protocol_version(resp)
+        self.logger.info("Successfully connected to BeamNG.tech.")
+
+
+class AsyncResponse:
+    def __init__(self, connection: AsyncConnection, req_id: int):
+        self.connection = connection
+        self.req_id = req_id
+
+    async def recv(self, type: str | None = None) -> StrDict:
+        message = await self.connection.recv(self.req_id)
+        return Response._check_message(message, type)
+
+    async def ack(self, ack_type: str) -> None:
+        message = await self.recv()
+        Response._check_ack(message, ack_type)
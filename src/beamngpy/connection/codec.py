@@ -0,0 +1,248 @@
+from __future__ import annotations
+
+import logging
+import threading
+from time import perf_counter
+from typing import Collection, Dict, Iterator, Tuple, cast
+
+import msgpack
+
+from beamngpy.logging import LOGGER_ID, BNGError, BNGValueError
+from beamngpy.types import StrDict
+
+
+class MessageCodec:
+    """
+    The transport-independent part of the communication with the simulator, shared by the
+    :class:`.Connection` and :class:`.AsyncConnection` classes. It assigns the request IDs, encodes
+    the requests using Messagepack, decodes the responses according to :attr:`BINARY_RESPONSES`,
+    and checks the protocol version. It does not own any socket, sending and receiving the encoded
+    messages is left to the derived classes.
+
+    Args:
+        host: The host to connect to.
+        port: The port to connect to.
+    """
+
+    PROTOCOL_VERSION = "v1.23"
+    # The bounds of the exponential backoff between the connection attempts, in seconds.
+    RETRY_DELAY_MIN = 0.05
+    RETRY_DELAY_MAX = 2.0
+    # The default time budget of the connection attempts, in seconds. It matches the former
+    # default of 25 attempts 5 seconds apart, so that slowly spawning vehicles still connect.
+    RETRY_TIMEOUT = 120.0
+
+    # Decoding policies of the responses, by the type of the request. The strings in the responses
+    # are converted to utf-8 by default, which is a recursive walk over the whole response. For the
+    # request types listed here, the walk is skipped either completely (``None``), or for the values
+    # of the listed keys, and the binary data is left as ``bytes``. See :func:`register_binary_response`.
+    BINARY_RESPONSES: Dict[str, Collection[str] | None] = {
+        "PollCamera": None,
+        "CollectAdHocPollRequestCamera": None,
+        "GetFullCameraRequest": None,
+        "PollLidar": None,
+        "CollectAdHocPollRequestLidar": None,
+        "PollRadar": None,
+        "CollectAdHocPollRequestRadar": None,
+        "GetBeamData": None,
+        "GetRoadNetwork": frozenset(("edges",)),
+    }
+
+    def __init__(self, host: str, port: int | None = None):
+        self.host = host
+        self.port = port
+        self.logger = logging.getLogger(f"{LOGGER_ID}.BeamNGpy")
+        self.comm_logger = logging.getLogger(f"{LOGGER_ID}.communication")
+        self.req_id = 0
+        self.received_messages: Dict[int, StrDict | BNGError | BNGValueError] = {}
+        self._req_id_lock = threading.Lock()
+        # Decoding policies of the responses which are still expected, by the request ID.
+        self._binary_fields: Dict[int, Collection[str] | None] = {}
+
+    @classmethod
+    def _retry_delays(cls, tries: int | None, timeout: float | None) -> Iterator[float]:
+        """
+        Yields the delays before the repeated connection attempts, increasing exponentially from
+        :attr:`RETRY_DELAY_MIN` to :attr:`RETRY_DELAY_MAX`, until ``tries`` attempts were made or
+        ``timeout`` seconds passed since the first one.
+
+        Args:
+            tries: The maximum number of attempts, including the first one. If None, then only the
+                   timeout limits the attempts.
+            timeout: The time budget of the attempts in seconds. If None, :attr:`RETRY_TIMEOUT` is used.
+        """
+        deadline = perf_counter() + (cls.RETRY_TIMEOUT if timeout is None else timeout)
+        delay = cls.RETRY_DELAY_MIN
+        attempts = 1
+        while tries is None or attempts < tries:
+            remaining = deadline - perf_counter()
+            if remaining <= 0:
+                return
+            yield min(delay, remaining)
+            delay = min(2 * delay, cls.RETRY_DELAY_MAX)
+            attempts += 1
+
+    @staticmethod
+    def _textify_string(data: bytes) -> str | bytes:
+        """
+        Attempts to convert binary data to utf-8. If we can do this, we do it. If not, we leave as binary data.
+        Args:
+            data: The candidate data.
+        Returns:
+            The conversion, if it was possible to convert. Otherwise the untouched binary data.
+        """
+        try:
+            return data.decode("utf-8")
+        except:
+            return data
+
+    @staticmethod
+    def _string_cleanup_rec(
+        data: dict | list | bytes, binary_fields: Collection[str] = ()
+    ) -> dict | list | bytes | str:
+        """
+        Recursively iterates through data, and attempts to convert all binary data to utf-8.
+        If we can do this with any elements of the data, we do it. If not, we leave them as binary data.
+        Args:
+            data: The data.
+            binary_fields: The keys of the dictionaries whose values are left untouched.
+        Returns:
+            The (possibly) converted data.
+        """
+        if isinstance(data, list):
+            for i, val in enumerate(data):
+                if isinstance(val, bytes):
+                    data[i] = MessageCodec._textify_string(val)
+                elif isinstance(val, (list, dict)):
+                    MessageCodec._string_cleanup_rec(val, binary_fields)
+        elif isinstance(data, dict):
+            for key, val in data.items():
+                if key in binary_fields:
+                    continue
+                if isinstance(val, bytes):
+                    data[key] = MessageCodec._textify_string(val)
+                elif isinstance(val, (list, dict)):
+                    MessageCodec._string_cleanup_rec(val, binary_fields)
+        elif isinstance(data, bytes):
+            return MessageCodec._textify_string(data)
+        return data
+
+    @staticmethod
+    def _string_cleanup(data: StrDict, binary_fields: Collection[str] = ()) -> StrDict:
+        for key, val in data.items():
+            if key in binary_fields:
+                continue
+            if isinstance(val, bytes):
+                data[key] = MessageCodec._textify_string(val)
+            elif isinstance(val, (list, dict)):
+                MessageCodec._string_cleanup_rec(val, binary_fields)
+        return data
+
+    @classmethod
+    def register_binary_response(
+        cls, req_type: str, binary_fields: Collection[str] | None = None
+    ) -> None:
+        """
+        Sets the decoding policy of the responses to the given request type, so that their binary data
+        is kept as ``bytes`` instead of being converted to utf-8 strings. This also skips the costly
+        recursive conversion of large responses.
+
+        Args:
+            req_type: The type of the request.
+            binary_fields: The keys of the dictionaries in the response whose values are kept
+                           as they are. If None, then the whole response is kept as it is.
+        """
+        cls.BINARY_RESPONSES[req_type] = (
+            None if binary_fields is None else frozenset(binary_fields)
+        )
+
+    @classmethod
+    def unregister_binary_response(cls, req_type: str) -> None:
+        """
+        Restores the default decoding policy of the responses to the given request type, converting
+        all of their binary data to utf-8 strings where possible.
+
+        Args:
+            req_type: The type of the request.
+        """
+        cls.BINARY_RESPONSES.pop(req_type, None)
+
+    def _assign_request_id(self) -> int:
+        with self._req_id_lock:
+            req_id = self.req_id
+            self.req_id += 1
+        return req_id
+
+    def _pack_data(self, data: StrDict) -> Tuple[int, bytes]:
+        req_id = self._assign_request_id()
+        data["_id"] = req_id
+        req_type = data.get("type")
+        if req_type in self.BINARY_RESPONSES:
+            self._binary_fields[req_id] = self.BINARY_RESPONSES[req_type]
+        self.comm_logger.debug("Sending %s.", data)
+        packed = cast(
+            bytes, msgpack.packb(data, use_bin_type=True)
+        )  # the cast is for type checker
+        return req_id, packed
+
+    def _unpack_data(self, data: bytes | memoryview) -> StrDict:
+        unpacked: StrDict = msgpack.unpackb(data, raw=False, strict_map_key=False)
+        self.comm_logger.debug("Received %s.", unpacked)
+        return unpacked
+
+    def _decode_message(
+        self, data: bytes | memoryview
+    ) -> Tuple[int, StrDict | BNGError | BNGValueError]:
+        """
+        Unpacks a message received from the simulator and processes it using :func:`_process_message`.
+
+        Args:
+            data: The message without the length prefix.
+        """
+        return self._process_message(self._unpack_data(data))
+
+    def _process_message(
+        self, message: StrDict
+    ) -> Tuple[int, StrDict | BNGError | BNGValueError]:
+        """
+        Extracts the request ID from an unpacked message, converts its binary strings to utf-8
+        according to the decoding policy of the request (see :attr:`BINARY_RESPONSES`) and converts
+        error responses to the corresponding exceptions.
+
+        Args:
+            message: The unpacked message received from the simulator.
+
+        Returns:
+            A tuple of the request ID the message is responding to and the message itself
+            (or the exception to be raised for it).
+        """
+        if not "_id" in message:
+            raise BNGError(
+                "Invalid message received! The version of BeamNG.tech running is incompatible with this version of BeamNGpy."
+            )
+        _id = int(message["_id"])
+        del message["_id"]
+
+        if _id in self._binary_fields:
+            binary_fields = self._binary_fields.pop(_id)
+            if binary_fields is not None:
+                self._string_cleanup(message, binary_fields)
+        else:
+            # Converts all non-binary strings in the data into utf-8 format.
+            self._string_cleanup(message)
+
+        if "bngError" in message:
+            return _id, BNGError(self._string_cleanup_rec(message["bngError"]))
+        if "bngValueError" in message:
+            return _id, BNGValueError(self._string_cleanup_rec(message["bngValueError"]))
+        return _id, message
+
+    @classmethod
+    def _check_protocol_version(cls, resp: StrDict) -> None:
+        if resp["protocolVersion"] != cls.PROTOCOL_VERSION:
+            msg = (
+                "Mismatching BeamNGpy protocol versions. Please ensure both BeamNG.tech and BeamNGpy are using the desired versions.\n"
+                f"BeamNGpy's is: {cls.PROTOCOL_VERSION}\n"
+                f'BeamNG.tech\'s is: { resp["protocolVersion"] }'
+            )
+            raise BNGError(msg)
@@ -7,7 +7,7 @@ from beamngpy.types import Any, StrDict
 
 if TYPE_CHECKING:
     from beamngpy.beamng import BeamNGpy
-    from beamngpy.connection import Connection
+    from beamngpy.connection import Connection, Response
     from beamngpy.vehicle import Vehicle
 
 
@@ -46,6 +46,23 @@ class CommBase:
         self.bng = bng
         self.vehicle = vehicle
 
+    def send_ge(self, type: str, **kwargs: Any) -> Response:
+        """
+        Sends a request to the GE Lua with the provided type and data without waiting
+        for the answer. This allows sending multiple requests before waiting for
+        any of the responses.
+
+        Args:
+            type: Type of the request to send.
+            kwargs: The other data being sent.
+
+        Returns:
+            The response object, to be used to receive the answer of the simulator.
+        """
+        if not self.bng.connection:
+            raise BNGDisconnectedError("The simulator is not connected!")
+        return self.bng.connection.send(dict(type=type, **kwargs))
+
     def send_recv_ge(self, type: str, **kwargs: Any) -> StrDict:
         """
         Sends a request to the GE Lua with the provided type and data, receives the
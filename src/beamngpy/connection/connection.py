@@ -1,129 +1,135 @@
 from __future__ import annotations
 
-import logging
 import socket
-from time import sleep
-from typing import TYPE_CHECKING, Any, Dict, Tuple, cast
+import threading
+from concurrent.futures import Future
+from contextlib import contextmanager
+from time import perf_counter, sleep
+from typing import TYPE_CHECKING, Any, Dict, Iterator, List, Tuple
 
-import msgpack
-
-from beamngpy.logging import LOGGER_ID, BNGError, BNGValueError
+from beamngpy.logging import BNGDisconnectedError, BNGError, BNGValueError
 from beamngpy.types import StrDict
 
+from .codec import MessageCodec
 from .prefixed_length_socket import PrefixedLengthSocket
+from .stats import ConnectionStats
 
 if TYPE_CHECKING:
     from beamngpy.vehicle import Vehicle
 
 
-class Connection:
+class _PipelineState(threading.local):
+    """
+    The pipelining state of a connection, see :func:`Connection.pipeline`. It is kept per thread,
+    so that the requests of other threads sharing the connection are not queued into the pipeline.
+    """
+
+    def __init__(self):
+        self.depth = 0
+        self.queue: List[bytes] = []
+        self.deferred_acks: List[Tuple[Response, str]] = []
+
+
+class Connection(MessageCodec):
     """
     The class for handling socket communication between BeamNGpy and the simulator, including establishing connections to both the simulator and to its
     vehicles individually, and for sending and recieving data across these sockets.
 
     Instantiates an instance of the Connection class, creating an unconnected socket ready to be connected when required.
+    The encoding and decoding of the messages is implemented by :class:`.MessageCodec`.
 
     Args:
         host: The host to connect to.
         port: The port to connect to.
+        receiver_thread: If True, then the responses are read from the socket by a dedicated thread and
+                         dispatched to the threads waiting for them. This allows multiple threads to share
+                         a single connection efficiently. Defaults to False, in which case the responses are
+                         read by the thread waiting for them.
     """
 
-    PROTOCOL_VERSION = "v1.23"
+    def __init__(
+        self, host: str, port: int | None = None, receiver_thread: bool = False
+    ):
+        super().__init__(host, port)
+        # The socket related to this connection instance. This is set upon connecting.
+        self.skt: PrefixedLengthSocket | None = None
+        self._recv_lock = threading.Lock()
 
-    @staticmethod
-    def _textify_string(data: bytes) -> str | bytes:
-        """
-        Attempts to convert binary data to utf-8. If we can do this, we do it. If not, we leave as binary data.
-        Args:
-            data: The candidate data.
-        Returns:
-            The conversion, if it was possible to convert. Otherwise the untouched binary data.
-        """
-        try:
-            return data.decode("utf-8")
-        except:
-            return data
+        # Receiver thread state, see `Connection._receiver_loop`.
+        self.receiver_thread = receiver_thread
+        self._receiver: threading.Thread | None = None
+        self._receiver_error: Exception | None = None
+        self._futures: Dict[int, Future] = {}
 
-    @staticmethod
-    def _string_cleanup_rec(data: dict | list | bytes) -> dict | list | bytes | str:
-        """
-        Recursively iterates through data, and attempts to convert all binary data to utf-8.
-        If we can do this with any elements of the data, we do it. If not, we leave them as binary data.
-        Args:
-            data: The data.
-        Returns:
-            The (possibly) converted data.
-        """
-        if isinstance(data, list):
-            for i, val in enumerate(data):
-                if isinstance(val, bytes):
-                    data[i] = Connection._textify_string(val)
-                elif isinstance(val, (list, dict)):
-                    Connection._string_cleanup_rec(val)
-        elif isinstance(data, dict):
-            for key, val in data.items():
-                if isinstance(val, bytes):
-                    data[key] = Connection._textify_string(val)
-                elif isinstance(val, (list, dict)):
-                    Connection._string_cleanup_rec(val)
-        elif isinstance(data, bytes):
-            return Connection._textify_string(data)
-        return data
+        # Pipelining state of the calling thread, see `Connection.pipeline`.
+        self._pipeline = _PipelineState()
+        # Serializes the writes to the socket, including the reconnection after a failed write.
+        self._send_lock = threading.Lock()
 
-    @staticmethod
-    def _string_cleanup(data: StrDict) -> StrDict:
-        for key, val in data.items():
-            if isinstance(val, bytes):
-                data[key] = Connection._textify_string(val)
-            elif isinstance(val, (list, dict)):
-                Connection._string_cleanup_rec(val)
-        return data
-
-    def __init__(self, host: str, port: int | None = None):
-        self.host = host
-        self.port = port
-        # The socket related to this connection instance. This is set upon connecting.
-        self.skt: PrefixedLengthSocket | None = None
-        self.logger = logging.getLogger(f"{LOGGER_ID}.BeamNGpy")
-        self.comm_logger = logging.getLogger(f"{LOGGER_ID}.communication")
-        self.req_id = 0
-        self.received_messages: Dict[int, StrDict | BNGError | BNGValueError] = {}
+        # Request statistics, see `Connection.enable_stats`.
+        self._stats: ConnectionStats | None = None
 
-    def connect_to_vehicle(self, vehicle: Vehicle, tries: int = 25) -> None:
+    def connect_to_vehicle(
+        self, vehicle: Vehicle, tries: int | None = None, timeout: float | None = None
+    ) -> None:
         """
         Sets the socket of this Connection instance, and attempts to connect it to the given vehicle.
-        Upon failure, connections are re-attempted a limited amount of times.
+        Upon failure, connections are re-attempted with exponentially increasing delays between the
+        attempts (see :attr:`RETRY_DELAY_MIN` and :attr:`RETRY_DELAY_MAX`), until the time budget
+        runs out.
 
         Args:
             vehicle: The vehicle instance to be connected.
-            tries: The number of connection attempts.
+            tries: Optional. The maximum number of connection attempts.
+            timeout: The time budget of the connection attempts in seconds. Defaults to
+                     :attr:`RETRY_TIMEOUT`.
+
+        Raises:
+            BNGError: If the connection could not be established.
         """
         if not self.port:
             raise BNGError("The simulator port is not set!")
-        while tries > 0:
+        start_time = perf_counter()
+        delays = self._retry_delays(tries, timeout)
+        self.logger.info(f"Attempting to connect to vehicle {vehicle.vid}")
+        while True:
             try:
-                self.logger.info(f"Attempting to connect to vehicle {vehicle.vid}")
-                self.skt = PrefixedLengthSocket(self.host, self.port)
+                self.skt = PrefixedLengthSocket(
+                    self.host, self.port, stream=vehicle.vid
+                )
                 break
             except (ConnectionRefusedError, ConnectionAbortedError, OSError) as err:
-                msg = f"Error connecting to BeamNG.tech vehicle {vehicle.vid}. {tries} tries left."
-                self.logger.error(msg)
-                self.logger.exception(err)
-                sleep(5)
-                tries -= 1
+                delay = next(delays, None)
+                if delay is None:
+                    raise BNGError(
+                        f"Cannot connect to BeamNG.tech vehicle {vehicle.vid}."
+                    ) from err
+                self.logger.debug(
+                    f"Error connecting to BeamNG.tech vehicle {vehicle.vid}, retrying in {delay:.2f} s."
+                )
+                sleep(delay)
 
+        self._start_receiver()
         # Send a first message across the socket to ensure we have matching protocol values.
         self.hello()
-        self.logger.info(f"Successfully connected to vehicle {vehicle.vid}.")
+        self.logger.info(
+            f"Successfully connected to vehicle {vehicle.vid} in {perf_counter() - start_time:.2f} s."
+        )
 
-    def connect_to_beamng(self, tries: int = 25, log_tries: bool = True) -> bool:
+    def connect_to_beamng(
+        self,
+        tries: int | None = None,
+        log_tries: bool = True,
+        timeout: float | None = None,
+    ) -> bool:
         """
         Sets the socket of this connection instance and attempts to connect to the simulator over the host and port configuration set in this class.
-        Upon failure, connections are re-attempted a limited amount of times.
+        Upon failure, connections are re-attempted with exponentially increasing delays between the attempts, until the time budget runs out.
 
         Args:
-            tries: The number of connection attempts.
+            tries: Optional. The maximum number of connection attempts.
             log_tries: True if the connection logs should be propagated to the caller. Defaults to True.
+            timeout: The time budget of the connection attempts in seconds. Defaults to :attr:`RETRY_TIMEOUT`.
 
         Returns:
             True if the connection was successful, False otherwise.
@@ -137,22 +143,26 @@ class Connection:
                 "Connecting to BeamNG.tech at: " f"({self.host}, {self.port})"
             )
         connected = False
-        while tries > 0:
+        delays = self._retry_delays(tries, timeout)
+        while True:
             try:
-                self.skt = PrefixedLengthSocket(self.host, self.port)
+                self.skt = PrefixedLengthSocket(self.host, self.port, stream="ge")
                 connected = True
                 break
             except (ConnectionRefusedError, ConnectionAbortedError) as err:
+                delay = next(delays, None)
                 if log_tries:
                     self.logger.error(
-                        f"Error connecting to BeamNG.tech. {tries} tries left."
+                        "Error connecting to BeamNG.tech."
+                        + ("" if delay is None else f" Retrying in {delay:.2f} s.")
                     )
                     self.logger.exception(err)
-                tries -= 1
-                if tries > 0:
-                    sleep(5)
+                if delay is None:
+                    break
+                sleep(delay)
 
         if connected:
+            self._start_receiver()
             self.hello()
             if log_tries:
                 self.logger.info("BeamNGpy successfully connected to BeamNG.")
@@ -165,27 +175,76 @@ class Connection:
         if self.skt is not None:
             self.skt.close()
         self.skt = None
+        if self._receiver is not None:
+            if self._receiver is not threading.current_thread():
+                self._receiver.join()
+            self._receiver = None
+
+    def _start_receiver(self) -> None:
+        if not self.receiver_thread or self._receiver is not None:
+            return
+        self._receiver_error = None
+        self._receiver = threading.Thread(
+            target=self._receiver_loop,
+            name=f"BeamNGpy receiver ({self.host}:{self.port})",
+            daemon=True,
+        )
+        self._receiver.start()
 
-    def _assign_request_id(self) -> int:
-        req_id = self.req_id
-        self.req_id += 1
-        return req_id
+    def _receiver_loop(self) -> None:
+        """
+        The main function of the receiver thread. Reads the messages from the socket and completes the
+        futures of the corresponding requests. Messages nobody is waiting for yet are stored in
+        ``received_messages``.
+        """
+        skt = self.skt
+        assert skt
+        try:
+            while True:
+                _id, message = self._decode_message(skt.recv_view())
+                with self._recv_lock:
+                    future = self._futures.pop(_id, None)
+                    if future is None:
+                        self.received_messages[_id] = message
+                if future is not None:
+                    future.set_result(message)
+        except Exception as err:
+            if not isinstance(err, BNGDisconnectedError) and self.skt is skt:
+                self.logger.exception(err)
+            with self._recv_lock:
+                self._receiver_error = err
+                futures, self._futures = self._futures, {}
+            for future in futures.values():
+                future.set_exception(err)
 
     def _pack_data(self, data: StrDict) -> Tuple[int, bytes]:
-        req_id = self._assign_request_id()
-        data["_id"] = req_id
-        self.comm_logger.debug("Sending %s.", data)
-        packed = cast(
-            bytes, msgpack.packb(data, use_bin_type=True)
-        )  # the cast is for type checker
+        stats = self._stats
+        if stats is None:
+            return super()._pack_data(data)
+        start_time = perf_counter()
+        req_id, packed = super()._pack_data(data)
+        stats.on_send(
+            req_id,
+            str(data.get("type")),
+            len(packed) + PrefixedLengthSocket.HEADER_BYTES,
+            perf_counter() - start_time,
+        )
         return req_id, packed
 
-    def _unpack_data(self, data: bytes) -> StrDict:
-        unpacked: StrDict = msgpack.unpackb(data, raw=False, strict_map_key=False)
-        self.comm_logger.debug("Received %s.", unpacked)
-
-        # Converts all non-binary strings in the data into utf-8 format.
-        return self._string_cleanup(unpacked)
+    def _decode_message(
+        self, data: bytes | memoryview
+    ) -> Tuple[int, StrDict | BNGError | BNGValueError]:
+        stats = self._stats
+        if stats is None:
+            return super()._decode_message(data)
+        start_time = perf_counter()
+        _id, message = super()._decode_message(data)
+        stats.on_receive(
+            _id,
+            len(data) + PrefixedLengthSocket.HEADER_BYTES,
+            perf_counter() - start_time,
+        )
+        return _id, message
 
     def send(self, data: StrDict) -> Response:
         """
@@ -198,37 +257,188 @@ class Connection:
         if not self.skt:
             raise BNGError("Cannot send, not connected to the simulator.")
         req_id, packed_data = self._pack_data(data)
-        try:
-            # First, attempt to send over the current socket stored in this Connection instance.
-            self.skt.send(packed_data)
-        except socket.error:
-            self.skt.reconnect()  # If the send has failed, we attempt to re-connect then we send again.
-            self.skt.send(packed_data)
+        pipeline = self._pipeline
+        if pipeline.depth > 0:
+            pipeline.queue.append(packed_data)
+            return Response(self, req_id)
+        with self._send_lock:
+            try:
+                # First, attempt to send over the current socket stored in this Connection instance.
+                self.skt.send(packed_data)
+            except socket.error:
+                self.skt.reconnect()  # If the send has failed, we attempt to re-connect then we send again.
+                self.skt.send(packed_data)
         return Response(self, req_id)
 
+    def flush(self) -> None:
+        """
+        Sends all the requests queued by :func:`pipeline` in the calling thread in a single write
+        to the socket. Does nothing if there are no queued requests.
+        """
+        pipeline = self._pipeline
+        if not pipeline.queue:
+            return
+        if not self.skt:
+            raise BNGError("Cannot send, not connected to the simulator.")
+        queue, pipeline.queue = pipeline.queue, []
+        with self._send_lock:
+            try:
+                self.skt.send_many(queue)
+            except socket.error:
+                self.skt.reconnect()
+                self.skt.send_many(queue)
+
+    def is_pipelining(self) -> bool:
+        """
+        Whether the requests sent over this connection by the calling thread are currently being
+        queued by :func:`pipeline`.
+        """
+        return self._pipeline.depth > 0
+
+    @contextmanager
+    def pipeline(self) -> Iterator[Connection]:
+        """
+        A context manager which queues all the requests sent over this connection and sends them
+        together in a single write, instead of waiting for the response of each request before
+        sending the next one.
+
+        Inside of the context, :func:`Response.ack` does not block; the acknowledgements are checked
+        when the context exits. :func:`Response.recv` sends the queued requests and waits for the
+        response, so functions returning values from the simulator still work, but they end the
+        current batch of queued requests. The pipelines can be nested, the queued requests are sent
+        when the outermost one exits.
+
+        The pipeline only applies to the calling thread. Other threads sharing the connection
+        (see the ``receiver_thread`` argument) keep sending their requests immediately.
+
+        Example:
+
+        .. code-block:: python
+
+            with vehicle.connection.pipeline():
+                vehicle.set_lights(headlights=1)
+                vehicle.control(throttle=0.5)
+                vehicle.ai.set_speed(10)
+        """
+        self._begin_pipeline()
+        try:
+            yield self
+        except BaseException:
+            self._end_pipeline(raise_errors=False)
+            raise
+        self._end_pipeline()
+
+    def _begin_pipeline(self) -> None:
+        self._pipeline.depth += 1
+
+    def _end_pipeline(self, raise_errors: bool = True) -> None:
+        """
+        Leaves a pipeline context. When the outermost one is left, the queued requests are sent
+        and the deferred acknowledgements are checked.
+
+        Args:
+            raise_errors: Whether to raise the first error found while checking the acknowledgements.
+        """
+        pipeline = self._pipeline
+        pipeline.depth -= 1
+        if pipeline.depth > 0:
+            return
+        self.flush()
+        deferred, pipeline.deferred_acks = pipeline.deferred_acks, []
+        error: Exception | None = None
+        for response, ack_type in deferred:
+            try:
+                response.ack(ack_type)
+            except Exception as err:
+                if error is None:
+                    error = err
+        if error is not None and raise_errors:
+            raise error
+
     def recv(self, req_id: int) -> StrDict | BNGError | BNGValueError:
-        if req_id in self.received_messages:
-            return self.received_messages.pop(req_id)
+        with self._recv_lock:
+            if req_id in self.received_messages:
+                return self.received_messages.pop(req_id)
         if not self.skt:
             raise BNGError("Cannot receive, not connected to the simulator.")
+        # The requested response can only arrive if its request was already sent. Only the requests
+        # of the calling thread are flushed, as the responses to the other threads' are not awaited here.
+        self.flush()
+        if self._receiver is not None:
+            return self._wait_for_receiver(req_id)
         while True:
-            message = self.skt.recv()
-            message = self._unpack_data(message)
-            if not "_id" in message:
-                raise BNGError(
-                    "Invalid message received! The version of BeamNG.tech running is incompatible with this version of BeamNGpy."
-                )
-            _id = int(message["_id"])
-            del message["_id"]
+            with self._recv_lock:
+                # another thread may have received the message while this one was waiting for the lock
+                if req_id in self.received_messages:
+                    return self.received_messages.pop(req_id)
+                # the received view is only valid until the next receive, it is unpacked while holding the lock
+                _id, message = self._decode_message(self.skt.recv_view())
+                if _id == req_id:
+                    return message
+                self.received_messages[_id] = message
+
+    def _wait_for_receiver(self, req_id: int) -> StrDict | BNGError | BNGValueError:
+        with self._recv_lock:
+            if req_id in self.received_messages:
+                return self.received_messages.pop(req_id)
+            if self._receiver_error is not None:
+                raise self._receiver_error
+            future = self._futures.setdefault(req_id, Future())
+        return future.result()
+
+    def enable_stats(
+        self,
+        dump_path: str | None = None,
+        dump_interval: float = 10.0,
+        dump_format: str = "json",
+    ) -> ConnectionStats:
+        """
+        Starts collecting the per-request-type statistics of this connection: the numbers of requests
+        and responses, the bytes sent and received, the time spent packing and unpacking the messages
+        and the round-trip latency histograms. The statistics are not collected by default, so that
+        they do not cost anything. They can be retrieved by :func:`stats`.
+
+        Args:
+            dump_path: Optional. If set, then the statistics are periodically written to this file.
+            dump_interval: The time between the writes of the statistics file, in seconds.
+            dump_format: The format of the statistics file, either ``json`` or ``prometheus``.
+
+        Returns:
+            The object collecting the statistics.
+        """
+        if self._stats is None:
+            self._stats = ConnectionStats(f"{self.host}:{self.port}")
+        if dump_path is not None:
+            self._stats.start_dump(dump_path, dump_interval, dump_format)
+        return self._stats
+
+    def disable_stats(self) -> None:
+        """
+        Stops collecting the statistics enabled by :func:`enable_stats` and discards them.
+        """
+        if self._stats is not None:
+            self._stats.stop_dump()
+            self._stats = None
+
+    def reset_stats(self) -> None:
+        """
+        Clears the statistics collected so far.
+        """
+        if self._stats is not None:
+            self._stats.reset()
 
-            if "bngError" in message:
-                message = BNGError(message["bngError"])
-            elif "bngValueError" in message:
-                message = BNGValueError(message["bngValueError"])
+    def stats(self) -> StrDict:
+        """
+        Returns the snapshot of the statistics collected since :func:`enable_stats` was called.
+        See :func:`.ConnectionStats.to_dict` for the format.
 
-            if _id == req_id:
-                return message
-            self.received_messages[_id] = message
+        Returns:
+            The dictionary mapping the request types to their statistics, empty if the statistics
+            are not being collected.
+        """
+        if self._stats is None:
+            return {}
+        return self._stats.to_dict()
 
     def message(self, req: str, **kwargs: Any) -> Any:
         """
@@ -259,13 +469,7 @@ class Connection:
         data = dict(type="Hello")
         data["protocolVersion"] = self.PROTOCOL_VERSION
         resp = self.send(data).recv("Hello")
-        if resp["protocolVersion"] != self.PROTOCOL_VERSION:
-            msg = (
-                "Mismatching BeamNGpy protocol versions. Please ensure both BeamNG.tech and BeamNGpy are using the desired versions.\n"
-                f"BeamNGpy's is: {self.PROTOCOL_VERSION}\n"
-                f'BeamNG.tech\'s is: { resp["protocolVersion"] }'
-            )
-            raise BNGError(msg)
+        self._check_protocol_version(resp)
         self.logger.info("Successfully connected to BeamNG.tech.")
 
 
@@ -274,8 +478,10 @@ class Response:
         self.connection = connection
         self.req_id = req_id
 
-    def recv(self, type: str | None = None) -> StrDict:
-        message = self.connection.recv(self.req_id)
+    @staticmethod
+    def _check_message(
+        message: StrDict | BNGError | BNGValueError, type: str | None
+    ) -> StrDict:
         if isinstance(message, Exception):
             raise message
         if type and message["type"] != type:
@@ -284,7 +490,18 @@ class Response:
             )
         return message
 
-    def ack(self, ack_type: str) -> None:
-        message = self.recv()
+    @staticmethod
+    def _check_ack(message: StrDict, ack_type: str) -> None:
         if message["type"] != ack_type:
             raise BNGError(f'Wrong ACK: {ack_type} != {message["type"]}')
+
+    def recv(self, type: str | None = None) -> StrDict:
+        message = self.connection.recv(self.req_id)
+        return self._check_message(message, type)
+
+    def ack(self, ack_type: str) -> None:
+        if self.connection.is_pipelining():
+            self.connection._pipeline.deferred_acks.append((self, ack_type))
+            return
+        message = self.recv()
+        self._check_ack(message, ack_type)
@@ -3,15 +3,21 @@ from __future__ import annotations
 import socket
 import threading
 import time
-from struct import pack, unpack
+from struct import pack, unpack, unpack_from
+from typing import TYPE_CHECKING, List
 
 from beamngpy.logging import BNGDisconnectedError
 
+if TYPE_CHECKING:
+    from beamngpy.testing import CaptureRecorder
+
 BUF_SIZE = 196608
 
 
 class PrefixedLengthSocket:
     HEADER_BYTES = 4
+    # If set, all the messages sent and received by the sockets are recorded, see `beamngpy.testing.record_session`.
+    recorder: CaptureRecorder | None = None
 
     @staticmethod
     def _initialize_socket() -> socket.socket:
@@ -36,6 +42,8 @@ class PrefixedLengthSocket:
             try:
                 received = self.skt.recv(min(BUF_SIZE, length))
             except socket.error:
+                if self.closed:
+                    raise BNGDisconnectedError("The connection was closed.")
                 self.reconnect()
                 received = self.skt.recv(min(BUF_SIZE, length))
             if not received:
@@ -46,13 +54,47 @@ class PrefixedLengthSocket:
 
         return b"".join(recv_buffer)
 
-    def __init__(self, host: str, port: int, reconnect_tries: int = 5):
+    def _recv_exactly_into(self, view: memoryview) -> None:
+        """
+        Fills the given buffer with data received from the socket, without making intermediate copies.
+        If a socket error happens, the function tries to re-establish the connection.
+
+        Args:
+            view: The writable buffer to be filled.
+        """
+        received_total = 0
+        length = len(view)
+        while received_total < length:
+            try:
+                received = self.skt.recv_into(view[received_total:])
+            except socket.error:
+                if self.closed:
+                    raise BNGDisconnectedError("The connection was closed.")
+                self.reconnect()
+                received = self.skt.recv_into(view[received_total:])
+            if not received:
+                raise BNGDisconnectedError("The simulator ended the connection.")
+            received_total += received
+
+    def __init__(
+        self,
+        host: str,
+        port: int,
+        reconnect_tries: int = 5,
+        stream: str | None = None,
+    ):
         self.host = host
         self.port = port
+        # The name of the connection in the capture files, the game engine or the vehicle ID.
+        self.stream = stream if stream is not None else f"{host}:{port}"
         self.reconnect_tries = reconnect_tries
         self.SEND_LOCK = threading.Lock()
         self.RECV_LOCK = threading.Lock()
         self.recv_buffer = []
+        # Reusable buffers for `recv_view`. The message buffer grows to the size of the largest message received.
+        self.header_buffer = bytearray(self.HEADER_BYTES)
+        self.message_buffer = bytearray(BUF_SIZE)
+        self.closed = False
         self.skt = self._initialize_socket()
         try:
             self.skt.connect((host, port))
@@ -64,6 +106,8 @@ class PrefixedLengthSocket:
         return id(self)
 
     def send(self, data: bytes) -> None:
+        if self.recorder is not None:
+            self.recorder.record("out", self.stream, data)
         length = pack(
             "!I", len(data)
         )  # Prefix the message length to the front of the message data.
@@ -71,15 +115,58 @@ class PrefixedLengthSocket:
         with self.SEND_LOCK:
             self.skt.sendall(data)
 
+    def send_many(self, messages: List[bytes]) -> None:
+        """
+        Sends multiple messages with a single call to ``sendall``, each of them prefixed by its length.
+
+        Args:
+            messages: The messages to send.
+        """
+        if self.recorder is not None:
+            for message in messages:
+                self.recorder.record("out", self.stream, message)
+        data = b"".join(pack("!I", len(message)) + message for message in messages)
+        with self.SEND_LOCK:
+            self.skt.sendall(data)
+
     def recv(self) -> bytes:
         with self.RECV_LOCK:
             packed_length = self._recv_exactly(self.HEADER_BYTES)
             length = unpack("!I", packed_length)[0]
 
             message = self._recv_exactly(length)
+        if self.recorder is not None:
+            self.recorder.record("in", self.stream, message)
         return message
 
+    def recv_view(self) -> memoryview:
+        """
+        Receives a single message into a reusable buffer, sized from the length header, and returns
+        a view of it. This avoids copying large messages, but the returned view is only valid until
+        the next call of this function, so the message has to be consumed (e.g. unpacked) before
+        receiving the next one.
+
+        Returns:
+            A read-only view of the received message.
+        """
+        with self.RECV_LOCK:
+            self._recv_exactly_into(memoryview(self.header_buffer))
+            length = unpack_from("!I", self.header_buffer)[0]
+            if len(self.message_buffer) < length:
+                self.message_buffer = bytearray(max(length, 2 * len(self.message_buffer)))
+            view = memoryview(self.message_buffer)[:length]
+            self._recv_exactly_into(view)
+        if self.recorder is not None:
+            self.recorder.record("in", self.stream, view)
+        return view.toreadonly()
+
     def close(self) -> None:
+        self.closed = True
+        try:
+            # wakes up the threads blocked in `recv`
+            self.skt.shutdown(socket.SHUT_RDWR)
+        except OSError:
+            pass
         self.skt.close()
 
     def reconnect(self) -> None:
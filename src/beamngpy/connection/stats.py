@@ -0,0 +1,260 @@
+from __future__ import annotations
+
+import json
+import os
+import threading
+from bisect import bisect_left
+from time import perf_counter
+from typing import Dict, List, Tuple
+
+from beamngpy.types import StrDict
+
+
+class RequestTypeStats:
+    """
+    The statistics of the requests of a single type sent over a connection.
+
+    Args:
+        buckets: The upper bounds of the round-trip latency histogram buckets, in seconds.
+    """
+
+    def __init__(self, buckets: Tuple[float, ...]):
+        self.requests = 0
+        self.responses = 0
+        self.bytes_sent = 0
+        self.bytes_received = 0
+        self.pack_time = 0.0
+        self.unpack_time = 0.0
+        self.latency_sum = 0.0
+        self.latency_max = 0.0
+        # the last bucket counts the latencies above the largest bound
+        self.latency_buckets = [0] * (len(buckets) + 1)
+
+    def to_dict(self, buckets: Tuple[float, ...]) -> StrDict:
+        return dict(
+            requests=self.requests,
+            responses=self.responses,
+            bytes_sent=self.bytes_sent,
+            bytes_received=self.bytes_received,
+            pack_time=self.pack_time,
+            unpack_time=self.unpack_time,
+            latency=dict(
+                sum=self.latency_sum,
+                max=self.latency_max,
+                mean=self.latency_sum / self.responses if self.responses else 0.0,
+                buckets={
+                    str(bound): count
+                    for bound, count in zip(
+                        buckets + (float("inf"),), self.latency_buckets
+                    )
+                },
+            ),
+        )
+
+
+class ConnectionStats:
+    """
+    Collects the per-request-type statistics of a :class:`.Connection`: the numbers of requests
+    and responses, the bytes sent and received, the CPU time spent packing and unpacking the
+    messages and the histograms of the round-trip latencies. The round-trip latency is measured
+    from packing the request to unpacking its response, so it includes the time the request
+    spent queued by :func:`.Connection.pipeline`.
+
+    The statistics are collected only after :func:`.Connection.enable_stats` is called.
+
+    Args:
+        name: The name of the connection, used as a label in the Prometheus format.
+        buckets: The upper bounds of the round-trip latency histogram buckets, in seconds.
+    """
+
+    LATENCY_BUCKETS = (
+        0.0005,
+        0.001,
+        0.0025,
+        0.005,
+        0.01,
+        0.025,
+        0.05,
+        0.1,
+        0.25,
+        0.5,
+        1.0,
+        2.5,
+        5.0,
+        10.0,
+    )
+    # Requests whose responses are never received (e.g. steps without acknowledgement) are
+    # forgotten after this many newer requests were sent.
+    MAX_PENDING = 10000
+
+    def __init__(self, name: str, buckets: Tuple[float, ...] | None = None):
+        self.name = name
+        self.buckets = self.LATENCY_BUCKETS if buckets is None else tuple(buckets)
+        self._lock = threading.Lock()
+        self._types: Dict[str, RequestTypeStats] = {}
+        # the type and the send time of the requests waiting for a response, by the request ID
+        self._pending: Dict[int, Tuple[str, float]] = {}
+        self._dump_thread: threading.Thread | None = None
+        self._dump_stop = threading.Event()
+
+    def _get_type(self, req_type: str) -> RequestTypeStats:
+        stats = self._types.get(req_type)
+        if stats is None:
+            stats = self._types[req_type] = RequestTypeStats(self.buckets)
+        return stats
+
+    def on_send(
+        self, req_id: int, req_type: str, num_bytes: int, pack_time: float
+    ) -> None:
+        with self._lock:
+            stats = self._get_type(req_type)
+            stats.requests += 1
+            stats.bytes_sent += num_bytes
+            stats.pack_time += pack_time
+            if len(self._pending) >= self.MAX_PENDING:
+                del self._pending[next(iter(self._pending))]
+            self._pending[req_id] = (req_type, perf_counter())
+
+    def on_receive(self, req_id: int, num_bytes: int, unpack_time: float) -> None:
+        now = perf_counter()
+        with self._lock:
+            req_type, send_time = self._pending.pop(req_id, ("unknown", now))
+            stats = self._get_type(req_type)
+            stats.responses += 1
+            stats.bytes_received += num_bytes
+            stats.unpack_time += unpack_time
+            latency = now - send_time
+            stats.latency_sum += latency
+            stats.latency_max = max(stats.latency_max, latency)
+            stats.latency_buckets[bisect_left(self.buckets, latency)] += 1
+
+    def reset(self) -> None:
+        """
+        Clears all the collected statistics.
+        """
+        with self._lock:
+            self._types.clear()
+
+    def to_dict(self) -> StrDict:
+        """
+        Returns:
+            The snapshot of the statistics as a dictionary mapping the request types to their statistics.
+            The latency histogram buckets are keyed by their upper bounds and are not cumulative.
+        """
+        with self._lock:
+            return {
+                req_type: stats.to_dict(self.buckets)
+                for req_type, stats in sorted(self._types.items())
+            }
+
+    def to_json(self) -> str:
+        """
+        Returns:
+            The snapshot of the statistics as a JSON string, see :func:`to_dict`.
+        """
+        return json.dumps(dict(connection=self.name, types=self.to_dict()), indent=2)
+
+    def to_prometheus(self) -> str:
+        """
+        Returns:
+            The snapshot of the statistics in the Prometheus text exposition format.
+        """
+        counters = [
+            ("requests_total", "Number of requests sent.", "requests"),
+            ("responses_total", "Number of responses received.", "responses"),
+            ("sent_bytes_total", "Bytes sent.", "bytes_sent"),
+            ("received_bytes_total", "Bytes received.", "bytes_received"),
+            ("pack_seconds_total", "CPU time spent packing requests.", "pack_time"),
+            (
+                "unpack_seconds_total",
+                "CPU time spent unpacking responses.",
+                "unpack_time",
+            ),
+        ]
+        with self._lock:
+            types = sorted(self._types.items())
+            lines: List[str] = []
+            for metric, help, attr in counters:
+                lines.append(f"# HELP beamngpy_{metric} {help}")
+                lines.append(f"# TYPE beamngpy_{metric} counter")
+                for req_type, stats in types:
+                    labels = self._labels(req_type)
+                    value = getattr(stats, attr)
+                    lines.append(f"beamngpy_{metric}{{{labels}}} {value}")
+
+            metric = "beamngpy_request_latency_seconds"
+            lines.append(f"# HELP {metric} Round-trip latency of the requests.")
+            lines.append(f"# TYPE {metric} histogram")
+            for req_type, stats in types:
+                labels = self._labels(req_type)
+                cumulative = 0
+                for bound, count in zip(self.buckets, stats.latency_buckets):
+                    cumulative += count
+                    lines.append(
+                        f'{metric}_bucket{{{labels},le="{bound}"}} {cumulative}'
+                    )
+                lines.append(
+                    f'{metric}_bucket{{{labels},le="+Inf"}} {stats.responses}'
+                )
+                lines.append(f"{metric}_sum{{{labels}}} {stats.latency_sum}")
+                lines.append(f"{metric}_count{{{labels}}} {stats.responses}")
+        return "\n".join(lines) + "\n"
+
+    def _labels(self, req_type: str) -> str:
+        return f'connection="{self.name}",type="{req_type}"'
+
+    def dump(self, path: str, format: str = "json") -> None:
+        """
+        Writes the snapshot of the statistics to a file. The file is replaced atomically, so that
+        it can be read by other processes at any time.
+
+        Args:
+            path: The path of the file.
+            format: Either ``json`` or ``prometheus``.
+        """
+        if format == "json":
+            text = self.to_json()
+        elif format == "prometheus":
+            text = self.to_prometheus()
+        else:
+            raise ValueError(f"Unknown statistics format: {format}")
+        tmp_path = f"{path}.tmp"
+        with open(tmp_path, "w") as f:
+            f.write(text)
+        os.replace(tmp_path, path)
+
+    def start_dump(
+        self, path: str, interval: float = 10.0, format: str = "json"
+    ) -> None:
+        """
+        Starts a background thread periodically writing the statistics to a file using :func:`dump`.
+
+        Args:
+            path: The path of the file.
+            interval: The time between the writes, in seconds.
+            format: Either ``json`` or ``prometheus``.
+        """
+        self.stop_dump()
+        self._dump_stop.clear()
+        self.dump(path, format)
+
+        def dump_loop():
+            while not self._dump_stop.wait(interval):
+                self.dump(path, format)
+            self.dump(path, format)
+
+        self._dump_thread = threading.Thread(
+            target=dump_loop, name=f"BeamNGpy stats dump ({self.name})", daemon=True
+        )
+        self._dump_thread.start()
+
+    def stop_dump(self) -> None:
+        """
+        Stops the periodic writing of the statistics started by :func:`start_dump`,
+        writing the statistics one last time.
+        """
+        if self._dump_thread is None:
+            return
+        self._dump_stop.set()
+        self._dump_thread.join()
+        self._dump_thread = None
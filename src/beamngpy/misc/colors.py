@@ -2,8 +2,6 @@ from __future__ import annotations
 
 from typing import TYPE_CHECKING
 
-from matplotlib import colors
-
 if TYPE_CHECKING:
     from beamngpy.types import Color, Float4
 
@@ -39,4 +37,6 @@ def coerce_color(color: Color, alpha=0.0) -> Float4:
             return (*color, alpha)
         return color
 
+    from matplotlib import colors
+
     return colors.to_rgba(color, alpha=alpha)
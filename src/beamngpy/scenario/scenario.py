@@ -576,9 +576,11 @@ class Scenario:
             player_vid = None
 
         self.logger.debug(f"Connecting to {len(self.vehicles)} vehicles.")
-        for vehicle in self.vehicles.values():
-            if connect_existing or (connect_player and vehicle.vid == player_vid):
-                vehicle.connect(bng)
+        bng.vehicles.connect_all(
+            vehicle
+            for vehicle in self.vehicles.values()
+            if connect_existing or (connect_player and vehicle.vid == player_vid)
+        )
 
         self.logger.info(f"Connected to scenario: {self.name}")
 
@@ -735,12 +737,23 @@ class Scenario:
         """
         return self._find_objects_class("TSStatic")
 
-    def update(self) -> None:
+    def update(self, vehicles: Iterable[Vehicle | str] | None = None) -> None:
         """
         Synchronizes object states of this scenario with the simulator.
         This is used to update the :attr:`.Vehicle.state` fields of
         each vehicle in the scenario.
 
+        The states of all the vehicles are retrieved in a single request to
+        the simulator (see :func:`.VehiclesApi.get_states`), which updates the
+        ``pos``, ``dir``, ``up`` and ``vel`` entries of the states. The other
+        entries of the vehicle-side :class:`.State` sensor, including ``time``
+        and ``rotation``, keep the values of the last time the sensor was
+        polled and go stale until the next ``vehicle.sensors.poll("state")``.
+
+        Args:
+            vehicles: Optional. The vehicles (or their IDs) to update. Defaults
+                      to all the vehicles of the scenario.
+
         Raises:
             BNGError: If the scenario is currently not loaded.
         """
@@ -750,5 +763,14 @@ class Scenario:
                 "instance to update its state."
             )
 
-        for vehicle in self.vehicles.values():
-            vehicle.sensors.poll("state")
+        if vehicles is None:
+            vids = list(self.vehicles.keys())
+        else:
+            vids = [v if isinstance(v, str) else v.vid for v in vehicles]
+        if not vids:
+            return
+
+        states = self.bng.vehicles.get_states(vids)
+        for vid, state in states.items():
+            if vid in self.vehicles:
+                self.vehicles[vid].sensors["state"].update(state)
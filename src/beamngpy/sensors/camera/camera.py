@@ -1,19 +1,24 @@
 from __future__ import annotations
 
 from logging import DEBUG, getLogger
-from typing import TYPE_CHECKING, Dict, List
+from typing import TYPE_CHECKING, Callable, Dict, Iterable, List
 
 import numpy as np
-from PIL import Image
 
-from beamngpy.connection import CommBase
+from beamngpy.connection import CommBase, Response
 from beamngpy.logging import LOGGER_ID, BNGError, BNGValueError
-from beamngpy.sensors.shmem import BNGSharedMemory
+from beamngpy.sensors.shmem import (
+    BNGSharedMemory,
+    FrameHeader,
+    SharedMemoryFrame,
+)
 from beamngpy.types import Float2, Float3, Int2, Int3, StrDict
 
 from . import utils
 
 if TYPE_CHECKING:
+    from PIL import Image
+
     from beamngpy.beamng import BeamNGpy
     from beamngpy.vehicle import Vehicle
 
@@ -48,16 +53,23 @@ class Camera(CommBase):
         is_static: A flag which indicates whether this sensor should be static (fixed position), or attached to a vehicle.
         is_snapping_desired: A flag which indicates whether or not to snap the sensor to the nearest vehicle triangle (not used for static sensors).
         is_force_inside_triangle: A flag which indicates if the sensor should be forced inside the nearest vehicle triangle (not used for static sensors).
-        postprocess_depth: If True, the raw depth data will be postprocessed to better represent values with middle intensity. Defaults to False,
-                           as the postprocessing is computationally intensive.
+        postprocess_depth: If True, the raw depth data will be postprocessed to better represent values with middle intensity. Defaults to False.
         is_dir_world_space: Flag which indicates if the direction is provided in world-space coordinates (True), or the default vehicle space (False).
         integer_depth: If True, depth values will be quantized to the integer range 0-255. If False, depth values will be sent as 32-bit floats in the range
                        of 0.0-1.0. Will be set to False is ``postprocess_depth=True`` as full precision is needed for postprocessing. Defaults to True.
+        stream_slots: The number of frames kept in the shared memory of a streaming sensor. With more than one slot, the newest frame can be read
+                      while the next one is written. The frames are read without tearing if the simulator supports the :class:`.FrameHeader`.
+        frame_pool_size: The number of preallocated frames which :func:`poll_array` and :func:`stream_array` decode into in turn, see
+                         :attr:`frame_pool`. The arrays returned by these functions stay valid for ``frame_pool_size - 1`` further calls.
+        depth_marks_refresh: The number of frames for which the intensity marks of the depth postprocessing are reused, see
+                             :func:`depth_buffer_processing`. With 1, the marks are recomputed for every frame.
     """
 
     @staticmethod
     def extract_bounding_boxes(
-        semantic_image: Image.Image, instance_image: Image.Image, classes: StrDict
+        semantic_image: Image.Image | np.ndarray,
+        instance_image: Image.Image | np.ndarray,
+        classes: StrDict,
     ) -> List[StrDict]:
         """
         Analyzes the given semantic annotation and instance annotation images for its object bounding boxes. The identified objects are returned as
@@ -77,6 +89,31 @@ class Camera(CommBase):
         """
         return utils.extract_bounding_boxes(semantic_image, instance_image, classes)
 
+    @staticmethod
+    def extract_bounding_boxes_batch(
+        semantic_images: Iterable[Image.Image | np.ndarray],
+        instance_images: Iterable[Image.Image | np.ndarray],
+        classes: StrDict,
+        processes: int | None = None,
+    ) -> List[List[StrDict]]:
+        """
+        Extracts the bounding boxes of a batch of frames like :func:`extract_bounding_boxes`, e.g. of stacks of annotation images
+        given as arrays of the shape ``(frames, height, width, 3)``.
+
+        Args:
+            semantic_images: The images containing semantic annotation information.
+            instance_images: The images containing instance annotation information, in the same order.
+            classes: A mapping of colours to their class names, see :func:`extract_bounding_boxes`.
+            processes: The number of worker processes to distribute the frames to. If None or 1, the frames are processed
+                       in the calling process.
+
+        Returns:
+            The lists of bounding boxes of the frames, in their order.
+        """
+        return utils.extract_bounding_boxes_batch(
+            semantic_images, instance_images, classes, processes
+        )
+
     @staticmethod
     def draw_bounding_boxes(
         bounding_boxes: List[StrDict],
@@ -156,6 +193,9 @@ class Camera(CommBase):
         postprocess_depth: bool = False,
         is_dir_world_space: bool = False,
         integer_depth: bool = True,
+        stream_slots: int = 1,
+        frame_pool_size: int = 2,
+        depth_marks_refresh: int = 1,
     ):
         super().__init__(bng, vehicle)
         self.logger = getLogger(f"{LOGGER_ID}.Camera")
@@ -175,6 +215,10 @@ class Camera(CommBase):
         self.postprocess_depth = postprocess_depth
         self.integer_depth = integer_depth
 
+        self.depth_marks_refresh = max(1, depth_marks_refresh)
+        self._depth_marks: np.ndarray | None = None
+        self._depth_frames = 0
+
         if self.postprocess_depth:
             integer_depth = False
             self.integer_depth = False  # depth postprocessing needs full precision
@@ -189,11 +233,20 @@ class Camera(CommBase):
         self.annotation_shmem_size = -1
         self.instance_shmem_size = -1
         self.depth_shmem_size = -1
+        self.frame_header: FrameHeader | None = None
+        self.last_frame: SharedMemoryFrame | None = None
+        self.frame_pool_size = max(1, frame_pool_size)
+        self._frame_pool: List[Dict[str, np.ndarray]] = []
+        self._next_frame = 0
         if is_using_shared_memory:
             self.logger.debug("Camera - Initializing shared memory.")
+            slots = 1
+            if is_streaming:
+                self.frame_header = FrameHeader(stream_slots)
+                slots = stream_slots
             self.colour_shmem_size = resolution[0] * resolution[1] * 3
             if is_render_colours:
-                self.colour_shmem = BNGSharedMemory(self.colour_shmem_size)
+                self.colour_shmem = BNGSharedMemory(self.colour_shmem_size * slots)
                 self.logger.debug(
                     "Camera - Bound shared memory for colour: "
                     f"{self.colour_shmem.name}"
@@ -201,7 +254,7 @@ class Camera(CommBase):
 
             if is_render_annotations:
                 self.annotation_shmem_size = resolution[0] * resolution[1] * 3 + 1
-                self.annotation_shmem = BNGSharedMemory(self.annotation_shmem_size)
+                self.annotation_shmem = BNGSharedMemory(self.annotation_shmem_size * slots)
                 self.logger.debug(
                     "Camera - Bound shared memory for semantic annotations: "
                     f"{self.annotation_shmem.name}"
@@ -209,7 +262,7 @@ class Camera(CommBase):
 
             if is_render_instance:
                 self.instance_shmem_size = resolution[0] * resolution[1] * 3 + 1
-                self.instance_shmem = BNGSharedMemory(self.instance_shmem_size)
+                self.instance_shmem = BNGSharedMemory(self.instance_shmem_size * slots)
                 self.logger.debug(
                     "Camera - Bound shared memory for instance annotations: "
                     f"{self.instance_shmem.name}"
@@ -220,7 +273,7 @@ class Camera(CommBase):
                     self.depth_shmem_size = resolution[0] * resolution[1]
                 else:
                     self.depth_shmem_size = resolution[0] * resolution[1] * 4
-                self.depth_shmem = BNGSharedMemory(self.depth_shmem_size)
+                self.depth_shmem = BNGSharedMemory(self.depth_shmem_size * slots)
                 self.logger.debug(
                     "Camera - Bound shared memory for depth: "
                     f"{self.depth_shmem.name}"
@@ -261,6 +314,7 @@ class Camera(CommBase):
             is_force_inside_triangle,
             is_dir_world_space,
             integer_depth,
+            self.frame_header,
         )
         self.logger.debug("Camera - sensor created: " f"{self.name}")
 
@@ -323,56 +377,62 @@ class Camera(CommBase):
             return decoded
 
         # Convert to image format.
+        from PIL import Image
+
         b = Image.fromarray(decoded)
 
         return b
 
+    @staticmethod
+    def _depth_intensity_marks(depth_keys: np.ndarray, low: int, high: int) -> np.ndarray:
+        """
+        Distributes the intensity marks throughout the distinct depth values of a frame.
+
+        Args:
+            depth_keys: The depth values of the frame, quantized by :func:`depth_buffer_processing`.
+            low: The lowest quantized depth value.
+            high: The highest quantized depth value.
+
+        Returns:
+            The 254 quantized depth values at which the intensity increases, in ascending order.
+        """
+        if high - low <= 4 * len(depth_keys):
+            unique = np.flatnonzero(np.bincount(depth_keys - low)) + low
+        else:
+            unique = np.unique(depth_keys)
+        quantiles = np.arange(254) * (len(unique) / 255.0)
+        return unique[quantiles.astype(np.int32)]
+
     def depth_buffer_processing(self, raw_depth_values: np.ndarray) -> np.ndarray:
         """
         Converts raw depth buffer data to visually-clear intensity values in the range [0, 255].
         We process the data so that small changes in distance are better shown, rather than just using linear interpolation.
 
+        The depth values are quantized in steps of 0.01, and 254 intensity marks are spread evenly over the distinct
+        quantized values present in the frame. The intensity of a depth value is the number of marks at or below it,
+        so a single lookup table maps the whole frame. The marks are reused for ``depth_marks_refresh`` frames.
+
         Args:
             raw_depth_values: The raw 1D buffer of depth values.
 
         Returns:
             The processed intensity values in the range [0, 255].
         """
-        # Sort the depth values, and cache the sorting map.
-        sort_index = np.argsort(raw_depth_values)
-        s_data = raw_depth_values[sort_index]
-
-        # Compute an array of unique depth values, sensitive to some epsilon.
         eps = 0.01
-        rounded_depth = (s_data * (1 // eps)).astype(np.int32)
-        _, indices = np.unique(rounded_depth, return_index=True)
-        unique = s_data[indices]
-
-        # Distribute (mark) the individual intensity values throughout the sorted unique distance array.
-        intensity_marks = np.empty((256,))
-        intensity_marks[0] = 0
-        intensity_marks[-1] = 1e12
-        quantiles = np.arange(254) * (len(unique) / 255.0)
-        quantiles = quantiles.astype(np.int32)
-        intensity_marks[1:255] = unique[quantiles]
-
-        # In the sorted depth values array, convert the depth value array into intensity values.
-        depth_intensity_sorted = np.zeros_like(s_data)
-        last_idx = 0
-        for i in range(1, 256):
-            idx = (
-                np.searchsorted(s_data[last_idx:], intensity_marks[i], "left")
-                + 1
-                + last_idx
-            )
-            depth_intensity_sorted[last_idx:idx] = i - 1
-            last_idx = idx
+        depth_keys = (raw_depth_values * (1 // eps)).astype(np.int32)
+        if len(depth_keys) == 0:
+            return np.zeros_like(raw_depth_values)
+        low, high = int(depth_keys.min()), int(depth_keys.max())
 
-        # Re-map the depth values back to their original order.
-        depth_intensity = np.empty_like(s_data)
-        depth_intensity[sort_index] = depth_intensity_sorted
+        if self._depth_marks is None or self._depth_frames % self.depth_marks_refresh == 0:
+            self._depth_marks = self._depth_intensity_marks(depth_keys, low, high)
+        self._depth_frames += 1
 
-        return depth_intensity
+        if high - low > 4 * len(depth_keys):
+            intensity = np.searchsorted(self._depth_marks, depth_keys, "right")
+            return intensity.astype(raw_depth_values.dtype)
+        lookup = np.searchsorted(self._depth_marks, np.arange(low, high + 1), "right")
+        return lookup.astype(raw_depth_values.dtype)[depth_keys - low]
 
     def _binary_to_image(self, binary: StrDict) -> Dict[str, Image.Image | None]:
         """
@@ -420,11 +480,103 @@ class Camera(CommBase):
                 depth = depth.reshape(height, width)
                 if self.is_depth_inverted:
                     depth = 255 - depth
+                from PIL import Image
+
                 image = Image.fromarray(depth)
                 processed_readings["depth"] = image
 
         return processed_readings
 
+    def _allocate_frame(self) -> Dict[str, np.ndarray]:
+        """
+        Allocates the arrays of a single frame, for all the images rendered by this sensor.
+        """
+        width, height = int(self.resolution[0]), int(self.resolution[1])
+        frame: Dict[str, np.ndarray] = {}
+        if self.is_render_colours:
+            frame["colour"] = np.zeros((height, width, 3), dtype=np.uint8)
+        if self.is_render_annotations:
+            frame["annotation"] = np.zeros((height, width, 3), dtype=np.uint8)
+        if self.is_render_instance:
+            frame["instance"] = np.zeros((height, width, 3), dtype=np.uint8)
+        if self.is_render_depth:
+            depth_type = np.uint8 if self.integer_depth else np.float32
+            frame["depth"] = np.zeros((height, width), dtype=depth_type)
+        return frame
+
+    @property
+    def frame_pool(self) -> List[Dict[str, np.ndarray]]:
+        """
+        The preallocated frames :func:`poll_array` and :func:`stream_array` decode into, in turn. The arrays are
+        allocated once and kept for the lifetime of the sensor, so they can be registered with other libraries,
+        e.g. pinned for transfers to the GPU, before polling the sensor.
+        """
+        if not self._frame_pool:
+            self._frame_pool = [
+                self._allocate_frame() for _ in range(self.frame_pool_size)
+            ]
+        return self._frame_pool
+
+    def _decode_palette(self, data: np.ndarray, out: np.ndarray) -> None:
+        """
+        Decodes an annotation buffer (see :func:`_convert_to_image`) into the given array.
+        """
+        palette_bytes = int(data[0]) * 4
+        if palette_bytes == 0:
+            np.copyto(out, data[1 : 1 + out.size].reshape(out.shape))
+            return
+        palette = data[1 : 1 + palette_bytes].reshape(-1, 4)[:, :3]
+        indices = data[1 + palette_bytes : 1 + palette_bytes + out.shape[0] * out.shape[1]]
+        np.take(palette, indices, axis=0, out=out.reshape(-1, 3), mode="clip")
+
+    def _binary_to_arrays(
+        self, binary: StrDict, out: Dict[str, np.ndarray]
+    ) -> Dict[str, np.ndarray | None]:
+        """
+        Decodes the raw readings of this sensor into the given preallocated arrays, without intermediate copies.
+
+        Args:
+            binary: The raw readings data, as bytes or views of the shared memory.
+            out: The arrays to decode into, as allocated by :func:`_allocate_frame`.
+
+        Returns:
+            A dictionary with the decoded arrays, with None for the images missing in the readings.
+        """
+        arrays: Dict[str, np.ndarray | None] = {}
+        for key, array in out.items():
+            raw_data = binary.get(key)
+            if raw_data is None or len(raw_data) == 0:
+                arrays[key] = None
+                continue
+            if isinstance(raw_data, str):
+                raw_data = raw_data.encode()
+            if key == "depth":
+                data = np.frombuffer(raw_data, dtype=array.dtype, count=array.size)
+                if self.postprocess_depth:
+                    data = self.depth_buffer_processing(data)
+                    if self.is_depth_inverted:
+                        data = 255 - data
+                    np.copyto(array, data.reshape(array.shape))
+                elif self.integer_depth and self.is_depth_inverted:
+                    np.subtract(255, data.reshape(array.shape), out=array)
+                else:
+                    np.copyto(array, data.reshape(array.shape))
+            elif key == "colour":
+                data = np.frombuffer(raw_data, dtype=np.uint8, count=array.size)
+                np.copyto(array, data.reshape(array.shape))
+            else:
+                self._decode_palette(np.frombuffer(raw_data, dtype=np.uint8), array)
+            arrays[key] = array
+        return arrays
+
+    def _acquire_frame(self) -> Dict[str, np.ndarray]:
+        """
+        Returns the next frame of the :attr:`frame_pool` to decode into.
+        """
+        frame = self.frame_pool[self._next_frame]
+        self._next_frame = (self._next_frame + 1) % len(self.frame_pool)
+        return frame
+
     def remove(self) -> None:
         """
         Removes this sensor from the simulation.
@@ -459,6 +611,9 @@ class Camera(CommBase):
                 )
                 self.depth_shmem.try_close()
 
+            if self.frame_header:
+                self.frame_header.try_close()
+
         # Remove this sensor from the simulation.
         self._close_camera()
         self.logger.debug("Camera - sensor removed: " f"{self.name}")
@@ -478,30 +633,61 @@ class Camera(CommBase):
         """
 
         # Send and receive a request for readings data from this sensor.
-        raw_readings = self.send_recv_ge(
+        return self._collect_poll(self._send_poll())
+
+    def _send_poll(self) -> Response:
+        """
+        Sends the poll request of this sensor without waiting for the answer, see :func:`_collect_poll`.
+        """
+        return self.send_ge(
             "PollCamera",
             name=self.name,
             isUsingSharedMemory=self.is_using_shared_memory,
-        )["data"]
+        )
+
+    def _collect_poll(self, response: Response) -> StrDict:
+        """
+        Receives the answer to a request sent by :func:`_send_poll` and returns the raw readings.
+        """
+        return self._read_shared_memory(response.recv()["data"])
+
+    def _read_shared_memory(self, raw_readings: StrDict) -> StrDict:
+        """
+        Replaces the entries of the ``PollCamera`` response with the data stored in the shared memory
+        of this sensor. Does nothing if the sensor does not use shared memory.
 
+        Args:
+            raw_readings: The ``data`` field of the ``PollCamera`` response.
+
+        Returns:
+            The raw readings with the shared memory buffers filled in.
+        """
+        if self._is_sequenced():
+            return self._read_frame()
         if self.is_using_shared_memory:
             if self.colour_shmem:
                 if "colour" in raw_readings.keys():
-                    raw_readings["colour"] = self.colour_shmem.read()
+                    raw_readings["colour"] = self.colour_shmem.read(
+                        self.colour_shmem_size
+                    )
                 else:
                     self.logger.error(
                         "Camera - Colour buffer failed to render. Check that you are not running on low settings."
                     )
             if self.annotation_shmem:
                 if "annotation" in raw_readings.keys():
-                    raw_readings["annotation"] = self.annotation_shmem.read()
+                    raw_readings["annotation"] = self.annotation_shmem.read(
+                        self.annotation_shmem_size
+                    )
                 else:
                     self.logger.error(
                         "Camera - Annotation buffer failed to render. Check that you are not running on low settings."
                     )
             if self.depth_shmem:
                 if "depth" in raw_readings.keys():
-                    raw_readings["depth"] = self.depth_shmem.read()
+                    raw_readings["depth"] = self.depth_shmem.read(
+                        self.depth_shmem_size
+                    )
                 else:
                     self.logger.error(
                         "Camera - Depth buffer failed to render. Check that you are not running on low settings."
@@ -529,6 +715,50 @@ class Camera(CommBase):
         images = self._binary_to_image(raw_readings)
         return images
 
+    def poll_array(
+        self, out: Dict[str, np.ndarray] | None = None
+    ) -> Dict[str, np.ndarray | None]:
+        """
+        Gets the most-recent readings for this sensor like :func:`poll`, but as NumPy arrays decoded into preallocated
+        buffers instead of images. The colour and annotation images are ``(height, width, 3)`` arrays of ``uint8``, the
+        depth image is a ``(height, width)`` array of ``uint8``, or of ``float32`` if the sensor was created with
+        ``integer_depth=False``.
+
+        Args:
+            out: The arrays to decode into, with the same keys, shapes and types as the frames of the :attr:`frame_pool`.
+                 If None, the next frame of the pool is used, which is reused after ``frame_pool_size`` calls.
+
+        Returns:
+            A dictionary with the decoded arrays and the keys ``colour``, ``annotation``, ``instance`` and ``depth``
+            for the rendered images, with None for the images missing in the readings.
+        """
+        raw_readings = self.poll_raw()
+        return self._binary_to_arrays(raw_readings, out or self._acquire_frame())
+
+    def stream_array(
+        self, out: Dict[str, np.ndarray] | None = None
+    ) -> Dict[str, np.ndarray | None]:
+        """
+        Gets the streamed readings for this sensor like :func:`stream`, but as NumPy arrays decoded straight from the
+        shared memory into preallocated buffers, see :func:`poll_array`.
+
+        Args:
+            out: The arrays to decode into. If None, the next frame of the :attr:`frame_pool` is used.
+
+        Returns:
+            A dictionary with the decoded arrays.
+        """
+        if not self.is_streaming:
+            raise BNGError(
+                "This camera sensor was not created with `is_streaming=True`. Stream not available."
+            )
+        frame = out or self._acquire_frame()
+        if self._is_sequenced():
+            # decode inside of the read, so that the frame is checked for tearing afterwards
+            arrays = self._read_frame(lambda views: self._binary_to_arrays(views, frame))
+            return arrays or {key: None for key in frame}
+        return self._binary_to_arrays(self.stream_raw(), frame)
+
     def stream_raw(self) -> Dict[str, bytes]:
         """
         Gets the most-recent readings for this sensor as unprocessed bytes without sending a request to the simulator.
@@ -548,16 +778,64 @@ class Camera(CommBase):
                 "This camera sensor was not created with `is_streaming=True`. Stream not available."
             )
 
+        if self._is_sequenced():
+            return self._read_frame()
+
         raw_readings = {}
         if self.colour_shmem:
-            raw_readings["colour"] = self.colour_shmem.read()
+            raw_readings["colour"] = self.colour_shmem.read(self.colour_shmem_size)
         if self.annotation_shmem:
-            raw_readings["annotation"] = self.annotation_shmem.read()
+            raw_readings["annotation"] = self.annotation_shmem.read(
+                self.annotation_shmem_size
+            )
         if self.depth_shmem:
-            raw_readings["depth"] = self.depth_shmem.read()
+            raw_readings["depth"] = self.depth_shmem.read(self.depth_shmem_size)
 
         return raw_readings
 
+    def _is_sequenced(self) -> bool:
+        """
+        Whether the simulator writes the streamed frames with a :class:`.FrameHeader`.
+        """
+        return self.frame_header is not None and self.frame_header.is_active()
+
+    def _read_frame(self, decode: Callable[[StrDict], StrDict] | None = None) -> StrDict:
+        """
+        Copies the newest streamed frame out of the shared memory without tearing.
+
+        Args:
+            decode: A function copying the views of the buffers of the frame out of the shared memory.
+                    If None, the buffers are copied into bytes.
+
+        Returns:
+            A dictionary with the ``colour``, ``annotation`` and ``depth`` buffers rendered by the camera,
+            or the result of ``decode``.
+        """
+        assert self.frame_header
+        buffers = [
+            (key, shmem, size)
+            for key, shmem, size in (
+                ("colour", self.colour_shmem, self.colour_shmem_size),
+                ("annotation", self.annotation_shmem, self.annotation_shmem_size),
+                ("depth", self.depth_shmem, self.depth_shmem_size),
+            )
+            if shmem
+        ]
+
+        def copy_slot(frame: SharedMemoryFrame) -> StrDict:
+            views = {
+                key: shmem.read_slot(frame.slot, size) for key, shmem, size in buffers
+            }
+            if decode:
+                return decode(views)
+            return {key: bytes(view) for key, view in views.items()}
+
+        result = self.frame_header.read(copy_slot)
+        if result is None:
+            return {}
+        self.last_frame, raw_readings = result
+        return raw_readings
+
     def stream(self) -> Dict[str, Image.Image | None]:
         """
         Gets the most-recent readings for this sensor as processed images without sending a request to the simulator.
@@ -584,6 +862,23 @@ class Camera(CommBase):
         )
         return images
 
+    def stream_new(self) -> Dict[str, Image.Image | None] | None:
+        """
+        Gets the streamed images like :func:`stream`, but only if a new frame was written since the last read.
+        The frame number and time of the last read frame are stored in :attr:`last_frame`. If the simulator does
+        not support the :class:`.FrameHeader`, the new frames cannot be detected and the images are always returned.
+
+        Returns:
+            The processed images, or None if there is no new frame.
+        """
+        if self.frame_header and self._is_sequenced():
+            latest = self.frame_header.latest()
+            if latest is None or (
+                self.last_frame is not None and latest.frame == self.last_frame.frame
+            ):
+                return None
+        return self.stream()
+
     def send_ad_hoc_poll_request(self) -> int:
         """
         Sends an ad-hoc polling request to the simulator. This will be executed by the simulator immediately, but will take time to process, so the
@@ -846,6 +1141,7 @@ class Camera(CommBase):
         is_force_inside_triangle: bool,
         is_dir_world_space: bool,
         integer_depth: bool,
+        frame_header: FrameHeader | None,
     ) -> None:
         data: StrDict = dict()
         data["vid"] = 0
@@ -878,6 +1174,8 @@ class Camera(CommBase):
         data["isForceInsideTriangle"] = is_force_inside_triangle
         data["isDirWorldSpace"] = is_dir_world_space
         data["integerDepth"] = integer_depth
+        if frame_header:
+            data.update(frame_header.request_fields())
         self.send_ack_ge(type="OpenCamera", ack="OpenedCamera", **data)
         self.logger.info(f'Opened Camera: "{name}"')
 
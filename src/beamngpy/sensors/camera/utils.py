@@ -1,68 +1,108 @@
 from __future__ import annotations
 
-from typing import Dict, List, cast
+from concurrent.futures import ProcessPoolExecutor
+from itertools import repeat
+from typing import TYPE_CHECKING, Any, Iterable, List, Tuple, cast
 from xml.dom import minidom
 from xml.etree import ElementTree
 from xml.etree.ElementTree import Element, SubElement
 
 import numpy as np
-from PIL import Image, ImageDraw, ImageFont
 
 from beamngpy.logging import BNGValueError, create_warning
 from beamngpy.types import Int3, StrDict
 
+if TYPE_CHECKING:
+    from PIL import Image
+
+
+def _pack_colours(image: Image.Image | np.ndarray) -> np.ndarray:
+    """
+    Packs the RGB colours of the given image into flat 24-bit keys, i.e. [r * 256^2 + g * 256 + b].
+    """
+    data = np.asarray(image)[..., :3].astype(np.uint32)
+    keys = (data[..., 0] << 16) | (data[..., 1] << 8) | data[..., 2]
+    return keys
+
 
 def extract_bounding_boxes(
-    semantic_image: Image.Image, instance_image: Image.Image, classes: StrDict
+    semantic_image: Image.Image | np.ndarray,
+    instance_image: Image.Image | np.ndarray,
+    classes: StrDict,
 ) -> List[StrDict]:
-    semantic_data = np.array(semantic_image)
-    instance_data = np.array(instance_image)
+    semantic_keys = _pack_colours(semantic_image)
+    instance_keys = _pack_colours(instance_image)
 
-    if semantic_data.shape != instance_data.shape:
+    if semantic_keys.shape != instance_keys.shape:
         raise BNGValueError(
             "Error - The given semantic and instance annotation images have different resolutions."
         )
+    width = semantic_keys.shape[1]
+    semantic_keys = semantic_keys.ravel()
+    instance_keys = instance_keys.ravel()
+
+    # The class lookup table, for the semantic colours present in the image.
+    semantic_colours, semantic_index = np.unique(semantic_keys, return_inverse=True)
+    semantic_classes = [classes.get(int(key), "BACKGROUND") for key in semantic_colours]
+    is_known = np.array([int(key) in classes for key in semantic_colours])
+    is_object = np.array([clazz != "BACKGROUND" for clazz in semantic_classes])
+
+    is_instance = instance_keys != 0
+    unknown = np.flatnonzero(is_instance & ~is_known[semantic_index])
+    if len(unknown) > 0:
+        key = int(semantic_keys[unknown[0]])
+        create_warning(
+            f"The color ({key >> 16}, {(key >> 8) & 255}, {key & 255}) was not found in the class mapping. This may mean that the annotation image is corrupted or that there is a bug in the annotation system."
+        )
 
-    bounding_boxes: Dict[int, StrDict] = {}
-    issued_warning = False
-    for y in range(semantic_data.shape[0]):
-        for x in range(semantic_data.shape[1]):
-            colour = instance_data[y, x]
-            colour_key = int(colour[0]) * 65536 + int(colour[1]) * 256 + int(colour[2])
-            if colour_key == 0:
-                continue
-
-            clazz = semantic_data[y, x]
-            clazz_key = int(clazz[0]) * 65536 + int(clazz[1]) * 256 + int(clazz[2])
-            if not issued_warning and clazz_key not in classes:
-                create_warning(
-                    f"The color ({clazz[0]}, {clazz[1]}, {clazz[2]}) was not found in the class mapping. This may mean that the annotation image is corrupted or that there is a bug in the annotation system."
-                )
-                issued_warning = True
-            if classes.get(clazz_key, "BACKGROUND") == "BACKGROUND":
-                continue
-
-            if colour_key in bounding_boxes:
-                entry = bounding_boxes[colour_key]
-                box = entry["bbox"]
-                box[0] = min(box[0], x)
-                box[1] = min(box[1], y)
-                box[2] = max(box[2], x)
-                box[3] = max(box[3], y)
-            else:
-                entry = {
-                    "bbox": [x, y, x, y],
-                    "class": classes[clazz_key],
-                    "color": [*colour],
-                }
-                bounding_boxes[colour_key] = entry
+    # The pixels of the objects, grouped by their instance colours in the order of their first pixels.
+    pixels = np.flatnonzero(is_instance & is_object[semantic_index])
+    if len(pixels) == 0:
+        return []
+    order = np.argsort(instance_keys[pixels], kind="stable")
+    pixels = pixels[order]
+    sorted_keys = instance_keys[pixels]
+    starts = np.concatenate(([0], np.flatnonzero(np.diff(sorted_keys)) + 1))
+    xs, ys = pixels % width, pixels // width
+    min_x, max_x = np.minimum.reduceat(xs, starts), np.maximum.reduceat(xs, starts)
+    min_y, max_y = np.minimum.reduceat(ys, starts), np.maximum.reduceat(ys, starts)
+    first_pixels = pixels[starts]
 
     box_list: List[StrDict] = []
-    for _, v in bounding_boxes.items():
-        box_list.append(v)
+    for group in np.argsort(first_pixels):
+        key = int(sorted_keys[starts[group]])
+        box_list.append(
+            {
+                "bbox": [
+                    int(min_x[group]),
+                    int(min_y[group]),
+                    int(max_x[group]),
+                    int(max_y[group]),
+                ],
+                "class": semantic_classes[semantic_index[first_pixels[group]]],
+                "color": [key >> 16, (key >> 8) & 255, key & 255],
+            }
+        )
     return box_list
 
 
+def _extract_bounding_boxes_star(args: Tuple[Any, Any, StrDict]) -> List[StrDict]:
+    return extract_bounding_boxes(*args)
+
+
+def extract_bounding_boxes_batch(
+    semantic_images: Iterable[Image.Image | np.ndarray],
+    instance_images: Iterable[Image.Image | np.ndarray],
+    classes: StrDict,
+    processes: int | None = None,
+) -> List[List[StrDict]]:
+    frames = zip(semantic_images, instance_images, repeat(classes))
+    if not processes or processes <= 1:
+        return [_extract_bounding_boxes_star(frame) for frame in frames]
+    with ProcessPoolExecutor(processes) as executor:
+        return list(executor.map(_extract_bounding_boxes_star, frames, chunksize=4))
+
+
 def draw_bounding_boxes(
     bounding_boxes: List[StrDict],
     colour: Image.Image,
@@ -70,6 +110,8 @@ def draw_bounding_boxes(
     font: str = "arial.ttf",
     font_size: int = 14,
 ) -> Image.Image:
+    from PIL import ImageDraw, ImageFont
+
     colour = colour.copy()
     draw = ImageDraw.Draw(colour)
 
@@ -1,13 +1,17 @@
 from __future__ import annotations
 
 from logging import DEBUG, getLogger
-from typing import TYPE_CHECKING
+from typing import TYPE_CHECKING, Any, List
 
 import numpy as np
 
-from beamngpy.connection import CommBase
-from beamngpy.logging import LOGGER_ID
-from beamngpy.sensors.shmem import BNGSharedMemory
+from beamngpy.connection import CommBase, Response
+from beamngpy.logging import LOGGER_ID, BNGError
+from beamngpy.sensors.shmem import (
+    BNGSharedMemory,
+    FrameHeader,
+    SharedMemoryFrame,
+)
 from beamngpy.types import Float3, StrDict
 
 if TYPE_CHECKING:
@@ -15,8 +19,12 @@ if TYPE_CHECKING:
     from beamngpy.vehicle import Vehicle
 
 # The maximum number of LiDAR points which can be used.
-# TODO: Make this more efficient by instead computing the number of LiDAR points based on the sensor parameter values.
 MAX_LIDAR_POINTS = 3200000
+# The bounds and the safety margin of the shared memory sizes estimated from the sensor parameters.
+MIN_LIDAR_POINTS = 4096
+LIDAR_POINTS_MARGIN = 1.25
+# The horizontal angle between the rays per unit of the density factor, in degrees.
+LIDAR_DEGREES_PER_DENSITY = 0.01
 
 
 class Lidar(CommBase):
@@ -79,8 +87,60 @@ class Lidar(CommBase):
         is_snapping_desired: A flag which indicates whether or not to snap the sensor to the nearest vehicle triangle (not used for static sensors).
         is_force_inside_triangle: A flag which indicates if the sensor should be forced inside the nearest vehicle triangle (not used for static sensors).
         is_dir_world_space: Flag which indicates if the direction is provided in world-space coordinates (True), or the default vehicle space (False).
+        stream_slots: The number of frames kept in the shared memory of a streaming sensor. With more than one slot, the newest frame can be read
+                      while the next one is written. The frames are read without tearing if the simulator supports the :class:`.FrameHeader`.
+        max_points: The maximum number of points of a reading, used to size the shared memory. If None, it is estimated from the other parameters,
+                    see :func:`estimate_max_points`. The shared memory grows if the readings do not fit.
     """
 
+    @staticmethod
+    def estimate_max_points(
+        vertical_resolution: int = 64,
+        frequency: float = 20,
+        horizontal_angle: float = 360,
+        density: float = 100,
+        is_rotate_mode: bool = False,
+        is_360_mode: bool = True,
+        requested_update_time: float = 0.1,
+    ) -> int:
+        """
+        Estimates the maximum number of points of a single LiDAR reading from the sensor parameters, with a safety margin:
+        the number of rays, times the horizontal sector scanned per revolution divided by the angle between the rays, times
+        the revolutions accumulated in one reading update. The angle between the rays is ``density`` times
+        :data:`LIDAR_DEGREES_PER_DENSITY`. The estimate is bounded by :data:`MIN_LIDAR_POINTS` and :data:`MAX_LIDAR_POINTS`.
+
+        The estimate is not exact, the readings which do not fit grow the shared memory at runtime.
+
+        Args:
+            vertical_resolution: The vertical resolution of the LiDAR sensor.
+            frequency: The frequency of the LiDAR sensor.
+            horizontal_angle: The horizontal angle of the LiDAR sensor.
+            density: The density factor of the point cloud (e.g. 1 = very dense, 100 = sparse).
+            is_rotate_mode: Whether the sensor runs in the LFO rotate mode.
+            is_360_mode: Whether the sensor runs in the full 360 degrees mode.
+            requested_update_time: The time between the sensor reading updates, in seconds.
+
+        Returns:
+            The estimated maximum number of points.
+        """
+        revolutions = max(frequency * requested_update_time, 0.0)
+        if is_360_mode:
+            # the readings of all the revolutions since the last update are accumulated
+            sector = 360.0
+            revolutions = max(revolutions, 1.0)
+        elif is_rotate_mode:
+            # the sensor sweeps further while the readings of one update accumulate
+            sector = min(360.0, horizontal_angle + 360.0 * revolutions)
+            revolutions = 1.0
+        else:
+            sector = min(360.0, horizontal_angle)
+            revolutions = 1.0
+        angular_step = max(density, 1.0) * LIDAR_DEGREES_PER_DENSITY
+        points = int(
+            vertical_resolution * (sector / angular_step) * revolutions * LIDAR_POINTS_MARGIN
+        )
+        return max(MIN_LIDAR_POINTS, min(MAX_LIDAR_POINTS, points))
+
     def __init__(
         self,
         name: str,
@@ -107,6 +167,8 @@ class Lidar(CommBase):
         is_snapping_desired: bool = False,
         is_force_inside_triangle: bool = False,
         is_dir_world_space: bool = False,
+        stream_slots: int = 1,
+        max_points: int | None = None,
     ):
         super().__init__(bng, vehicle)
 
@@ -118,20 +180,32 @@ class Lidar(CommBase):
         # Set up the shared memory for this sensor, if requested.
         self.is_using_shared_memory = is_using_shared_memory
         self.is_streaming = is_streaming
-        self.point_cloud_shmem_size = MAX_LIDAR_POINTS * 3 * 4
+        if max_points is None:
+            max_points = self.estimate_max_points(
+                vertical_resolution,
+                frequency,
+                horizontal_angle,
+                density,
+                is_rotate_mode,
+                is_360_mode,
+                requested_update_time,
+            )
+        self.max_points = max_points
+        self.stream_slots = stream_slots
+        self.point_cloud_shmem_size = max_points * 3 * 4
         self.point_cloud_shmem: BNGSharedMemory | None = None
-        self.colour_shmem_size = MAX_LIDAR_POINTS * 3
+        self.colour_shmem_size = max_points * 3
         self.colour_shmem: BNGSharedMemory | None = None
+        self._required_points = 0
+        self.frame_header: FrameHeader | None = None
+        self.last_frame: SharedMemoryFrame | None = None
+        self._open_request: StrDict = {}
+        # Released shared memory which is still referenced by the views returned by `poll(copy=False)`
+        # or `stream_view`, closed as soon as the views are gone.
+        self._retired_shmem: List[BNGSharedMemory | FrameHeader] = []
+        self._warned_stream_view = False
         if is_using_shared_memory:
-            self.point_cloud_shmem = BNGSharedMemory(self.point_cloud_shmem_size)
-            self.logger.debug(
-                f"Lidar - Bound shared memory for point cloud data: {self.point_cloud_shmem.name}"
-            )
-
-            self.colour_shmem = BNGSharedMemory(self.colour_shmem_size)
-            self.logger.debug(
-                f"Lidar - Bound shared memory for colour data: {self.colour_shmem.name}"
-            )
+            self._allocate_shared_memory()
 
         # Create and initialise this sensor in the simulation.
         point_cloud_shmem_name = (
@@ -166,15 +240,112 @@ class Lidar(CommBase):
             is_snapping_desired,
             is_force_inside_triangle,
             is_dir_world_space,
+            self.frame_header,
         )
         self.logger.debug("Lidar - sensor created: " f"{self.name}")
 
-    def _convert_binary_to_array(self, binary: StrDict) -> StrDict:
+    def _allocate_shared_memory(self) -> None:
+        """
+        Allocates the shared memory buffers for readings of up to :attr:`max_points` points.
+        """
+        slots = 1
+        if self.is_streaming:
+            self.frame_header = FrameHeader(self.stream_slots)
+            slots = self.stream_slots
+        self.point_cloud_shmem_size = self.max_points * 3 * 4
+        self.point_cloud_shmem = BNGSharedMemory(self.point_cloud_shmem_size * slots)
+        self.logger.debug(
+            f"Lidar - Bound shared memory for point cloud data: {self.point_cloud_shmem.name}"
+        )
+
+        self.colour_shmem_size = self.max_points * 3
+        self.colour_shmem = BNGSharedMemory(self.colour_shmem_size * slots)
+        self.logger.debug(
+            f"Lidar - Bound shared memory for colour data: {self.colour_shmem.name}"
+        )
+
+    def _release_shared_memory(self) -> None:
+        """
+        Releases the shared memory buffers of this sensor. The buffers still referenced by the views
+        returned by :func:`poll` or :func:`stream_view` cannot be closed yet; they are kept and closed
+        by :func:`_close_retired_shared_memory` once the views are gone.
+        """
+        segments: List[BNGSharedMemory | FrameHeader] = []
+        if self.point_cloud_shmem:
+            self.logger.debug(
+                "Lidar - Unbinding shared memory: " f"{self.point_cloud_shmem.name}"
+            )
+            segments.append(self.point_cloud_shmem)
+
+        if self.colour_shmem:
+            self.logger.debug(
+                "Lidar - Unbinding shared memory: " f"{self.colour_shmem.name}"
+            )
+            segments.append(self.colour_shmem)
+        if self.frame_header:
+            segments.append(self.frame_header)
+        self._retired_shmem.extend(segments)
+        self._close_retired_shared_memory()
+
+    def _close_retired_shared_memory(self) -> bool:
+        """
+        Closes the released shared memory buffers whose views are not referenced anymore.
+
+        Returns:
+            Whether all the released buffers are closed.
+        """
+        self._retired_shmem = [
+            segment for segment in self._retired_shmem if not segment.try_close(warn=False)
+        ]
+        return not self._retired_shmem
+
+    def _report_overflow(self, required_points: int) -> None:
+        """
+        Records that a reading did not fit into the shared memory buffers, which are grown before
+        the next reading, see :func:`_grow_shared_memory`. The overflowing reading is truncated.
+
+        Args:
+            required_points: The number of points of the reading, if known.
+        """
+        self._required_points = max(
+            self._required_points,
+            int(required_points * LIDAR_POINTS_MARGIN),
+            self.max_points * 2,
+        )
+
+    def _grow_shared_memory(self) -> None:
+        """
+        Re-creates the shared memory buffers of this sensor with space for the number of points
+        recorded by :func:`_report_overflow` and re-opens the sensor in the simulator with them.
+        """
+        max_points = min(MAX_LIDAR_POINTS, self._required_points)
+        self._required_points = 0
+        if max_points <= self.max_points:
+            return
+        self.logger.warning(
+            f"Lidar - the readings overflowed the shared memory for {self.max_points} points, "
+            f"growing it to {max_points} points: {self.name}"
+        )
+        self._close_lidar()
+        self._release_shared_memory()
+        self.max_points = max_points
+        self.last_frame = None
+        self._allocate_shared_memory()
+        self._send_open_request(
+            pointCloudShmemHandle=self.point_cloud_shmem.name,  # type: ignore
+            pointCloudShmemSize=self.point_cloud_shmem_size,
+            colourShmemHandle=self.colour_shmem.name,  # type: ignore
+            colourShmemSize=self.colour_shmem_size,
+            **(self.frame_header.request_fields() if self.frame_header else {}),
+        )
+
+    def _convert_binary_to_array(self, binary: StrDict, copy: bool = True) -> StrDict:
         """
         Converts the binary string data from the simulator, which contains the point cloud and colour data, into arrays.
 
         Args:
             binary: The raw readings data, as a binary string.
+            copy: Whether to copy the data. If False, the arrays are read-only views of the raw buffers.
         Returns:
             A dictionary containing the point cloud and colour data.
         """
@@ -185,9 +356,10 @@ class Lidar(CommBase):
             processed_readings["colours"] = np.empty(0, dtype=np.uint8)
             return processed_readings
 
-        # Format the point cloud data.
+        # Format the point cloud data. The sequenced frames are trimmed to their number of points already.
+        has_point_count = self.is_streaming and not self._is_sequenced()
         floats = np.frombuffer(binary["pointCloud"], dtype=np.float32)
-        if self.is_streaming:
+        if has_point_count:
             
             # Add safety checks
             if len(floats) < 1:
@@ -197,40 +369,48 @@ class Lidar(CommBase):
                 
             n_points = int(floats[-1])
             # Validate n_points is reasonable
-            if n_points < 0 or n_points * 3 > len(floats) - 1:
+            if n_points < 0:
                 self.logger.warning(f"Invalid number of points received: {n_points}")
                 processed_readings["pointCloud"] = np.empty(0, dtype=np.float32)
                 processed_readings["colours"] = np.empty(0, dtype=np.uint8)
                 return processed_readings
-                
+            capacity = (len(floats) - 1) // 3
+            if n_points > capacity:
+                # the reading did not fit, the buffer holds its first points
+                self._report_overflow(n_points)
+                n_points = capacity
+
             floats = floats[: 3 * n_points]
-        processed_readings["pointCloud"] = floats.reshape((-1, 3)).copy()
+        processed_readings["pointCloud"] = floats.reshape((-1, 3))
 
         # Format the corresponding colour data.
         colours = np.frombuffer(binary["colours"], dtype=np.uint8)
-        if self.is_streaming:
+        if has_point_count:
             colours = colours[: 3 * n_points]
-        processed_readings["colours"] = colours.reshape((-1, 3)).copy()  # rgb
+        processed_readings["colours"] = colours.reshape((-1, 3))  # rgb
 
+        for key in ("pointCloud", "colours"):
+            if copy:
+                processed_readings[key] = processed_readings[key].copy()
+            else:
+                processed_readings[key].flags.writeable = False
         return processed_readings
 
     def remove(self) -> None:
         """
         Removes this sensor from the simulation.
+
+        The views returned by :func:`poll` with ``copy=False`` or by :func:`stream_view` must be dropped
+        before the sensor is removed, otherwise its shared memory cannot be closed and a warning is logged.
         """
         # Remove the shared memory binding being used by this sensor, if applicable.
         if self.is_using_shared_memory:
-            assert self.point_cloud_shmem
-            self.logger.debug(
-                "Lidar - Unbinding shared memory: " f"{self.point_cloud_shmem.name}"
-            )
-            self.point_cloud_shmem.try_close()
-
-            assert self.colour_shmem
-            self.logger.debug(
-                "Lidar - Unbinding shared memory: " f"{self.colour_shmem.name}"
-            )
-            self.colour_shmem.try_close()
+            self._release_shared_memory()
+            if self._retired_shmem:
+                self.logger.warning(
+                    "Lidar - the shared memory is still referenced by the views of the readings and "
+                    f"cannot be closed, drop them before removing the sensor: {self.name}"
+                )
 
         # Remove this sensor from the simulation.
         self._close_lidar()
@@ -248,49 +428,140 @@ class Lidar(CommBase):
             * ``pointCloud``: The colour data.
             * ``colours``: The semantic annotation data.
         """
-        if self.is_using_shared_memory:
-            raw_readings = {}
-            if not self.is_streaming:
-                sizes = self.send_recv_ge(
-                    "PollLidar",
-                    name=self.name,
-                    isUsingSharedMemory=self.is_using_shared_memory,
-                )["data"]
-            assert self.point_cloud_shmem
-            raw_readings["pointCloud"] = self.point_cloud_shmem.read(
-                self.point_cloud_shmem_size
-            )
-            self.logger.debug(
-                "Lidar - point cloud data read from shared memory: " f"{self.name}"
-            )
+        return self._collect_poll(self._send_poll())
 
-            assert self.colour_shmem
-            raw_readings["colours"] = self.colour_shmem.read(self.colour_shmem_size)
-            self.logger.debug(
-                "Lidar - colour data read from shared memory: " f"{self.name}"
-            )
+    def _send_poll(self) -> Response | None:
+        """
+        Sends the poll request of this sensor without waiting for the answer, see :func:`_collect_poll`.
+
+        Returns:
+            The response object, or None if the sensor streams into the shared memory and no
+            request is needed.
+        """
+        if self._required_points:
+            self._grow_shared_memory()
+        if self._retired_shmem:
+            self._close_retired_shared_memory()
+        if self.is_using_shared_memory and self.is_streaming:
+            return None
+        return self.send_ge(
+            "PollLidar",
+            name=self.name,
+            isUsingSharedMemory=self.is_using_shared_memory,
+        )
 
-            if not self.is_streaming:
-                raw_readings["pointCloud"] = raw_readings["pointCloud"][
-                    : int(sizes["points"])
-                ]
-                raw_readings["colours"] = raw_readings["colours"][
-                    : int(sizes["colours"])
-                ]
+    def _collect_poll(self, response: Response | None) -> StrDict:
+        """
+        Receives the answer to a request sent by :func:`_send_poll` and returns the raw readings.
+        """
+        if self.is_using_shared_memory:
+            sizes = response.recv()["data"] if response else None
+            raw_readings = self._read_shared_memory(sizes)
         else:
-            raw_readings = self.send_recv_ge(
-                "PollLidar",
-                name=self.name,
-                isUsingSharedMemory=self.is_using_shared_memory,
-            )["data"]
+            assert response
+            raw_readings = response.recv()["data"]
             self.logger.debug("Lidar - LiDAR data read from socket: " f"{self.name}")
         return raw_readings
 
-    def poll(self) -> StrDict:
+    def _read_shared_memory(self, sizes: StrDict | None) -> StrDict:
+        """
+        Reads the point cloud and colour data from the shared memory of this sensor.
+
+        Args:
+            sizes: The ``data`` field of the ``PollLidar`` response, containing the sizes of the
+                   written buffers, or None if the sensor is streaming.
+
+        Returns:
+            A dictionary with the ``pointCloud`` and ``colours`` buffers.
+        """
+        if sizes is None and self._is_sequenced():
+            return self._read_frame()
+        raw_readings = {}
+        assert self.point_cloud_shmem
+        raw_readings["pointCloud"] = self.point_cloud_shmem.read(
+            self.point_cloud_shmem_size
+        )
+        self.logger.debug(
+            "Lidar - point cloud data read from shared memory: " f"{self.name}"
+        )
+
+        assert self.colour_shmem
+        raw_readings["colours"] = self.colour_shmem.read(self.colour_shmem_size)
+        self.logger.debug(
+            "Lidar - colour data read from shared memory: " f"{self.name}"
+        )
+
+        if sizes is not None:
+            raw_readings["pointCloud"] = raw_readings["pointCloud"][
+                : int(sizes["points"])
+            ]
+            raw_readings["colours"] = raw_readings["colours"][
+                : int(sizes["colours"])
+            ]
+            # a full buffer (up to the point count in the last float) means that the reading was most likely truncated
+            if int(sizes["points"]) // 12 >= self.max_points - 1:
+                self._report_overflow(self.max_points)
+        return raw_readings
+
+    def _is_sequenced(self) -> bool:
+        """
+        Whether the simulator writes the streamed frames with a :class:`.FrameHeader`.
+        """
+        return self.frame_header is not None and self.frame_header.is_active()
+
+    def _read_frame(self, copy: bool = True) -> StrDict:
+        """
+        Copies the newest streamed frame out of the shared memory without tearing.
+
+        Args:
+            copy: Whether to copy the frame. If False, the returned buffers are views of the slot of the frame,
+                  which was complete when they were created.
+
+        Returns:
+            A dictionary with the ``pointCloud`` and ``colours`` buffers, trimmed to the points of the frame.
+        """
+        assert self.frame_header and self.point_cloud_shmem and self.colour_shmem
+        point_cloud_shmem, colour_shmem = self.point_cloud_shmem, self.colour_shmem
+
+        def copy_slot(frame: SharedMemoryFrame) -> StrDict:
+            count = min(frame.count, self.max_points)
+            raw_readings = dict(
+                pointCloud=point_cloud_shmem.read_slot(
+                    frame.slot, self.point_cloud_shmem_size, count * 12
+                ),
+                colours=colour_shmem.read_slot(
+                    frame.slot, self.colour_shmem_size, count * 3
+                ),
+            )
+            if copy:
+                return {key: bytes(value) for key, value in raw_readings.items()}
+            return raw_readings
+
+        result = self.frame_header.read(copy_slot)
+        if result is None:
+            return dict(pointCloud=b"", colours=b"")
+        self.last_frame, raw_readings = result
+        if self.last_frame.count > self.max_points:
+            self._report_overflow(self.last_frame.count)
+        self.logger.debug(
+            f"Lidar - frame {self.last_frame.frame} read from shared memory: {self.name}"
+        )
+        return raw_readings
+
+    def poll(self, copy: bool = True) -> StrDict:
         """
         Gets the most-recent readings for this sensor.
         Note: if this sensor was created with a negative update rate, then there may have been no readings taken.
 
+        Args:
+            copy: Whether to copy the readings. If False, the returned arrays are read-only views of the shared memory
+                  (or of the received message) instead, which avoids copying the point cloud. The simulator writes the
+                  shared memory of a polled sensor only when it is polled, so the views stay valid until the next call
+                  of :func:`poll` or :func:`stream` of this sensor, after which they must not be used anymore. For
+                  streaming sensors, use :func:`stream_view`. If the shared memory is re-created to fit larger
+                  readings, the old one is closed only after the views of it are dropped, and the views must be
+                  dropped before :func:`remove` is called.
+
         Returns:
             A dictionary with the following keys:
 
@@ -301,7 +572,7 @@ class Lidar(CommBase):
 
         # Get the LiDAR point cloud and colour data, and format it before returning it.
         raw_readings = self.poll_raw()
-        processed_readings = self._convert_binary_to_array(raw_readings)
+        processed_readings = self._convert_binary_to_array(raw_readings, copy=copy)
         return processed_readings
 
     def stream(self) -> StrDict:
@@ -313,6 +584,61 @@ class Lidar(CommBase):
         """
         return self.poll()
 
+    def stream_view(self) -> StrDict:
+        """
+        Gets the streamed LiDAR point cloud data as read-only views of the newest frame in the shared memory, without
+        copying it. The frame is described by :attr:`last_frame`.
+
+        The simulator keeps writing the stream, so the views are only valid until the slot of the frame is reused.
+        With ``stream_slots=N`` and a simulator supporting the :class:`.FrameHeader`, this happens after ``N - 1`` newer
+        frames are written, and ``lidar.frame_header.is_current(lidar.last_frame)`` tells whether the views are still
+        intact, so that a consumer can check it after processing them. The views therefore need ``stream_slots`` of at
+        least 2; otherwise, or if the simulator does not support the frame header, the simulator would write into the
+        viewed frame right away, so the frame is copied instead and a warning is logged once.
+
+        The views must be dropped before the sensor is removed, see :func:`remove`.
+
+        Returns:
+            The LiDAR point cloud data, as views of the shared memory.
+        """
+        if not self.is_streaming or not self.is_using_shared_memory:
+            raise BNGError(
+                "This LiDAR sensor was not created with `is_streaming=True` and `is_using_shared_memory=True`. "
+                "Stream not available."
+            )
+        self._send_poll()  # grows the shared memory if needed
+        if self._is_sequenced() and self.stream_slots >= 2:
+            return self._convert_binary_to_array(self._read_frame(copy=False), copy=False)
+        if not self._warned_stream_view:
+            self._warned_stream_view = True
+            self.logger.warning(
+                "Lidar - stream_view needs `stream_slots` of at least 2 and a simulator supporting the frame "
+                f"header to hand over the frames without copying them, copying them instead: {self.name}"
+            )
+        if self._is_sequenced():
+            raw_readings = self._read_frame()
+        else:
+            raw_readings = self._read_shared_memory(None)
+        return self._convert_binary_to_array(raw_readings)
+
+    def stream_new(self) -> StrDict | None:
+        """
+        Gets the streamed LiDAR point cloud data like :func:`stream`, but only if a new frame was written
+        since the last read. The frame number and time of the last read frame are stored in :attr:`last_frame`.
+        If the simulator does not support the :class:`.FrameHeader`, the new frames cannot be detected and
+        the data is always returned.
+
+        Returns:
+            The LiDAR point cloud data, or None if there is no new frame.
+        """
+        if self.frame_header and self._is_sequenced():
+            latest = self.frame_header.latest()
+            if latest is None or (
+                self.last_frame is not None and latest.frame == self.last_frame.frame
+            ):
+                return None
+        return self.stream()
+
     # The following three functions are used together to send and recieve single 'ad-hoc' style sensor requests.
     # This is for users who only want occasional readings now and again, which they can request, wait for, then collect later.
 
@@ -528,6 +854,7 @@ class Lidar(CommBase):
         is_snapping_desired: bool,
         is_force_inside_triangle: bool,
         is_dir_world_space: bool,
+        frame_header: FrameHeader | None,
     ):
         data: StrDict = dict()
         data["vid"] = 0
@@ -559,8 +886,18 @@ class Lidar(CommBase):
         data["isSnappingDesired"] = is_snapping_desired
         data["isForceInsideTriangle"] = is_force_inside_triangle
         data["isDirWorldSpace"] = is_dir_world_space
-        self.send_ack_ge(type="OpenLidar", ack="OpenedLidar", **data)
-        self.logger.info(f'Opened lidar: "{name}"')
+        if frame_header:
+            data.update(frame_header.request_fields())
+        self._open_request = data
+        self._send_open_request()
+
+    def _send_open_request(self, **changes: Any) -> None:
+        """
+        Opens this sensor in the simulator, with the parameters it was created with updated by ``changes``.
+        """
+        self._open_request.update(changes)
+        self.send_ack_ge(type="OpenLidar", ack="OpenedLidar", **self._open_request)
+        self.logger.info(f'Opened lidar: "{self.name}"')
 
     def _close_lidar(self) -> None:
         """
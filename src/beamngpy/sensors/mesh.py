@@ -1,23 +1,46 @@
 from __future__ import annotations
 
-import math
 from logging import DEBUG, getLogger
-from typing import TYPE_CHECKING
+from typing import TYPE_CHECKING, Any, List, NamedTuple
 
-import matplotlib
-import matplotlib.pyplot as plt
-import seaborn as sns
-from matplotlib import collections as mc
+import numpy as np
 
 from beamngpy.connection import CommBase
-from beamngpy.logging import LOGGER_ID
+from beamngpy.logging import LOGGER_ID, BNGValueError
 from beamngpy.types import StrDict
 
 if TYPE_CHECKING:
     from beamngpy.beamng import BeamNGpy
     from beamngpy.vehicle import Vehicle
 
-__all__ = ["Mesh"]
+__all__ = ["Mesh", "MeshArrays", "MeshPlot"]
+
+
+class MeshArrays(NamedTuple):
+    """
+    The readings of a :class:`Mesh` sensor as NumPy arrays, see :func:`Mesh.poll_arrays`. The nodes are the
+    ones in the selected mesh groups, ordered by their IDs.
+
+    Attributes:
+        time: The time of the readings.
+        node_ids: The IDs of the nodes, an ``int32`` array of the shape ``(nodes,)``.
+        pos: The positions of the nodes, a ``float32`` array of the shape ``(nodes, 3)``.
+        force: The forces acting on the nodes, a ``float32`` array of the shape ``(nodes, 3)``.
+        vel: The velocities of the nodes, a ``float32`` array of the shape ``(nodes, 3)``.
+        mass: The masses of the nodes, a ``float32`` array of the shape ``(nodes,)``.
+        beam_ids: The IDs of the intact beams between the nodes, an ``int32`` array of the shape ``(beams,)``.
+        beams: The rows of the nodes at the ends of the beams in the node arrays, an ``int32`` array of the
+               shape ``(beams, 2)``.
+    """
+
+    time: float
+    node_ids: np.ndarray
+    pos: np.ndarray
+    force: np.ndarray
+    vel: np.ndarray
+    mass: np.ndarray
+    beam_ids: np.ndarray
+    beams: np.ndarray
 
 
 class Mesh(CommBase):
@@ -34,6 +57,7 @@ class Mesh(CommBase):
     """
 
     DATA_KEYS = dict(pos=0, force=1, vel=2, mass=3, partOrigin=4)
+    BEAM_BROKEN = 5
 
     def __init__(
         self,
@@ -80,6 +104,13 @@ class Mesh(CommBase):
         self.raw_data = {}
         self.node_positions = {}
 
+        # The state of the array mode, see poll_arrays().
+        self.is_array_index_computed = False
+        self._node_keys: List[Any] = []
+        self._node_ids = np.empty(0, dtype=np.int32)
+        self._beam_ids = np.empty(0, dtype=np.int32)
+        self._beams = np.empty((0, 2), dtype=np.int32)
+
         # Populate the list of beams for this sensor.
         self.beams = self._get_active_beams()
 
@@ -204,6 +235,112 @@ class Mesh(CommBase):
         )
         return self.raw_data
 
+    def poll_arrays(self) -> MeshArrays | None:
+        """
+        Gets the most-recent readings for this sensor like :func:`poll`, but as contiguous NumPy arrays, see :class:`MeshArrays`.
+
+        The nodes of the selected mesh groups and the beams between them are determined once, by the first call. The later calls
+        ask the simulator for the node data packed as binary ``float32`` records and, when tracking beams, for the broken beams only,
+        which are then removed from the beam arrays. Simulators not supporting these requests answer them in the format of :func:`poll`,
+        which is converted to the same arrays.
+
+        Returns:
+            The readings, or None if there are no readings.
+        """
+        is_first = not self.is_array_index_computed
+        raw_data = self.send_recv_veh(
+            "PollMeshVE", name=self.name, sensorId=self.sensorId, binary=not is_first
+        )["data"]
+        if len(raw_data) == 0:
+            return None
+
+        if is_first:
+            self._compute_array_index(raw_data["nodes"])
+        elif self.is_track_beams and len(self._beam_ids) > 0:
+            beam_data = self.send_recv_ge("GetBeamData", vid=self.vid, brokenOnly=True)[
+                "data"
+            ]
+            broken = [
+                int(key)
+                for key, value in beam_data.items()
+                if int(value[3]) == Mesh.BEAM_BROKEN
+            ]
+            if broken:
+                intact = ~np.isin(self._beam_ids, broken)
+                self._beam_ids = self._beam_ids[intact]
+                self._beams = self._beams[intact]
+
+        if "nodeData" in raw_data:
+            # one record of (pos, force, vel, mass) for each node of the vehicle, in the order of their IDs
+            records = np.frombuffer(raw_data["nodeData"], dtype=np.float32)
+            records = records.reshape((-1, 10))[self._node_ids]
+        else:
+            nodes = raw_data["nodes"]
+            records = np.array(
+                [self._node_record(nodes[key]) for key in self._node_keys],
+                dtype=np.float32,
+            ).reshape((-1, 10))
+        return MeshArrays(
+            time=raw_data.get("time", 0.0),
+            node_ids=self._node_ids,
+            pos=np.ascontiguousarray(records[:, 0:3]),
+            force=np.ascontiguousarray(records[:, 3:6]),
+            vel=np.ascontiguousarray(records[:, 6:9]),
+            mass=np.ascontiguousarray(records[:, 9]),
+            beam_ids=self._beam_ids,
+            beams=self._beams,
+        )
+
+    @staticmethod
+    def _node_record(node: Any) -> List[float]:
+        pos = node[Mesh.DATA_KEYS["pos"]]
+        force = node[Mesh.DATA_KEYS["force"]]
+        vel = node[Mesh.DATA_KEYS["vel"]]
+        return [
+            pos["x"],
+            pos["y"],
+            pos["z"],
+            force["x"],
+            force["y"],
+            force["z"],
+            vel["x"],
+            vel["y"],
+            vel["z"],
+            node[Mesh.DATA_KEYS["mass"]],
+        ]
+
+    def _compute_array_index(self, nodes: StrDict) -> None:
+        """
+        Computes the nodes of the selected mesh groups and the intact beams between them, for the array mode.
+
+        Args:
+            nodes: The nodes of the first readings of the sensor.
+        """
+        relevant = {
+            int(key): key
+            for key, node in nodes.items()
+            if self.is_full_mesh or self._is_node_relevant(node)
+        }
+        node_ids = sorted(relevant.keys())
+        self._node_keys = [relevant[node_id] for node_id in node_ids]
+        self._node_ids = np.array(node_ids, dtype=np.int32)
+
+        beam_data = self.send_recv_ge("GetBeamData", vid=self.vid)["data"]
+        beams = np.array(
+            [
+                (int(key), int(value[0]), int(value[1]))
+                for key, value in beam_data.items()
+                if int(value[3]) != Mesh.BEAM_BROKEN
+            ],
+            dtype=np.int32,
+        ).reshape((-1, 3))
+        # Only the beams with both of their nodes selected are included.
+        is_relevant = np.isin(beams[:, 1:], self._node_ids).all(axis=1)
+        beams = beams[is_relevant]
+        self._beam_ids = beams[:, 0].copy()
+        self._beams = np.searchsorted(self._node_ids, beams[:, 1:]).astype(np.int32)
+        self.is_array_index_computed = True
+
     def send_ad_hoc_poll_request(self) -> int:
         """
         Sends an ad-hoc polling request to the simulator. This will be executed by the simulator immediately, but will take time to process, so the
@@ -304,320 +441,200 @@ class Mesh(CommBase):
     def get_node_positions(self):
         return self.node_positions
 
-    def compute_beam_line_segments(self):
-        lines1 = []
-        lines2 = []
-        lines3 = []
-        c = []
-        for _, v in self.beams.items():
-            p1 = self.node_positions[v[0]][Mesh.DATA_KEYS["pos"]]
-            p2 = self.node_positions[v[1]][Mesh.DATA_KEYS["pos"]]
-            lines1.append([(p1["x"], p1["y"]), (p2["x"], p2["y"])])
-            lines2.append([(p1["x"], p1["z"]), (p2["x"], p2["z"])])
-            lines3.append([(p1["y"], p1["z"]), (p2["y"], p2["z"])])
-            c.append((0.3, 0.3, 0.3, 0.1))
-        lns1 = mc.LineCollection(lines1, colors=c, linewidths=0.5)
-        lns2 = mc.LineCollection(lines2, colors=c, linewidths=0.5)
-        lns3 = mc.LineCollection(lines3, colors=c, linewidths=0.5)
-        return lns1, lns2, lns3
+    def _arrays_from_nodes(self, nodes: StrDict) -> MeshArrays:
+        """
+        Converts the given nodes, as returned by :func:`poll`, and the current beams of this sensor into a :class:`MeshArrays`.
+        Only the beams with both of their nodes among the given ones are included.
+        """
+        node_ids = np.array([int(key) for key in nodes.keys()], dtype=np.int32)
+        records = np.array(
+            [self._node_record(node) for node in nodes.values()], dtype=np.float32
+        ).reshape((-1, 10))
+        order = np.argsort(node_ids)
+        node_ids, records = node_ids[order], records[order]
+
+        beam_items = (self.beams or {}).items()
+        beam_ids = np.array([int(key) for key, _ in beam_items], dtype=np.int32)
+        beams = np.array(
+            [value[:2] for _, value in beam_items], dtype=np.int32
+        ).reshape((-1, 2))
+        is_relevant = np.isin(beams, node_ids).all(axis=1)
+        return MeshArrays(
+            time=0.0,
+            node_ids=node_ids,
+            pos=records[:, 0:3],
+            force=records[:, 3:6],
+            vel=records[:, 6:9],
+            mass=records[:, 9],
+            beam_ids=beam_ids[is_relevant],
+            beams=np.searchsorted(node_ids, beams[is_relevant]).astype(np.int32),
+        )
 
-    def mesh_plot(self):
-        sns.set_theme()  # Let seaborn apply better styling to all matplotlib graphs
-        fig, ax = plt.subplots(2, 2)
-        ax[0, 0].set_aspect("equal", adjustable="box")
-        ax[1, 0].set_aspect("equal", adjustable="box")
-        ax[1, 1].set_aspect("equal", adjustable="box")
-        ax[0, 0].set_xlim([-3, 3])
-        ax[1, 0].set_xlim([-3, 3])
-        ax[1, 1].set_xlim([-3, 3])
-        ax[0, 0].set_ylim([-3, 3])
-        ax[1, 0].set_ylim([-3, 3])
-        ax[1, 1].set_ylim([-3, 3])
-        ax[0, 0].set_title("Plan")
-        ax[0, 0].set_xlabel("x")
-        ax[0, 0].set_ylabel("y")
-        ax[1, 0].set_title("Front Elevation")
-        ax[1, 0].set_xlabel("x")
-        ax[1, 0].set_ylabel("z")
-        ax[1, 1].set_title("End Elevation")
-        ax[1, 1].set_xlabel("y")
-        ax[1, 1].set_ylabel("z")
-        ax[0, 1].axis("off")
-        for i in range(len(self.node_positions)):
-            node = self.node_positions[i][Mesh.DATA_KEYS["pos"]]
-            ax[0, 0].plot(node["x"], node["y"], "ro")
-            ax[1, 0].plot(node["x"], node["z"], "ro")
-            ax[1, 1].plot(node["y"], node["z"], "ro")
+    def compute_beam_line_segments(self):
+        from matplotlib import collections as mc
+
+        readings = self._arrays_from_nodes(self.node_positions)
+        segments = readings.pos[readings.beams]
+        return tuple(
+            mc.LineCollection(
+                segments[:, :, axes], colors=MeshPlot.BEAM_COLOUR, linewidths=0.5
+            )
+            for axes in ([0, 1], [0, 2], [1, 2])
+        )
 
-        lns1, lns2, lns3 = self.compute_beam_line_segments()
-        ax[0, 0].add_collection(lns1)
-        ax[1, 0].add_collection(lns2)
-        ax[1, 1].add_collection(lns3)
+    def _show_plot(self, data: StrDict, kind: str, arrows: bool = False) -> None:
+        import matplotlib.pyplot as plt
 
+        plot = MeshPlot(kind, arrows)
+        readings = self._arrays_from_nodes(data)
+        plot.update(readings)
         plt.show()
 
+    def mesh_plot(self):
+        self._show_plot(self.node_positions, "mesh")
+
     def mass_distribution_plot(self, data):
-        sns.set_theme()  # Let seaborn apply better styling to all matplotlib graphs
-        fig, ax = plt.subplots(2, 2)
-        ax[0, 0].set_aspect("equal", adjustable="box")
-        ax[1, 0].set_aspect("equal", adjustable="box")
-        ax[1, 1].set_aspect("equal", adjustable="box")
-        ax[0, 0].set_xlim([-3, 3])
-        ax[1, 0].set_xlim([-3, 3])
-        ax[1, 1].set_xlim([-3, 3])
-        ax[0, 0].set_ylim([-3, 3])
-        ax[1, 0].set_ylim([-3, 3])
-        ax[1, 1].set_ylim([-3, 3])
-        ax[0, 0].set_title("Plan")
-        ax[0, 0].set_xlabel("x")
-        ax[0, 0].set_ylabel("y")
-        ax[1, 0].set_title("Front Elevation")
-        ax[1, 0].set_xlabel("x")
-        ax[1, 0].set_ylabel("z")
-        ax[1, 1].set_title("End Elevation")
-        ax[1, 1].set_xlabel("y")
-        ax[1, 1].set_ylabel("z")
-        ax[0, 1].axis("off")
+        self._show_plot(data, "mass")
 
-        x = []
-        y = []
-        z = []
-        colors = []
-        circle_size = 3.0
-        for i in range(len(data)):
-            node = data[i][Mesh.DATA_KEYS["pos"]]
-            x.append(node["x"])
-            y.append(node["y"])
-            z.append(node["z"])
-            colors.append(data[i][Mesh.DATA_KEYS["mass"]])
-
-        cmap = matplotlib.cm.viridis
-        s1 = ax[0, 0].scatter(x, y, s=circle_size, c=colors, cmap=cmap)
-        s2 = ax[1, 0].scatter(x, z, s=circle_size, c=colors, cmap=cmap)
-        s3 = ax[1, 1].scatter(y, z, s=circle_size, c=colors, cmap=cmap)
-        fig.colorbar(s1)
-
-        lns1, lns2, lns3 = self.compute_beam_line_segments()
-        ax[0, 0].add_collection(lns1)
-        ax[1, 0].add_collection(lns2)
-        ax[1, 1].add_collection(lns3)
+    def force_distribution_plot(self, data):
+        self._show_plot(data, "force")
 
-        plt.show()
+    def force_direction_plot(self, data):
+        self._show_plot(data, "force", arrows=True)
 
-    def force_distribution_plot(self, data):
-        sns.set_theme()  # Let seaborn apply better styling to all matplotlib graphs
-        fig, ax = plt.subplots(2, 2)
-        ax[0, 0].set_aspect("equal", adjustable="box")
-        ax[1, 0].set_aspect("equal", adjustable="box")
-        ax[1, 1].set_aspect("equal", adjustable="box")
-        ax[0, 0].set_xlim([-3, 3])
-        ax[1, 0].set_xlim([-3, 3])
-        ax[1, 1].set_xlim([-3, 3])
-        ax[0, 0].set_ylim([-3, 3])
-        ax[1, 0].set_ylim([-3, 3])
-        ax[1, 1].set_ylim([-3, 3])
-        ax[0, 0].set_title("Plan")
-        ax[0, 0].set_xlabel("x")
-        ax[0, 0].set_ylabel("y")
-        ax[1, 0].set_title("Front Elevation")
-        ax[1, 0].set_xlabel("x")
-        ax[1, 0].set_ylabel("z")
-        ax[1, 1].set_title("End Elevation")
-        ax[1, 1].set_xlabel("y")
-        ax[1, 1].set_ylabel("z")
-        ax[0, 1].axis("off")
+    def velocity_distribution_plot(self, data):
+        self._show_plot(data, "velocity")
 
-        x = []
-        y = []
-        z = []
-        colors = []
-        circle_size = 3.0
-        for i in range(len(data)):
-            node = data[i][Mesh.DATA_KEYS["pos"]]
-            x.append(node["x"])
-            y.append(node["y"])
-            z.append(node["z"])
-            force = data[i][Mesh.DATA_KEYS["force"]]
-            fx = force["x"]
-            fy = force["y"]
-            fz = force["z"]
-            colors.append(math.sqrt(fx * fx + fy * fy + fz * fz))
-
-        cmap = matplotlib.cm.viridis
-        s1 = ax[0, 0].scatter(x, y, s=circle_size, c=colors, cmap=cmap)
-        s2 = ax[1, 0].scatter(x, z, s=circle_size, c=colors, cmap=cmap)
-        s3 = ax[1, 1].scatter(y, z, s=circle_size, c=colors, cmap=cmap)
-        fig.colorbar(s1)
-
-        lns1, lns2, lns3 = self.compute_beam_line_segments()
-        ax[0, 0].add_collection(lns1)
-        ax[1, 0].add_collection(lns2)
-        ax[1, 1].add_collection(lns3)
+    def velocity_direction_plot(self, data):
+        self._show_plot(data, "velocity", arrows=True)
 
-        plt.show()
 
-    def force_direction_plot(self, data):
-        sns.set_theme()  # Let seaborn apply better styling to all matplotlib graphs
-        fig, ax = plt.subplots(2, 2)
-        ax[0, 0].set_aspect("equal", adjustable="box")
-        ax[1, 0].set_aspect("equal", adjustable="box")
-        ax[1, 1].set_aspect("equal", adjustable="box")
-        ax[0, 0].set_xlim([-3, 3])
-        ax[1, 0].set_xlim([-3, 3])
-        ax[1, 1].set_xlim([-3, 3])
-        ax[0, 0].set_ylim([-3, 3])
-        ax[1, 0].set_ylim([-3, 3])
-        ax[1, 1].set_ylim([-3, 3])
-        ax[0, 0].set_title("Plan")
-        ax[0, 0].set_xlabel("x")
-        ax[0, 0].set_ylabel("y")
-        ax[1, 0].set_title("Front Elevation")
-        ax[1, 0].set_xlabel("x")
-        ax[1, 0].set_ylabel("z")
-        ax[1, 1].set_title("End Elevation")
-        ax[1, 1].set_xlabel("y")
-        ax[1, 1].set_ylabel("z")
-        ax[0, 1].axis("off")
+class MeshPlot:
+    """
+    A plot of the readings of a :class:`Mesh` sensor in the plan, front elevation and end elevation views, which can be updated with
+    new readings in place, e.g. to animate the deformation of a vehicle. The nodes are drawn as points, coloured by the plotted quantity,
+    and the beams as lines.
 
-        x = []
-        y = []
-        z = []
-        colors = []
-        circle_size = 3.0
-        for i in range(len(data)):
-            node = data[i][Mesh.DATA_KEYS["pos"]]
-            x.append(node["x"])
-            y.append(node["y"])
-            z.append(node["z"])
-            force = data[i][Mesh.DATA_KEYS["force"]]
-            fx = force["x"]
-            fy = force["y"]
-            fz = force["z"]
-            mag = math.sqrt(fx * fx + fy * fy + fz * fz)
-            colors.append(mag)
-            fac = 1 / max(1, mag)
-            ax[0, 0].arrow(x[-1], y[-1], fx * fac, fy * fac, width=0.05, ec="red")
-            ax[1, 0].arrow(x[-1], z[-1], fx * fac, fz * fac, width=0.05, ec="red")
-            ax[1, 1].arrow(y[-1], z[-1], fy * fac, fz * fac, width=0.05, ec="red")
-
-        cmap = matplotlib.cm.viridis
-        s1 = ax[0, 0].scatter(x, y, s=circle_size, c=colors, cmap=cmap)
-        s2 = ax[1, 0].scatter(x, z, s=circle_size, c=colors, cmap=cmap)
-        s3 = ax[1, 1].scatter(y, z, s=circle_size, c=colors, cmap=cmap)
-        fig.colorbar(s1)
-
-        lns1, lns2, lns3 = self.compute_beam_line_segments()
-        ax[0, 0].add_collection(lns1)
-        ax[1, 0].add_collection(lns2)
-        ax[1, 1].add_collection(lns3)
+    Args:
+        kind: The plotted quantity, one of ``mesh`` (only the structure), ``mass``, ``force`` or ``velocity``.
+        arrows: Whether to draw the directions of the forces or velocities as arrows, scaled down to at most 1 m.
+        limit: The limit of the axes, in metres.
 
-        plt.show()
+    Example:
 
-    def velocity_distribution_plot(self, data):
-        sns.set_theme()  # Let seaborn apply better styling to all matplotlib graphs
-        fig, ax = plt.subplots(2, 2)
-        ax[0, 0].set_aspect("equal", adjustable="box")
-        ax[1, 0].set_aspect("equal", adjustable="box")
-        ax[1, 1].set_aspect("equal", adjustable="box")
-        ax[0, 0].set_xlim([-3, 3])
-        ax[1, 0].set_xlim([-3, 3])
-        ax[1, 1].set_xlim([-3, 3])
-        ax[0, 0].set_ylim([-3, 3])
-        ax[1, 0].set_ylim([-3, 3])
-        ax[1, 1].set_ylim([-3, 3])
-        ax[0, 0].set_title("Plan")
-        ax[0, 0].set_xlabel("x")
-        ax[0, 0].set_ylabel("y")
-        ax[1, 0].set_title("Front Elevation")
-        ax[1, 0].set_xlabel("x")
-        ax[1, 0].set_ylabel("z")
-        ax[1, 1].set_title("End Elevation")
-        ax[1, 1].set_xlabel("y")
-        ax[1, 1].set_ylabel("z")
-        ax[0, 1].axis("off")
+    .. code-block:: python
 
-        x = []
-        y = []
-        z = []
-        colors = []
-        circle_size = 3.0
-        for i in range(len(data)):
-            node = data[i][Mesh.DATA_KEYS["pos"]]
-            x.append(node["x"])
-            y.append(node["y"])
-            z.append(node["z"])
-            vel = data[i][Mesh.DATA_KEYS["vel"]]
-            vx = vel["x"]
-            vy = vel["y"]
-            vz = vel["z"]
-            colors.append(math.sqrt(vx * vx + vy * vy + vz * vz))
-
-        cmap = matplotlib.cm.viridis
-        s1 = ax[0, 0].scatter(x, y, s=circle_size, c=colors, cmap=cmap)
-        s2 = ax[1, 0].scatter(x, z, s=circle_size, c=colors, cmap=cmap)
-        s3 = ax[1, 1].scatter(y, z, s=circle_size, c=colors, cmap=cmap)
-        fig.colorbar(s1)
-
-        lns1, lns2, lns3 = self.compute_beam_line_segments()
-        ax[0, 0].add_collection(lns1)
-        ax[1, 0].add_collection(lns2)
-        ax[1, 1].add_collection(lns3)
+        plot = MeshPlot('force', arrows=True)
+        for _ in range(100):
+            bng.control.step(10)
+            plot.update(mesh.poll_arrays())
+            plt.pause(0.001)
+    """
 
-        plt.show()
+    BEAM_COLOUR = (0.3, 0.3, 0.3, 0.1)
+    VIEWS = (
+        ((0, 0), "Plan", (0, 1)),
+        ((1, 0), "Front Elevation", (0, 2)),
+        ((1, 1), "End Elevation", (1, 2)),
+    )
+
+    def __init__(self, kind: str = "mesh", arrows: bool = False, limit: float = 3.0):
+        if kind not in ("mesh", "mass", "force", "velocity"):
+            raise BNGValueError(f"Unknown kind of mesh plot: {kind}.")
+        if arrows and kind not in ("force", "velocity"):
+            raise BNGValueError(
+                "Only the forces and velocities can be drawn as arrows."
+            )
+        self.kind = kind
+        self.arrows = arrows
+
+        import matplotlib.pyplot as plt
+        import seaborn as sns
+        from matplotlib import collections as mc
 
-    def velocity_direction_plot(self, data):
         sns.set_theme()  # Let seaborn apply better styling to all matplotlib graphs
-        fig, ax = plt.subplots(2, 2)
-        ax[0, 0].set_aspect("equal", adjustable="box")
-        ax[1, 0].set_aspect("equal", adjustable="box")
-        ax[1, 1].set_aspect("equal", adjustable="box")
-        ax[0, 0].set_xlim([-3, 3])
-        ax[1, 0].set_xlim([-3, 3])
-        ax[1, 1].set_xlim([-3, 3])
-        ax[0, 0].set_ylim([-3, 3])
-        ax[1, 0].set_ylim([-3, 3])
-        ax[1, 1].set_ylim([-3, 3])
-        ax[0, 0].set_title("Plan")
-        ax[0, 0].set_xlabel("x")
-        ax[0, 0].set_ylabel("y")
-        ax[1, 0].set_title("Front Elevation")
-        ax[1, 0].set_xlabel("x")
-        ax[1, 0].set_ylabel("z")
-        ax[1, 1].set_title("End Elevation")
-        ax[1, 1].set_xlabel("y")
-        ax[1, 1].set_ylabel("z")
+        self.fig, ax = plt.subplots(2, 2)
+        self.axes = []
+        for position, title, coords in MeshPlot.VIEWS:
+            axis = ax[position]
+            axis.set_aspect("equal", adjustable="box")
+            axis.set_xlim([-limit, limit])
+            axis.set_ylim([-limit, limit])
+            axis.set_title(title)
+            axis.set_xlabel("xyz"[coords[0]])
+            axis.set_ylabel("xyz"[coords[1]])
+            self.axes.append(axis)
         ax[0, 1].axis("off")
 
-        x = []
-        y = []
-        z = []
-        colors = []
-        circle_size = 3.0
-        for i in range(len(data)):
-            node = data[i][Mesh.DATA_KEYS["pos"]]
-            x.append(node["x"])
-            y.append(node["y"])
-            z.append(node["z"])
-            vel = data[i][Mesh.DATA_KEYS["vel"]]
-            vx = vel["x"]
-            vy = vel["y"]
-            vz = vel["z"]
-            mag = math.sqrt(vx * vx + vy * vy + vz * vz)
-            colors.append(mag)
-            fac = 1 / max(1, mag)
-            ax[0, 0].arrow(x[-1], y[-1], vx * fac, vy * fac, width=0.05, ec="red")
-            ax[1, 0].arrow(x[-1], z[-1], vx * fac, vz * fac, width=0.05, ec="red")
-            ax[1, 1].arrow(y[-1], z[-1], vy * fac, vz * fac, width=0.05, ec="red")
-
-        cmap = matplotlib.cm.viridis
-        s1 = ax[0, 0].scatter(x, y, s=circle_size, c=colors, cmap=cmap)
-        s2 = ax[1, 0].scatter(x, z, s=circle_size, c=colors, cmap=cmap)
-        s3 = ax[1, 1].scatter(y, z, s=circle_size, c=colors, cmap=cmap)
-        fig.colorbar(s1)
-
-        lns1, lns2, lns3 = self.compute_beam_line_segments()
-        ax[0, 0].add_collection(lns1)
-        ax[1, 0].add_collection(lns2)
-        ax[1, 1].add_collection(lns3)
+        self._lines = [
+            axis.add_collection(
+                mc.LineCollection([], colors=MeshPlot.BEAM_COLOUR, linewidths=0.5)
+            )
+            for axis in self.axes
+        ]
+        self._points: List[Any] = []
+        self._quivers: List[Any] = []
+        self._colorbar = None
 
-        plt.show()
+    def update(self, readings: MeshArrays) -> None:
+        """
+        Updates the plot with the given readings, modifying the existing artists.
+
+        Args:
+            readings: The readings, as returned by :func:`Mesh.poll_arrays`.
+        """
+        pos = readings.pos
+        segments = pos[readings.beams]
+        values = None
+        vectors = None
+        if self.kind == "mass":
+            values = readings.mass
+        elif self.kind != "mesh":
+            vectors = readings.force if self.kind == "force" else readings.vel
+            values = np.linalg.norm(vectors, axis=1)
+
+        if not self._points:
+            style = (
+                dict(s=36.0, c="red")
+                if values is None
+                else dict(s=3.0, c=values, cmap="viridis")
+            )
+            self._points = [
+                axis.scatter(pos[:, coords[0]], pos[:, coords[1]], **style)
+                for axis, (_, _, coords) in zip(self.axes, MeshPlot.VIEWS)
+            ]
+
+        for i, (_, _, coords) in enumerate(MeshPlot.VIEWS):
+            self._lines[i].set_segments(segments[:, :, coords])
+            self._points[i].set_offsets(pos[:, coords])
+            if values is not None:
+                self._points[i].set_array(values)
+                if len(values):
+                    self._points[i].set_clim(values.min(), values.max())
+
+        if values is not None and self._colorbar is None:
+            self._colorbar = self.fig.colorbar(self._points[0])
+        if self.arrows and vectors is not None:
+            self._update_arrows(pos, vectors, values)
+        self.fig.canvas.draw_idle()
+
+    def _update_arrows(
+        self, pos: np.ndarray, vectors: np.ndarray, magnitudes: np.ndarray
+    ) -> None:
+        arrows = vectors / np.maximum(1.0, magnitudes)[:, None]
+        if self._quivers and self._quivers[0].N != len(pos):
+            for quiver in self._quivers:
+                quiver.remove()
+            self._quivers = []
+        for i, (_, _, coords) in enumerate(MeshPlot.VIEWS):
+            x, y = pos[:, coords[0]], pos[:, coords[1]]
+            u, v = arrows[:, coords[0]], arrows[:, coords[1]]
+            if len(self._quivers) <= i:
+                self._quivers.append(
+                    self.axes[i].quiver(
+                        x, y, u, v, angles="xy", scale_units="xy", scale=1, color="red"
+                    )
+                )
+            else:
+                self._quivers[i].set_offsets(pos[:, coords])
+                self._quivers[i].set_UVC(u, v)
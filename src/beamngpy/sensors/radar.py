@@ -1,7 +1,7 @@
 from __future__ import annotations
 
 from logging import DEBUG, getLogger
-from typing import TYPE_CHECKING
+from typing import TYPE_CHECKING, NamedTuple
 
 from beamngpy.connection import CommBase
 from beamngpy.logging import LOGGER_ID
@@ -11,15 +11,36 @@ if TYPE_CHECKING:
     from beamngpy.beamng import BeamNGpy
     from beamngpy.vehicle import Vehicle
 
-import math
 import struct
 
-import matplotlib.pyplot as plt
 import numpy as np
 
-from beamngpy.sensors.shmem import BNGSharedMemory
+from beamngpy.sensors.shmem import (
+    BNGSharedMemory,
+    FrameHeader,
+    SharedMemoryFrame,
+)
 
-__all__ = ["Radar"]
+__all__ = ["Radar", "RadarBins"]
+
+
+class RadarBins(NamedTuple):
+    """
+    The RADAR readings binned into a (range, azimuth) grid by :func:`Radar.bin_readings`. All the grids have the
+    shape ``(range_bins + 1, azimuth_bins + 1)``, the rows being the range bins from ``range_min``, the columns the
+    azimuth bins from the left edge of the field of view.
+
+    Attributes:
+        velocity: The average weighted Doppler velocity of each bin (the B-scope image).
+        rcs: The average weighted radar cross section of each bin, in dB.
+        snr: The average weighted signal-to-noise ratio of each bin, in dB.
+        tally: The number of readings in each bin.
+    """
+
+    velocity: np.ndarray
+    rcs: np.ndarray
+    snr: np.ndarray
+    tally: np.ndarray
 
 
 class Radar(CommBase):
@@ -62,6 +83,8 @@ class Radar(CommBase):
         is_snapping_desired: A flag which indicates whether or not to snap the sensor to the nearest vehicle triangle (not used for static sensors).
         is_force_inside_triangle: A flag which indicates if the sensor should be forced inside the nearest vehicle triangle (not used for static sensors).
         is_dir_world_space: Flag which indicates if the direction is provided in world-space coordinates (True), or the default vehicle space (False).
+        stream_slots: The number of frames kept in the shared memory of a streaming sensor. With more than one slot, the newest frame can be read
+                      while the next one is written. The frames are read without tearing if the simulator supports the :class:`.FrameHeader`.
     """
 
     def __init__(
@@ -97,6 +120,7 @@ class Radar(CommBase):
         is_snapping_desired: bool = False,
         is_force_inside_triangle: bool = False,
         is_dir_world_space: bool = False,
+        stream_slots: int = 1,
     ):
         super().__init__(bng, vehicle)
 
@@ -106,14 +130,17 @@ class Radar(CommBase):
         # Cache some properties we will need later.
         self.name = name
 
-        # Shared memory for velocity data streaming.
-        self.shmem_size = 1000 * 1000 * 4
+        # Shared memory for velocity data streaming. The PPI and range-Doppler images have 4 bytes
+        # per bin, both buffers share the size of the larger one.
+        self.shmem_size = 4 * range_bins * max(azimuth_bins, vel_bins)
         self.shmem: BNGSharedMemory | None = None
         self.shmem2: BNGSharedMemory | None = None
+        self.frame_header: FrameHeader | None = None
+        self.last_frame: SharedMemoryFrame | None = None
         if is_streaming:
-            self.shmem_size = 1000 * 1000 * 4
-            self.shmem = BNGSharedMemory(self.shmem_size)
-            self.shmem2 = BNGSharedMemory(self.shmem_size)
+            self.shmem = BNGSharedMemory(self.shmem_size * stream_slots)
+            self.shmem2 = BNGSharedMemory(self.shmem_size * stream_slots)
+            self.frame_header = FrameHeader(stream_slots)
 
         # Create and initialise this sensor in the simulation.
         self._open_radar(
@@ -150,6 +177,7 @@ class Radar(CommBase):
             is_snapping_desired,
             is_force_inside_triangle,
             is_dir_world_space,
+            self.frame_header,
         )
         self.logger.debug("RADAR - sensor created: " f"{self.name}")
 
@@ -167,6 +195,8 @@ class Radar(CommBase):
         """
         # Remove this sensor from the simulation.
         self._close_radar()
+        if self.frame_header:
+            self.frame_header.try_close()
         self.logger.debug("RADAR - sensor removed: " f"{self.name}")
 
     def poll(self):
@@ -219,7 +249,7 @@ class Radar(CommBase):
         Returns:
             The latest RADAR PPI image from shared memory.
         """
-        return np.frombuffer(self.shmem.read(self.shmem_size), dtype=np.uint8)
+        return self._read_stream(self.shmem)
 
     def stream_range_doppler(self):
         """
@@ -228,7 +258,22 @@ class Radar(CommBase):
         Returns:
             The latest RADAR Range-Doppler image from shared memory.
         """
-        return np.frombuffer(self.shmem2.read(self.shmem_size), dtype=np.uint8)
+        return self._read_stream(self.shmem2)
+
+    def _read_stream(self, shmem: BNGSharedMemory | None) -> np.ndarray:
+        """
+        Reads the newest streamed image from the given shared memory, without tearing if the simulator
+        writes the frames with a :class:`.FrameHeader`.
+        """
+        assert shmem
+        if self.frame_header and self.frame_header.is_active():
+            result = self.frame_header.read(
+                lambda frame: bytes(shmem.read_slot(frame.slot, self.shmem_size))
+            )
+            if result is not None:
+                self.last_frame, data = result
+                return np.frombuffer(data, dtype=np.uint8)
+        return np.frombuffer(shmem.read(self.shmem_size), dtype=np.uint8)
 
     def send_ad_hoc_poll_request(self) -> int:
         """
@@ -408,6 +453,7 @@ class Radar(CommBase):
         is_snapping_desired: bool,
         is_force_inside_triangle: bool,
         is_dir_world_space: bool,
+        frame_header: FrameHeader | None,
     ) -> None:
 
         data: StrDict = dict()
@@ -446,6 +492,8 @@ class Radar(CommBase):
         data["isSnappingDesired"] = is_snapping_desired
         data["isForceInsideTriangle"] = is_force_inside_triangle
         data["isDirWorldSpace"] = is_dir_world_space
+        if frame_header:
+            data.update(frame_header.request_fields())
 
         self.send_ack_ge(type="OpenRadar", ack="OpenedRadar", **data)
         self.logger.info(f'Opened RADAR sensor: "{name}"')
@@ -454,6 +502,66 @@ class Radar(CommBase):
         self.send_ack_ge(type="CloseRadar", ack="ClosedRadar", name=self.name)
         self.logger.info(f'Closed RADAR sensor: "{self.name}"')
 
+    @staticmethod
+    def bin_readings(
+        readings_data: np.ndarray,
+        resolution: Int2,
+        field_of_view_y: float,
+        range_min: float,
+        range_max: float,
+        range_bins: int = 200,
+        azimuth_bins: int = 200,
+    ) -> RadarBins:
+        """
+        Bins the RADAR readings into a (range, azimuth) grid, which is what :func:`plot_data` displays. Each bin contains the
+        weighted average of the readings at its location. The readings outside of the given distance/angle ranges are snapped
+        to the nearest edge bin.
+
+        Args:
+            readings_data: The readings data obtained from polling the RADAR sensor.
+            resolution: (X, Y) The resolution of the sensor (the size of the depth buffer image in the distance measurement computation).
+            field_of_view_y: The vertical field of view of the RADAR, in degrees.
+            range_min: The minimum range of the sensor, in metres.
+            range_max: The maximum range of the sensor, in metres.
+            range_bins: The number of bins to use for the range dimension.
+            azimuth_bins: The number of bins to use for the azimuth dimension.
+
+        Returns:
+            The binned velocity, RCS and SNR grids and the number of readings per bin.
+        """
+        readings_data = np.asarray(readings_data, dtype=np.float64).reshape((-1, 7))
+        rows = range_bins + 1
+        cols = azimuth_bins + 1
+        fov_rad = np.deg2rad((resolution[0] / float(resolution[1])) * field_of_view_y)
+        min_az_rad = -fov_rad / 2
+        range_size = range_max - range_min
+
+        # Find the 2D bin index (distance, azimuth) of each reading.
+        a = np.floor(((readings_data[:, 2] - min_az_rad) / fov_rad) * azimuth_bins)
+        d = np.floor(((readings_data[:, 0] - range_min) / range_size) * range_bins)
+        a = np.clip(a, 0, azimuth_bins).astype(np.intp)
+        d = np.clip(d, 0, range_bins).astype(np.intp)
+        index = d * cols + a
+
+        # Sum the weighted doppler velocity, RCS and SNR values (the latter two in dB) in the bins, then average them.
+        weight = readings_data[:, 6]
+        tally = np.bincount(index, minlength=rows * cols).astype(np.float64)
+        sums = [
+            np.bincount(index, values * weight, minlength=rows * cols)
+            for values in (
+                readings_data[:, 1],
+                10.0 * np.log10(readings_data[:, 4]),
+                10.0 * np.log10(readings_data[:, 5]),
+            )
+        ]
+        tally_reciprocal = np.divide(
+            1.0, tally, out=np.zeros_like(tally), where=tally > 0.0
+        )
+        velocity, rcs, snr = (
+            (values * tally_reciprocal).reshape((rows, cols)) for values in sums
+        )
+        return RadarBins(velocity, rcs, snr, tally.reshape((rows, cols)))
+
     def plot_data(
         self,
         readings_data,
@@ -480,62 +588,22 @@ class Radar(CommBase):
             range_bins: The number of bins to use for the range dimension, in the data plots.
             azimuth_bins: The number of bins to use for the azimuth dimension, in the data plots.
         """
+        import matplotlib.pyplot as plt
 
-        # Iterate over all RADAR readings, and populate the data into bins.
-        rows = range_bins + 1
-        cols = azimuth_bins + 1
-        velocity_bins = np.zeros(
-            [rows, cols]
-        )  # Stores the sum of the Doppler velocities for each bin.
-        RCS_bins = np.zeros([rows, cols])  # Stores the sum of RCS for each bin.
-        SNR_bins = np.zeros([rows, cols])  # Stores the sum of SNR for each bin.
-        tally_bins = np.zeros(
-            [rows, cols]
-        )  # Counts the number of entries for each bin.
+        bins = self.bin_readings(
+            readings_data,
+            resolution,
+            field_of_view_y,
+            range_min,
+            range_max,
+            range_bins,
+            azimuth_bins,
+        )
+        velocity_bins, RCS_bins, SNR_bins = bins.velocity, bins.rcs, bins.snr
         fov_azimuth = (resolution[0] / float(resolution[1])) * field_of_view_y
         fov_rad = np.deg2rad(fov_azimuth)
         max_az_rad = fov_rad / 2
         min_az_rad = -max_az_rad
-        range_size = range_max - range_min
-        for i in range(len(readings_data)):
-
-            # Find the appropriate 2D bin index (distance, azimuth) for this reading.
-            a = int(
-                math.floor(
-                    ((readings_data[i][2] - min_az_rad) / fov_rad) * azimuth_bins
-                )
-            )
-            d = int(
-                math.floor(
-                    ((readings_data[i][0] - range_min) / range_size) * range_bins
-                )
-            )
-            # Safety: if any data is outside the range of the bins, snap it to the nearest edge bin.
-            d = max(0, min(range_bins, d))
-
-            # For the appropriate bin, increment its number of entries for later averaging purposes.
-            tally_bins[d, a] = tally_bins[d, a] + 1
-
-            # Add the weighted doppler velocity, weighted RCS, and weighted SNR values to the appropriate bins.
-            weight = readings_data[i][6]
-            velocity_bins[d, a] = velocity_bins[d, a] + readings_data[i][1] * weight
-            # We convert to dB scale.
-            RCS_bins[d, a] = (
-                RCS_bins[d, a] + (10.0 * math.log10(readings_data[i][4])) * weight
-            )
-            # We convert to dB scale.
-            SNR_bins[d, a] = (
-                SNR_bins[d, a] + (10.0 * math.log10(readings_data[i][5])) * weight
-            )
-
-        # Iterate over all bins and perform the averaging.
-        for r in range(rows):
-            for c in range(cols):
-                if tally_bins[r, c] > 0.0:
-                    tally_reciprocal = 1.0 / tally_bins[r, c]
-                    velocity_bins[r, c] = velocity_bins[r, c] * tally_reciprocal
-                    RCS_bins[r, c] = RCS_bins[r, c] * tally_reciprocal
-                    SNR_bins[r, c] = SNR_bins[r, c] * tally_reciprocal
 
         # Create the B-Scope Plot.
         fig, ax = plt.subplots(2, 2, figsize=(15, 15))
@@ -608,6 +676,7 @@ class Radar(CommBase):
             range_bins: The number of bins to use for the range dimension, in the data plots.
             azimuth_bins: The number of bins to use for the azimuth dimension, in the data plots.
         """
+        import matplotlib.pyplot as plt
 
         fov_azimuth = (resolution[0] / float(resolution[1])) * field_of_view_y
         half_fov_azimuth = fov_azimuth * 0.5
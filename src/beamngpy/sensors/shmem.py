@@ -1,11 +1,16 @@
 from __future__ import annotations
 
-from beamngpy.logging import bngpy_logger
+from beamngpy.logging import BNGError, bngpy_logger
 
+from contextlib import contextmanager
 from multiprocessing import resource_tracker as rt
 from multiprocessing import shared_memory as shm
+import struct
 import sys
 import threading
+from typing import Callable, Iterator, NamedTuple, Tuple, TypeVar
+
+T = TypeVar("T")
 
 if sys.version_info >= (3, 13):
     SharedMemory = shm.SharedMemory
@@ -52,13 +57,192 @@ class BNGSharedMemory(SharedMemory):
     def read(self, size: int | None = None) -> memoryview:
         return self.buf[:size]
 
-    def try_close(self):
+    def read_slot(self, slot: int, slot_size: int, size: int | None = None) -> memoryview:
+        """
+        Returns a view of the given slot of a shared memory divided into slots of ``slot_size`` bytes,
+        limited to its first ``size`` bytes if set.
+        """
+        start = slot * slot_size
+        return self.buf[start : start + (slot_size if size is None else size)]
+
+    def try_close(self, warn: bool = True) -> bool:
+        """
+        Closes the shared memory, unless it is still referenced by views of it (e.g. NumPy arrays
+        created over its buffer), in which case it stays open and can be closed later.
+
+        Args:
+            warn: Whether to log a warning if the shared memory cannot be closed.
+
+        Returns:
+            Whether the shared memory is closed.
+        """
         if not self._closed:
             try:
                 self.close()
                 self._closed = True
             except Exception as e:
-                bngpy_logger.warning(f"Cannot close shared memory. Original error: {e}")
+                if warn:
+                    bngpy_logger.warning(f"Cannot close shared memory. Original error: {e}")
+        return self._closed
 
     def __del__(self):
         self.try_close()
+
+
+class SharedMemoryFrame(NamedTuple):
+    """
+    The description of a frame written into the shared memory of a streaming sensor.
+
+    Attributes:
+        frame: The frame number, increasing with each written frame and starting from 1.
+        timestamp: The time at which the frame was written, in seconds of simulation time.
+        count: A sensor-specific size of the data, e.g. the number of points of a LiDAR point cloud.
+        slot: The slot of the shared memory buffers containing the frame.
+    """
+
+    frame: int
+    timestamp: float
+    count: int
+    slot: int
+
+
+class FrameHeader:
+    """
+    A shared memory segment describing the frames that a streaming sensor writes into its shared memory
+    buffers, allowing them to be read without tearing. The buffers are divided into ``slots`` slots, used
+    as a ring, and the header contains a seqlock record for each of the slots: the sequence number, the
+    frame number, the timestamp and a sensor-specific count, each 8 bytes long (little-endian ``uint64``,
+    ``uint64``, ``double``, ``uint64``).
+
+    The writer increments the sequence number of a slot to an odd value, writes the buffers, the frame
+    number, the timestamp and the count, and increments the sequence number to an even value again. The
+    readers take the slot with the newest frame, copy its data and check that its sequence number did not
+    change in the meantime, otherwise they retry. With more than one slot, the writer does not overwrite
+    the newest frame while writing the next one, so the readers rarely have to retry.
+
+    The header is negotiated by sending :func:`request_fields` in the request opening the sensor. The
+    simulator versions not supporting it leave the sequence numbers at zero and write into the first slot
+    as before, in which case :func:`is_active` is False and the buffers are read directly.
+
+    Args:
+        slots: The number of the slots of the shared memory buffers.
+        name: The name of an existing header to attach to, used by the writers. If None, a new header is created.
+    """
+
+    RECORD = struct.Struct("<QQdQ")
+    MAX_READ_TRIES = 1000
+
+    def __init__(self, slots: int = 1, name: str | None = None):
+        if slots < 1:
+            raise BNGError("The number of shared memory slots must be positive.")
+        self.slots = slots
+        if name is None:
+            self.shmem: SharedMemory = BNGSharedMemory(self.RECORD.size * slots)
+        else:
+            self.shmem = SharedMemory(name=name, track=False)
+        self._active = False
+
+    @property
+    def name(self) -> str:
+        return self.shmem.name
+
+    def request_fields(self) -> dict:
+        """
+        Returns the fields to add to the request opening the sensor to enable the header.
+        """
+        return dict(
+            frameHeaderShmemHandle=self.shmem.name,
+            frameHeaderShmemSize=self.shmem.size,
+            shmemSlots=self.slots,
+        )
+
+    def _record(self, slot: int) -> Tuple[int, int, float, int]:
+        return self.RECORD.unpack_from(self.shmem.buf, slot * self.RECORD.size)
+
+    def is_active(self) -> bool:
+        """
+        Whether the simulator writes the header, i.e. whether any frame was written with it.
+        """
+        if not self._active:
+            self._active = any(self._record(slot)[0] for slot in range(self.slots))
+        return self._active
+
+    def latest(self) -> SharedMemoryFrame | None:
+        """
+        Returns the newest frame which is fully written, or None if there is none.
+        """
+        latest: SharedMemoryFrame | None = None
+        for slot in range(self.slots):
+            sequence, frame, timestamp, count = self._record(slot)
+            if sequence % 2 or not sequence:
+                continue
+            if latest is None or frame > latest.frame:
+                latest = SharedMemoryFrame(frame, timestamp, count, slot)
+        return latest
+
+    def is_current(self, frame: SharedMemoryFrame) -> bool:
+        """
+        Whether the slot of the given frame still contains it, completely written, i.e. whether the data read
+        from the slot without copying is still valid.
+
+        Args:
+            frame: The frame, as returned by :func:`latest`.
+        """
+        sequence, number, _, _ = self._record(frame.slot)
+        return sequence % 2 == 0 and number == frame.frame
+
+    def read(
+        self, copy_slot: Callable[[SharedMemoryFrame], T]
+    ) -> Tuple[SharedMemoryFrame, T] | None:
+        """
+        Reads the newest frame without tearing.
+
+        Args:
+            copy_slot: A function copying the data of the given frame out of the shared memory buffers.
+
+        Returns:
+            The frame and the copied data, or None if no frame was written yet.
+        """
+        for _ in range(self.MAX_READ_TRIES):
+            frame = self.latest()
+            if frame is None:
+                return None
+            sequence = self._record(frame.slot)[0]
+            if sequence % 2:
+                continue
+            data = copy_slot(frame)
+            record = (sequence, frame.frame, frame.timestamp, frame.count)
+            if self._record(frame.slot) == record:
+                return frame, data
+        raise BNGError(
+            "Could not read a consistent frame from the shared memory, "
+            "consider using more slots for the sensor."
+        )
+
+    @contextmanager
+    def write(self, frame: int, timestamp: float, count: int = 0) -> Iterator[int]:
+        """
+        A context manager for writing a frame, used by the simulator side of the protocol. The buffers
+        are to be written inside of the context into the slot it yields.
+
+        Args:
+            frame: The frame number, which must increase with each frame.
+            timestamp: The time of the frame.
+            count: The sensor-specific size of the data.
+        """
+        slot = frame % self.slots
+        offset = slot * self.RECORD.size
+        sequence = self._record(slot)[0]
+        struct.pack_into("<Q", self.shmem.buf, offset, sequence + 1)
+        try:
+            yield slot
+        finally:
+            self.RECORD.pack_into(
+                self.shmem.buf, offset, sequence + 2, frame, timestamp, count
+            )
+
+    def try_close(self, warn: bool = True) -> bool:
+        if isinstance(self.shmem, BNGSharedMemory):
+            return self.shmem.try_close(warn)
+        self.shmem.close()
+        return True
@@ -8,7 +8,11 @@ from beamngpy.logging import LOGGER_ID
 from beamngpy.types import Float2, Float3, Int2, StrDict
 import numpy as np
 
-from beamngpy.sensors.shmem import BNGSharedMemory
+from beamngpy.sensors.shmem import (
+    BNGSharedMemory,
+    FrameHeader,
+    SharedMemoryFrame,
+)
 
 if TYPE_CHECKING:
     from beamngpy.beamng import BeamNGpy
@@ -51,6 +55,8 @@ class Ultrasonic(CommBase):
         is_snapping_desired: A flag which indicates whether or not to snap the sensor to the nearest vehicle triangle (not used for static sensors).
         is_force_inside_triangle: A flag which indicates if the sensor should be forced inside the nearest vehicle triangle (not used for static sensors).
         is_dir_world_space: Flag which indicates if the direction is provided in world-space coordinates (True), or the default vehicle space (False).
+        stream_slots: The number of frames kept in the shared memory of a streaming sensor. With more than one slot, the newest frame can be read
+                      while the next one is written. The frames are read without tearing if the simulator supports the :class:`.FrameHeader`.
     """
 
     def __init__(
@@ -80,6 +86,7 @@ class Ultrasonic(CommBase):
         is_snapping_desired: bool = False,
         is_force_inside_triangle: bool = False,
         is_dir_world_space: bool = False,
+        stream_slots: int = 1,
     ):
         super().__init__(bng, vehicle)
 
@@ -93,9 +100,12 @@ class Ultrasonic(CommBase):
         # Shared memory for velocity data streaming.
         self.shmem_size = None
         self.shmem = None
+        self.frame_header: FrameHeader | None = None
+        self.last_frame: SharedMemoryFrame | None = None
         if is_streaming == True:
             self.shmem_size = 4
-            self.shmem = BNGSharedMemory(self.shmem_size)
+            self.shmem = BNGSharedMemory(self.shmem_size * stream_slots)
+            self.frame_header = FrameHeader(stream_slots)
 
         # Create and initialise this sensor in the simulation.
         self._open_ultrasonic(
@@ -125,6 +135,7 @@ class Ultrasonic(CommBase):
             is_snapping_desired,
             is_force_inside_triangle,
             is_dir_world_space,
+            self.frame_header,
         )
         self.logger.debug("Ultrasonic - sensor created: " f"{self.name}")
 
@@ -134,6 +145,8 @@ class Ultrasonic(CommBase):
         """
         # Remove this sensor from the simulation.
         self._close_ultrasonic()
+        if self.frame_header:
+            self.frame_header.try_close()
         self.logger.debug("Ultrasonic - sensor removed: " f"{self.name}")
 
     def poll(self) -> StrDict:
@@ -165,6 +178,14 @@ class Ultrasonic(CommBase):
         Returns:
             The latest Ultrasonic distance reading from shared memory.
         """
+        if self.frame_header and self.frame_header.is_active():
+            shmem, size = self.shmem, self.shmem_size
+            result = self.frame_header.read(
+                lambda frame: bytes(shmem.read_slot(frame.slot, size))
+            )
+            if result is not None:
+                self.last_frame, data = result
+                return np.frombuffer(data, dtype=np.float32)
         return np.frombuffer(self.shmem.read(self.shmem_size), dtype=np.float32)
 
     def send_ad_hoc_poll_request(self) -> int:
@@ -367,6 +388,7 @@ class Ultrasonic(CommBase):
         is_snapping_desired: bool,
         is_force_inside_triangle: bool,
         is_dir_world_space: bool,
+        frame_header: FrameHeader | None,
     ) -> None:
         data: StrDict = dict()
         data["name"] = name
@@ -397,6 +419,8 @@ class Ultrasonic(CommBase):
         data["isSnappingDesired"] = is_snapping_desired
         data["isForceInsideTriangle"] = is_force_inside_triangle
         data["isDirWorldSpace"] = is_dir_world_space
+        if frame_header:
+            data.update(frame_header.request_fields())
 
         self.send_ack_ge("OpenUltrasonic", ack="OpenedUltrasonic", **data)
         self.logger.info(f'Opened ultrasonic sensor: "{name}"')
@@ -15,17 +15,7 @@ import csv
 import math
 from datetime import datetime
 
-import matplotlib.pyplot as plt
 import numpy as np
-import seaborn as sns
-
-pypdf_installed = False
-try:
-    from PyPDF2 import PdfMerger, PdfReader
-
-    pypdf_installed = True
-except ImportError:
-    pypdf_installed = False
 
 __all__ = ["VehicleFeeder"]
 
@@ -420,6 +410,9 @@ class VehicleFeeder(CommBase):
         return ourData
 
     def saveBothTrajectories(self, dTheirs, dOurs, theirData):
+        import matplotlib.pyplot as plt
+        import seaborn as sns
+
         sns.set_theme()  # Let seaborn apply better styling to all matplotlib graphs
         # for flipping the plot in x and/or y.
         dff = [x * 1 for x in dOurs[0]]
@@ -514,6 +507,9 @@ class VehicleFeeder(CommBase):
         plt.savefig("trajectory.pdf")
 
     def plotSTWAMapping(self, xx, theirSTWAFL, ourSTWAFL, theirSTWAFR, ourSTWAFR):
+        import matplotlib.pyplot as plt
+        import seaborn as sns
+
         sns.set_theme()  # Let seaborn apply better styling to all matplotlib graphs
         fig, ax = plt.subplots(2, 1, figsize=(15, 15))
 
@@ -532,6 +528,9 @@ class VehicleFeeder(CommBase):
         plt.show()
 
     def saveData(self, dTheirs, dOurs):
+        import matplotlib.pyplot as plt
+        import seaborn as sns
+
         sns.set_theme()  # Let seaborn apply better styling to all matplotlib graphs
         tTheirs = dTheirs["t"]
         tOurs = dOurs["t"]
@@ -1072,7 +1071,9 @@ class VehicleFeeder(CommBase):
 
         self.saveData(theirData, ourData)
 
-        if not pypdf_installed:
+        try:
+            from PyPDF2 import PdfMerger, PdfReader
+        except ImportError:
             create_warning(
                 "The `PyPDF2` package is not installed. PDFs will not be produced. You can install it using `pip install PyPDF2`."
             )
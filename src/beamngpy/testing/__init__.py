@@ -0,0 +1,14 @@
+from .capture import CaptureRecord, CaptureRecorder, read_capture, record_session
+from .mock import MockSimulator
+from .replay import ReplayServer
+from .server import ProtocolServer
+
+__all__ = [
+    "CaptureRecord",
+    "CaptureRecorder",
+    "MockSimulator",
+    "ProtocolServer",
+    "ReplayServer",
+    "read_capture",
+    "record_session",
+]
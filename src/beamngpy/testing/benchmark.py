@@ -0,0 +1,444 @@
+"""
+Offline benchmarks of the hot paths of BeamNGpy, which do not need a running simulator. The sensors
+are benchmarked against a :class:`.MockSimulator`. The results are emitted as JSON, so that they can
+be compared across releases.
+
+Run with::
+
+    python -m beamngpy.testing.benchmark --output results.json
+
+See ``python -m beamngpy.testing.benchmark --help`` for the options.
+"""
+
+from __future__ import annotations
+
+import argparse
+import json
+import platform
+import statistics
+import subprocess
+import sys
+import timeit
+from datetime import datetime, timezone
+from glob import glob
+from pathlib import Path
+from typing import Any, Callable, Dict, Iterable, List, NamedTuple, Sequence
+
+import numpy as np
+
+from beamngpy.types import StrDict
+
+__all__ = ["BenchmarkResult", "run_benchmarks", "main"]
+
+BENCHMARKS = ["import", "prefab", "protocol", "camera", "lidar", "bbox", "opendrive"]
+
+_IMPORT_SCRIPT = """
+import json, os, sys, time
+try:
+    import resource
+except ImportError:
+    resource = None
+
+def rss():
+    # the current resident set size on Linux, the peak one elsewhere
+    try:
+        with open("/proc/self/statm") as statm:
+            return int(statm.read().split()[1]) * os.sysconf("SC_PAGE_SIZE")
+    except OSError:
+        pass
+    if resource is None:
+        return None
+    rss = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    return rss if sys.platform == "darwin" else rss * 1024
+
+rss_before = rss()
+start = time.perf_counter()
+import beamngpy
+elapsed = time.perf_counter() - start
+rss_after = rss()
+print(json.dumps(dict(
+    time=elapsed,
+    rss=rss_after,
+    rss_delta=None if rss_before is None else rss_after - rss_before,
+    modules=len(sys.modules),
+)))
+"""
+
+
+class BenchmarkResult(NamedTuple):
+    """
+    The timings of a single benchmark. All the times are in seconds, per call of the benchmarked function.
+
+    Attributes:
+        name: The name of the benchmark.
+        params: The parameters of the benchmark, e.g. the size of its input.
+        runs: The number of timed runs.
+        number: The number of calls per run.
+        best: The time of the fastest run.
+        median: The median time of the runs.
+        mean: The mean time of the runs.
+        extra: Additional measurements of the benchmark, e.g. the memory usage.
+    """
+
+    name: str
+    params: StrDict
+    runs: int
+    number: int
+    best: float
+    median: float
+    mean: float
+    extra: StrDict
+
+    def to_dict(self) -> StrDict:
+        return self._asdict()
+
+
+def _measure(
+    name: str,
+    func: Callable[[], Any],
+    repeat: int,
+    params: StrDict | None = None,
+    extra: StrDict | None = None,
+) -> BenchmarkResult:
+    """
+    Times the given function, calling it enough times per run for the run to take at least 0.2 seconds.
+    """
+    timer = timeit.Timer(func)
+    number, _ = timer.autorange()
+    times = [time / number for time in timer.repeat(repeat, number)]
+    return BenchmarkResult(
+        name=name,
+        params=params or {},
+        runs=len(times),
+        number=number,
+        best=min(times),
+        median=statistics.median(times),
+        mean=statistics.fmean(times),
+        extra=extra or {},
+    )
+
+
+def _from_samples(
+    name: str, samples: Sequence[float], params: StrDict | None = None, extra: StrDict | None = None
+) -> BenchmarkResult:
+    return BenchmarkResult(
+        name=name,
+        params=params or {},
+        runs=len(samples),
+        number=1,
+        best=min(samples),
+        median=statistics.median(samples),
+        mean=statistics.fmean(samples),
+        extra=extra or {},
+    )
+
+
+def bench_import(repeat: int) -> List[BenchmarkResult]:
+    """
+    Measures the time and memory of importing BeamNGpy in a fresh interpreter.
+    """
+    samples = []
+    for _ in range(repeat):
+        output = subprocess.run(
+            [sys.executable, "-c", _IMPORT_SCRIPT],
+            capture_output=True,
+            text=True,
+            check=True,
+        ).stdout
+        samples.append(json.loads(output))
+    return [
+        _from_samples(
+            "import",
+            [sample["time"] for sample in samples],
+            extra=dict(
+                rss=samples[-1]["rss"],
+                rss_delta=samples[-1]["rss_delta"],
+                modules=samples[-1]["modules"],
+            ),
+        )
+    ]
+
+
+def bench_prefab(repeat: int, sizes: Iterable[int] = (10, 100, 1000)) -> List[BenchmarkResult]:
+    """
+    Measures the generation of the prefab of scenarios with the given numbers of objects.
+    """
+    from beamngpy import Scenario, ScenarioObject, Vehicle
+
+    results = []
+    for size in sizes:
+        scenario = Scenario("tech_ground", f"benchmark_{size}")
+        scenario.add_vehicle(Vehicle("ego", model="etk800"), pos=(0, 0, 0))
+        for i in range(size):
+            scenario.add_object(
+                ScenarioObject(
+                    oid=f"object_{i}",
+                    name=f"object_{i}",
+                    otype="TSStatic",
+                    pos=(i, 0, 0),
+                    scale=(1, 1, 1),
+                    rot_quat=(0, 0, 0, 1),
+                    shapeName="/levels/tech_ground/art/shapes/cone.dae",
+                )
+            )
+        results.append(
+            _measure("prefab", scenario._get_prefab, repeat, dict(objects=size))
+        )
+    return results
+
+
+def _protocol_payloads() -> Dict[str, StrDict]:
+    vehicle_state = dict(
+        pos=[1.0, 2.0, 3.0],
+        dir=[1.0, 0.0, 0.0],
+        up=[0.0, 0.0, 1.0],
+        vel=[10.0, 0.0, 0.0],
+        rotation=[0.0, 0.0, 0.0, 1.0],
+    )
+    return dict(
+        control=dict(type="Control", steering=0.1, throttle=0.5, brake=0.0),
+        sensors=dict(
+            type="SensorData",
+            data={
+                f"{vehicle}:{sensor}": dict(state=vehicle_state, time=1.0)
+                for vehicle in range(20)
+                for sensor in ("state", "timer")
+            },
+        ),
+        camera=dict(
+            type="PollCamera",
+            data=dict(
+                colour=bytes(1280 * 720 * 3),
+                annotation=bytes(1280 * 720 * 3 + 1),
+                depth=bytes(1280 * 720),
+            ),
+        ),
+    )
+
+
+def bench_protocol(repeat: int) -> List[BenchmarkResult]:
+    """
+    Measures the encoding and decoding of representative messages.
+    """
+    from beamngpy.connection import Connection
+
+    connection = Connection("127.0.0.1")
+    results = []
+    for name, payload in _protocol_payloads().items():
+        _, packed = connection._pack_data(dict(payload))
+        params = dict(payload=name, bytes=len(packed))
+        results.append(
+            _measure(
+                "protocol.pack",
+                lambda: connection._pack_data(dict(payload)),
+                repeat,
+                params,
+            )
+        )
+        results.append(
+            _measure(
+                "protocol.unpack",
+                lambda: connection._unpack_data(packed),
+                repeat,
+                params,
+            )
+        )
+    return results
+
+
+def bench_sensors(repeat: int, names: Iterable[str]) -> List[BenchmarkResult]:
+    """
+    Measures the decoding of the camera and LiDAR readings, as received from a :class:`.MockSimulator`.
+    """
+    from beamngpy import BeamNGpy
+    from beamngpy.sensors import Camera, Lidar
+
+    from .mock import MockSimulator
+
+    results = []
+    with MockSimulator(lidar_points=100000) as sim:
+        bng = BeamNGpy("127.0.0.1", sim.port).open(launch=False)
+        try:
+            if "camera" in names:
+                camera = Camera(
+                    "benchmark_camera",
+                    bng,
+                    resolution=(1280, 720),
+                    is_render_annotations=True,
+                    is_render_depth=True,
+                )
+                raw = camera.poll_raw()
+                params = dict(resolution=[1280, 720])
+                results.append(
+                    _measure(
+                        "camera.binary_to_image",
+                        lambda: camera._binary_to_image(dict(raw)),
+                        repeat,
+                        params,
+                    )
+                )
+                frame = camera.frame_pool[0]
+                results.append(
+                    _measure(
+                        "camera.binary_to_arrays",
+                        lambda: camera._binary_to_arrays(raw, frame),
+                        repeat,
+                        params,
+                    )
+                )
+                camera.remove()
+            if "lidar" in names:
+                lidar = Lidar(
+                    "benchmark_lidar",
+                    bng,
+                    is_using_shared_memory=False,
+                    is_visualised=False,
+                )
+                raw = lidar.poll_raw()
+                results.append(
+                    _measure(
+                        "lidar.convert_binary_to_array",
+                        lambda: lidar._convert_binary_to_array(raw),
+                        repeat,
+                        dict(points=sim.lidar_points),
+                    )
+                )
+                lidar.remove()
+        finally:
+            bng.disconnect()
+    return results
+
+
+def bench_bounding_boxes(repeat: int) -> List[BenchmarkResult]:
+    """
+    Measures the extraction of the bounding boxes of a synthetic 1280x720 annotated frame.
+    """
+    from beamngpy.sensors.camera.utils import extract_bounding_boxes
+
+    rng = np.random.default_rng(0)
+    height, width = 720, 1280
+    semantic = np.zeros((height, width, 3), dtype=np.uint8)
+    instance = np.zeros((height, width, 3), dtype=np.uint8)
+    classes = {0: "BACKGROUND", 255 << 16: "CAR"}
+    for i in range(50):
+        y, x = rng.integers(0, height - 50), rng.integers(0, width - 80)
+        semantic[y : y + 50, x : x + 80] = (255, 0, 0)
+        instance[y : y + 50, x : x + 80] = (i + 1, 0, 1)
+    return [
+        _measure(
+            "bbox.extract_bounding_boxes",
+            lambda: extract_bounding_boxes(semantic, instance, classes),
+            repeat,
+            dict(resolution=[width, height], objects=50),
+        )
+    ]
+
+
+def default_xodr_files() -> List[str]:
+    """
+    The sample OpenDrive files of the examples, when running from a checkout of the repository.
+    """
+    examples = Path(__file__).resolve().parents[3] / "examples" / "data"
+    return sorted(glob(str(examples / "*.xodr")))
+
+
+def bench_opendrive(repeat: int, xodr_files: Iterable[str]) -> List[BenchmarkResult]:
+    """
+    Measures the parsing of the given OpenDrive files.
+    """
+    from beamngpy.tools import OpenDriveImporter
+
+    return [
+        _measure(
+            "opendrive.extract_road_data",
+            lambda: OpenDriveImporter.extract_road_data(path),
+            repeat,
+            dict(file=Path(path).name),
+        )
+        for path in xodr_files
+    ]
+
+
+def run_benchmarks(
+    names: Iterable[str] | None = None,
+    repeat: int = 5,
+    xodr_files: Iterable[str] | None = None,
+) -> StrDict:
+    """
+    Runs the selected benchmarks.
+
+    Args:
+        names: The names of the benchmarks to run, see ``BENCHMARKS``. If None, all of them are run.
+        repeat: The number of timed runs of each benchmark.
+        xodr_files: The OpenDrive files to parse. If None, the sample files of the examples are used.
+
+    Returns:
+        A JSON-serializable dictionary with the metadata of the environment and the results.
+    """
+    from beamngpy import __version__
+
+    selected = list(BENCHMARKS if names is None else names)
+    unknown = set(selected) - set(BENCHMARKS)
+    if unknown:
+        raise ValueError(f"Unknown benchmarks: {', '.join(sorted(unknown))}.")
+
+    results: List[BenchmarkResult] = []
+    if "import" in selected:
+        results += bench_import(repeat)
+    if "prefab" in selected:
+        results += bench_prefab(repeat)
+    if "protocol" in selected:
+        results += bench_protocol(repeat)
+    if "camera" in selected or "lidar" in selected:
+        results += bench_sensors(repeat, selected)
+    if "bbox" in selected:
+        results += bench_bounding_boxes(repeat)
+    if "opendrive" in selected:
+        files = default_xodr_files() if xodr_files is None else list(xodr_files)
+        results += bench_opendrive(repeat, files)
+
+    return dict(
+        metadata=dict(
+            beamngpy=__version__.strip(),
+            python=platform.python_version(),
+            numpy=np.__version__,
+            platform=platform.platform(),
+            timestamp=datetime.now(timezone.utc).isoformat(),
+        ),
+        results=[result.to_dict() for result in results],
+    )
+
+
+def main(argv: Sequence[str] | None = None) -> int:
+    parser = argparse.ArgumentParser(
+        prog="python -m beamngpy.testing.benchmark",
+        description="Runs the offline benchmarks of BeamNGpy and prints the results as JSON.",
+    )
+    parser.add_argument(
+        "benchmarks",
+        nargs="*",
+        help=f"The benchmarks to run, all of them by default. One of: {', '.join(BENCHMARKS)}.",
+    )
+    parser.add_argument("--repeat", type=int, default=5, help="The number of timed runs.")
+    parser.add_argument("--output", help="The file to write the results to, instead of stdout.")
+    parser.add_argument(
+        "--xodr",
+        nargs="+",
+        help="The OpenDrive files to parse, the sample files of the examples by default.",
+    )
+    args = parser.parse_args(argv)
+
+    try:
+        report = run_benchmarks(args.benchmarks or None, args.repeat, args.xodr)
+    except ValueError as ex:
+        parser.error(str(ex))
+    output = json.dumps(report, indent=2)
+    if args.output:
+        Path(args.output).write_text(output + "\n", encoding="utf-8")
+    else:
+        print(output)
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
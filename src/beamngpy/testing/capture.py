@@ -0,0 +1,114 @@
+from __future__ import annotations
+
+import threading
+from contextlib import contextmanager
+from time import perf_counter
+from typing import BinaryIO, Iterator, NamedTuple
+
+import msgpack
+
+from beamngpy.connection.prefixed_length_socket import PrefixedLengthSocket
+
+
+class CaptureRecord(NamedTuple):
+    """
+    A single message of a capture file.
+
+    Attributes:
+        direction: ``out`` for the requests sent by BeamNGpy, ``in`` for the messages received.
+        stream: The name of the connection, ``ge`` for the game engine or the vehicle ID.
+        timestamp: The time since the start of the recording, in seconds.
+        payload: The Messagepack-encoded message, without the length prefix.
+    """
+
+    direction: str
+    stream: str
+    timestamp: float
+    payload: bytes
+
+
+class CaptureRecorder:
+    """
+    Records all the messages passing through the sockets of BeamNGpy into a capture file, which can
+    be replayed by :class:`.ReplayServer`. The file is a stream of Messagepack arrays, one per message,
+    see :class:`CaptureRecord`. Use :func:`record_session` to record all the connections opened while
+    the recorder is active.
+
+    Only the socket traffic is recorded, so the sensors using shared memory should be created with
+    ``is_using_shared_memory=False`` when recording a session meant for replay. The connections of
+    :class:`.AsyncBeamNGpy` are not recorded.
+
+    Args:
+        path: The path of the capture file to write.
+    """
+
+    def __init__(self, path: str):
+        self.path = path
+        self._file: BinaryIO = open(path, "wb")
+        self._packer = msgpack.Packer(use_bin_type=True)
+        self._lock = threading.Lock()
+        self._start_time = perf_counter()
+
+    def record(self, direction: str, stream: str, payload: bytes | memoryview) -> None:
+        """
+        Appends a message to the capture file.
+
+        Args:
+            direction: ``out`` for the requests sent by BeamNGpy, ``in`` for the messages received.
+            stream: The name of the connection, ``ge`` for the game engine or the vehicle ID.
+            payload: The Messagepack-encoded message, without the length prefix.
+        """
+        timestamp = perf_counter() - self._start_time
+        data = self._packer.pack([direction, stream, timestamp, bytes(payload)])
+        with self._lock:
+            self._file.write(data)
+
+    def close(self) -> None:
+        """
+        Finishes the recording and closes the capture file.
+        """
+        with self._lock:
+            self._file.close()
+
+
+@contextmanager
+def record_session(path: str) -> Iterator[CaptureRecorder]:
+    """
+    A context manager recording all the messages sent and received over the BeamNGpy sockets
+    while it is active into the capture file at ``path``.
+
+    Example:
+
+    .. code-block:: python
+
+        with record_session('session.capture'):
+            bng.scenario.start()
+            for _ in range(100):
+                bng.control.step(10)
+                vehicle.sensors.poll()
+
+    Args:
+        path: The path of the capture file to write.
+    """
+    recorder = CaptureRecorder(path)
+    PrefixedLengthSocket.recorder = recorder
+    try:
+        yield recorder
+    finally:
+        PrefixedLengthSocket.recorder = None
+        recorder.close()
+
+
+def read_capture(path: str) -> Iterator[CaptureRecord]:
+    """
+    Reads the messages of a capture file written by :class:`CaptureRecorder`.
+
+    Args:
+        path: The path of the capture file.
+
+    Returns:
+        An iterator over the recorded messages.
+    """
+    with open(path, "rb") as f:
+        for record in msgpack.Unpacker(f, raw=False, max_buffer_size=2**31 - 1):
+            yield CaptureRecord(*record)
@@ -0,0 +1,396 @@
+from __future__ import annotations
+
+import platform
+import threading
+import time
+from struct import pack_into
+from typing import Callable, Dict
+
+import numpy as np
+
+from beamngpy.connection import Connection
+from beamngpy.sensors.shmem import FrameHeader, SharedMemory
+from beamngpy.types import StrDict
+
+from .server import ProtocolServer
+
+Handler = Callable[[str, StrDict], "StrDict | None"]
+
+
+def _attach_frame_header(request: StrDict, enabled: bool) -> FrameHeader | None:
+    name = request.get("frameHeaderShmemHandle")
+    if not enabled or not name or not request.get("isStreaming"):
+        return None
+    return FrameHeader(int(request.get("shmemSlots", 1)), name=name)
+
+
+class _MockCamera:
+    def __init__(self, request: StrDict, frame_headers: bool):
+        self.name: str = request["name"]
+        self.width, self.height = (int(x) for x in request["size"])
+        self.is_streaming: bool = request.get("isStreaming", False)
+        self.use_shmem: bool = request.get("useSharedMemory", False)
+        pixels = self.width * self.height
+        rng = np.random.default_rng(0)
+        self.buffers: Dict[str, np.ndarray] = {}
+        if request.get("renderColours"):
+            self.buffers["colour"] = rng.integers(0, 256, pixels * 3, dtype=np.uint8)
+        if request.get("renderAnnotations"):
+            # the first byte is the size of the palette, 0 means raw RGB pixels
+            annotation = np.zeros(pixels * 3 + 1, dtype=np.uint8)
+            annotation[1:] = rng.integers(0, 8, pixels * 3, dtype=np.uint8) * 32
+            self.buffers["annotation"] = annotation
+        if request.get("renderDepth"):
+            if request.get("integerDepth", True):
+                depth = rng.integers(0, 256, pixels, dtype=np.uint8)
+            else:
+                depth = rng.random(pixels, dtype=np.float32)
+            self.buffers["depth"] = depth.view(np.uint8)
+        self.shmems: Dict[str, SharedMemory] = {}
+        self.slot_sizes: Dict[str, int] = {}
+        self.frame_header: FrameHeader | None = None
+        if self.use_shmem:
+            for key in self.buffers:
+                name = request.get(f"{key}ShmemName")
+                if name:
+                    self.shmems[key] = SharedMemory(name=name, track=False)
+                    self.slot_sizes[key] = int(request[f"{key}ShmemSize"])
+            self.frame_header = _attach_frame_header(request, frame_headers)
+
+    def write(self, frame: int, timestamp: float) -> StrDict:
+        if self.frame_header is None:
+            return self._write_slot(frame, 0)
+        with self.frame_header.write(frame, timestamp) as slot:
+            return self._write_slot(frame, slot)
+
+    def _write_slot(self, frame: int, slot: int) -> StrDict:
+        data: StrDict = {}
+        for key, buffer in self.buffers.items():
+            buffer[-1] = frame % 256
+            if key in self.shmems:
+                size = min(len(buffer), self.slot_sizes[key])
+                offset = slot * self.slot_sizes[key]
+                self.shmems[key].buf[offset : offset + size] = buffer.data[:size]
+                data[key] = size
+            else:
+                data[key] = buffer.tobytes()
+        return data
+
+    def close(self) -> None:
+        for shmem in self.shmems.values():
+            shmem.close()
+        self.shmems.clear()
+        if self.frame_header is not None:
+            self.frame_header.try_close()
+            self.frame_header = None
+
+
+class _MockLidar:
+    def __init__(self, request: StrDict, num_points: int, frame_headers: bool):
+        self.name: str = request["name"]
+        self.is_streaming: bool = request.get("isStreaming", False)
+        self.point_cloud_shmem: SharedMemory | None = None
+        self.colour_shmem: SharedMemory | None = None
+        self.frame_header: FrameHeader | None = None
+        if request.get("useSharedMemory"):
+            self.point_cloud_shmem = SharedMemory(
+                name=request["pointCloudShmemHandle"], track=False
+            )
+            self.colour_shmem = SharedMemory(
+                name=request["colourShmemHandle"], track=False
+            )
+            self.frame_header = _attach_frame_header(request, frame_headers)
+            self.point_cloud_slot_size = int(request["pointCloudShmemSize"])
+            self.colour_slot_size = int(request["colourShmemSize"])
+            # without the frame header, the streamed point clouds store the number of points in the last float
+            self.count_offset = self.point_cloud_slot_size - 4
+            # the point clouds not fitting into the shared memory are truncated
+            self.capacity = min(num_points, self.count_offset // 12)
+        rng = np.random.default_rng(0)
+        angles = rng.uniform(0, 2 * np.pi, num_points)
+        distances = rng.uniform(1, float(request.get("maxDist", 120)), num_points)
+        points = np.empty((num_points, 3), dtype=np.float32)
+        points[:, 0] = np.cos(angles) * distances
+        points[:, 1] = np.sin(angles) * distances
+        points[:, 2] = rng.uniform(-2, 2, num_points)
+        self.points = points.reshape(-1)
+        self.colours = rng.integers(0, 256, num_points * 3, dtype=np.uint8)
+
+    def write(self, frame: int, timestamp: float) -> StrDict:
+        self.points[0] = frame
+        if self.point_cloud_shmem is None or self.colour_shmem is None:
+            return dict(pointCloud=self.points.tobytes(), colours=self.colours.tobytes())
+        # the numbers of points report the overflows like the simulator
+        num_points = len(self.points) // 3
+        if self.frame_header is None:
+            self._write_slot(0)
+            if self.is_streaming:
+                pack_into("f", self.point_cloud_shmem.buf, self.count_offset, num_points)
+        else:
+            with self.frame_header.write(frame, timestamp, num_points) as slot:
+                self._write_slot(slot)
+        return dict(points=self.capacity * 12, colours=self.capacity * 3)
+
+    def _write_slot(self, slot: int) -> None:
+        assert self.point_cloud_shmem and self.colour_shmem
+        offset = slot * self.point_cloud_slot_size
+        point_bytes = self.capacity * 12
+        point_cloud = self.points.data.cast("B")[:point_bytes]
+        self.point_cloud_shmem.buf[offset : offset + point_bytes] = point_cloud
+        offset = slot * self.colour_slot_size
+        colour_bytes = self.capacity * 3
+        colours = self.colours.data[:colour_bytes]
+        self.colour_shmem.buf[offset : offset + colour_bytes] = colours
+
+    def close(self) -> None:
+        for shmem in (self.point_cloud_shmem, self.colour_shmem):
+            if shmem is not None:
+                shmem.close()
+        self.point_cloud_shmem = self.colour_shmem = None
+        if self.frame_header is not None:
+            self.frame_header.try_close()
+            self.frame_header = None
+
+
+class MockSimulator(ProtocolServer):
+    """
+    A local mock of the game engine and vehicle endpoints of BeamNG.tech, for load testing the client
+    side of BeamNGpy without the simulator. The responses are synthetic, but shaped and sized like the
+    real ones, so that the decoding paths of the client (sensor polling, shared memory, images and
+    point clouds) run exactly as with the simulator.
+
+    The supported requests include ``Hello``, ``Step``, ``Pause``, ``Resume``, ``GameStateRequest``,
+    ``StartVehicleConnection``, ``UpdateScenario``, ``SensorRequest`` (the ``Timer``, ``State``,
+    ``Electrics``, ``Damage`` and ``GForces`` sensors), ``Control``, ``OpenCamera``/``PollCamera``/
+    ``CloseCamera`` and ``OpenLidar``/``PollLidar``/``CloseLidar``, which write into the shared memory
+    of the client if requested. The vehicles start at the origin and drive along the x axis. The
+    streaming sensors are written on every ``Step``. Other requests can be scripted using
+    :func:`set_handler`, requests without a handler get an error response.
+
+    Example:
+
+    .. code-block:: python
+
+        with MockSimulator(latency=0.001) as sim:
+            bng = BeamNGpy('localhost', sim.port).open(launch=False)
+            vehicle = Vehicle('ego', model='etk800')
+            vehicle.sensors.attach('electrics', Electrics())
+            bng.vehicles.connect_all([vehicle])
+            vehicle.sensors.poll()
+
+    Args:
+        host: The host to listen on.
+        port: The port to listen on. If 0, then a free port is chosen, see :attr:`port`.
+        latency: The time in seconds to wait before sending each response. Can be a dictionary mapping
+                 the request types to their latencies, the ``default`` key applies to all other types.
+        steps_per_second: The number of steps simulating a second, used to advance the simulation time.
+        lidar_points: The number of points of the synthetic LiDAR point clouds.
+        frame_headers: Whether the streaming sensors write their frames with a :class:`.FrameHeader` if requested.
+                       If False, the mock behaves like the simulator versions without the support for it.
+    """
+
+    def __init__(
+        self,
+        host: str = "127.0.0.1",
+        port: int = 0,
+        latency: float | Dict[str, float] = 0.0,
+        steps_per_second: int = 60,
+        lidar_points: int = 50000,
+        frame_headers: bool = True,
+    ):
+        super().__init__(host, port)
+        self.latency = latency
+        self.steps_per_second = steps_per_second
+        self.lidar_points = lidar_points
+        self.frame_headers = frame_headers
+        self.steps = 0
+        self.vehicles: Dict[str, int] = {}
+        self.cameras: Dict[str, _MockCamera] = {}
+        self.lidars: Dict[str, _MockLidar] = {}
+        self._state_lock = threading.Lock()
+        self._handlers: Dict[str, Handler] = {
+            "Hello": self._hello,
+            "GetSystemInfo": self._get_system_info,
+            "GetEnvironmentPaths": self._get_environment_paths,
+            "Step": self._step,
+            "Pause": self._ack("Paused"),
+            "Resume": self._ack("Resumed"),
+            "GameStateRequest": self._game_state,
+            "StartVehicleConnection": self._start_vehicle_connection,
+            "UpdateScenario": self._update_scenario,
+            "SensorRequest": self._sensor_request,
+            "Control": self._ack("Controlled"),
+            "OpenCamera": self._open_camera,
+            "PollCamera": self._poll_camera,
+            "CloseCamera": self._close_camera,
+            "OpenLidar": self._open_lidar,
+            "PollLidar": self._poll_lidar,
+            "CloseLidar": self._close_lidar,
+        }
+
+    @property
+    def time(self) -> float:
+        """
+        The simulation time in seconds.
+        """
+        return self.steps / self.steps_per_second
+
+    def set_handler(self, req_type: str, handler: Handler | None) -> None:
+        """
+        Sets the handler of the requests of the given type, replacing the built-in one if there is any.
+
+        Args:
+            req_type: The type of the request.
+            handler: A function receiving the stream name (``ge`` or the vehicle ID) and the request,
+                     and returning the response or None if the request is not to be answered. If None,
+                     then the handler is removed.
+        """
+        if handler is None:
+            self._handlers.pop(req_type, None)
+        else:
+            self._handlers[req_type] = handler
+
+    def stop(self) -> None:
+        super().stop()
+        for sensor in list(self.cameras.values()) + list(self.lidars.values()):
+            sensor.close()
+        self.cameras.clear()
+        self.lidars.clear()
+
+    def handle(self, stream: str, request: StrDict) -> StrDict | None:
+        req_type = request.get("type")
+        latency = self.latency
+        if isinstance(latency, dict):
+            latency = latency.get(req_type, latency.get("default", 0.0))
+        if latency > 0:
+            time.sleep(latency)
+        handler = self._handlers.get(req_type)
+        if handler is None:
+            return dict(type=req_type, bngError=f"Unsupported request: {req_type}")
+        return handler(stream, request)
+
+    @staticmethod
+    def _ack(ack_type: str) -> Handler:
+        return lambda stream, request: dict(type=ack_type)
+
+    def _hello(self, stream: str, request: StrDict) -> StrDict:
+        return dict(type="Hello", protocolVersion=Connection.PROTOCOL_VERSION)
+
+    def _get_system_info(self, stream: str, request: StrDict) -> StrDict:
+        return dict(
+            type="GetSystemInfo",
+            os=dict(type=platform.system()),
+            tech=True,
+            bngVersion="mock",
+        )
+
+    def _get_environment_paths(self, stream: str, request: StrDict) -> StrDict:
+        return dict(type="GetEnvironmentPaths", home="mock", user="mock/user/mock")
+
+    def _step(self, stream: str, request: StrDict) -> StrDict | None:
+        with self._state_lock:
+            self.steps += int(request.get("count", 1))
+            frame = self.steps
+        for sensor in list(self.cameras.values()) + list(self.lidars.values()):
+            if sensor.is_streaming:
+                sensor.write(frame, frame / self.steps_per_second)
+        return dict(type="Stepped") if request.get("ack") else None
+
+    def _game_state(self, stream: str, request: StrDict) -> StrDict:
+        return dict(type="GameState", state="scenario", scenario_state="running")
+
+    def _start_vehicle_connection(self, stream: str, request: StrDict) -> StrDict:
+        vid = request["vid"]
+        with self._state_lock:
+            self.vehicles.setdefault(vid, len(self.vehicles))
+        port = self.open_vehicle_endpoint(vid)
+        return dict(type="StartVehicleConnection", vid=vid, result=port)
+
+    def _vehicle_state(self, vid: str) -> StrDict:
+        index = self.vehicles.get(vid, 0)
+        speed = 10.0
+        return dict(
+            time=self.time,
+            pos=[self.time * speed, 5.0 * index, 0.0],
+            dir=[1.0, 0.0, 0.0],
+            up=[0.0, 0.0, 1.0],
+            vel=[speed, 0.0, 0.0],
+            rotation=[0.0, 0.0, 0.0, 1.0],
+        )
+
+    def _update_scenario(self, stream: str, request: StrDict) -> StrDict:
+        vehicles = {}
+        for vid in request["vehicles"]:
+            state = self._vehicle_state(vid)
+            vehicles[vid] = {key: state[key] for key in ("pos", "dir", "up", "vel")}
+        return dict(type="ScenarioUpdate", vehicles=vehicles)
+
+    def _sensor_data(self, stream: str, sensor_request: StrDict) -> StrDict:
+        sensor_type = sensor_request.get("type")
+        if sensor_type == "Timer":
+            return dict(time=self.time)
+        if sensor_type == "State":
+            return dict(state=self._vehicle_state(stream))
+        if sensor_type == "Electrics":
+            return dict(
+                values=dict(
+                    wheelspeed=10.0,
+                    airspeed=10.0,
+                    rpm=2000.0,
+                    gear=3,
+                    throttle=0.5,
+                    brake=0.0,
+                    steering=0.0,
+                    fuel=0.8,
+                    signal_left=0,
+                    signal_right=0,
+                    hazard=0,
+                )
+            )
+        if sensor_type == "Damage":
+            return dict(damage=0.0, deform_group_damage={}, part_damage={})
+        if sensor_type == "GForces":
+            return dict(gx=0.0, gy=0.0, gz=1.0, gx2=0.0, gy2=0.0, gz2=1.0)
+        return {}
+
+    def _sensor_request(self, stream: str, request: StrDict) -> StrDict:
+        data = {}
+        for name, sensor_request in request["sensors"].items():
+            # the engine requests are sent over the GE stream and name their vehicle
+            sensor_stream = sensor_request.get("vehicle", stream)
+            data[name] = self._sensor_data(sensor_stream, sensor_request)
+        return dict(type="SensorData", data=data)
+
+    def _open_camera(self, stream: str, request: StrDict) -> StrDict:
+        self.cameras[request["name"]] = _MockCamera(request, self.frame_headers)
+        return dict(type="OpenedCamera")
+
+    def _poll_camera(self, stream: str, request: StrDict) -> StrDict:
+        camera = self.cameras.get(request["name"])
+        if camera is None:
+            return dict(type="PollCamera", bngError=f"No camera {request['name']}.")
+        return dict(type="PollCamera", data=camera.write(self.steps, self.time))
+
+    def _close_camera(self, stream: str, request: StrDict) -> StrDict:
+        camera = self.cameras.pop(request["name"], None)
+        if camera is not None:
+            camera.close()
+        return dict(type="ClosedCamera")
+
+    def _open_lidar(self, stream: str, request: StrDict) -> StrDict:
+        self.lidars[request["name"]] = _MockLidar(
+            request, self.lidar_points, self.frame_headers
+        )
+        return dict(type="OpenedLidar")
+
+    def _poll_lidar(self, stream: str, request: StrDict) -> StrDict:
+        lidar = self.lidars.get(request["name"])
+        if lidar is None:
+            return dict(type="PollLidar", bngError=f"No LiDAR {request['name']}.")
+        return dict(type="PollLidar", data=lidar.write(self.steps, self.time))
+
+    def _close_lidar(self, stream: str, request: StrDict) -> StrDict:
+        lidar = self.lidars.pop(request["name"], None)
+        if lidar is not None:
+            lidar.close()
+        return dict(type="ClosedLidar")
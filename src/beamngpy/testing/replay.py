@@ -0,0 +1,95 @@
+from __future__ import annotations
+
+import threading
+from collections import defaultdict
+from typing import Dict, List, Tuple
+
+import msgpack
+
+from beamngpy.types import StrDict
+
+from .capture import read_capture
+from .server import ProtocolServer
+
+
+class ReplayServer(ProtocolServer):
+    """
+    A stand-in for the simulator which answers the requests of BeamNGpy with the responses
+    recorded in a capture file by :func:`.record_session`. This allows running and benchmarking the
+    client side of a pipeline without the simulator.
+
+    The requests are matched to the recorded responses by their stream (the game engine or
+    a vehicle), their ``type`` and their sequence number: the n-th request of a given type gets the
+    response to the n-th recorded request of that type. After the recorded responses of a type are
+    exhausted, they are replayed from the start again if ``loop`` is set. The requests whose
+    recorded counterparts were not answered (e.g. steps without acknowledgement) are not answered,
+    the requests of types not present in the capture get an error response.
+
+    The ``StartVehicleConnection`` responses are rewritten to point to the vehicle endpoints of
+    this server, which replay the recorded vehicle streams.
+
+    Args:
+        capture: The path of the capture file.
+        host: The host to listen on.
+        port: The port to listen on. If 0, then a free port is chosen, see :attr:`port`.
+        loop: Whether to start from the beginning after the recorded responses of a type are exhausted.
+    """
+
+    def __init__(
+        self, capture: str, host: str = "127.0.0.1", port: int = 0, loop: bool = True
+    ):
+        super().__init__(host, port)
+        self.loop = loop
+        self._responses = self._load(capture)
+        self._positions: Dict[Tuple[str, str], int] = defaultdict(int)
+        self._positions_lock = threading.Lock()
+
+    @staticmethod
+    def _load(capture: str) -> Dict[Tuple[str, str], List[StrDict | None]]:
+        """
+        Pairs the recorded requests and responses by their IDs.
+
+        Returns:
+            The recorded responses by the stream and the request type, in the order of the requests.
+        """
+        responses: Dict[Tuple[str, str], List[StrDict | None]] = defaultdict(list)
+        requests: Dict[Tuple[str, int], Tuple[str, int]] = {}
+        for record in read_capture(capture):
+            message = msgpack.unpackb(record.payload, raw=False, strict_map_key=False)
+            req_id = message.pop("_id", None)
+            if record.direction == "out":
+                key = (record.stream, str(message.get("type")))
+                requests[(record.stream, req_id)] = (key[1], len(responses[key]))
+                responses[key].append(None)
+            elif (record.stream, req_id) in requests:
+                req_type, index = requests.pop((record.stream, req_id))
+                responses[(record.stream, req_type)][index] = message
+        return dict(responses)
+
+    def _next_response(self, stream: str, req_type: str) -> StrDict | None:
+        key = (stream, req_type)
+        recorded = self._responses.get(key)
+        if not recorded:
+            return dict(
+                type=req_type,
+                bngError=f"The request {req_type} on {stream} is not in the capture.",
+            )
+        with self._positions_lock:
+            position = self._positions[key]
+            self._positions[key] = position + 1
+        if position >= len(recorded):
+            if not self.loop:
+                return dict(
+                    type=req_type,
+                    bngError=f"The recorded responses to {req_type} on {stream} are exhausted.",
+                )
+            position %= len(recorded)
+        return recorded[position]
+
+    def handle(self, stream: str, request: StrDict) -> StrDict | None:
+        req_type = str(request.get("type"))
+        response = self._next_response(stream, req_type)
+        if response is not None and req_type == "StartVehicleConnection":
+            response = dict(response)
+            response["result"] = self.open_vehicle_endpoint(request["vid"])
+        return response
@@ -0,0 +1,178 @@
+from __future__ import annotations
+
+import logging
+import socket
+import threading
+from struct import pack, unpack
+from typing import Dict, List
+
+import msgpack
+
+from beamngpy.logging import LOGGER_ID
+from beamngpy.types import StrDict
+
+
+class ProtocolServer:
+    """
+    A base class of the local stand-ins of the simulator. It listens on a local port for the
+    connections of :class:`.BeamNGpy` and speaks the length-prefixed Messagepack protocol of
+    BeamNG.tech. Every connected client is served by its own thread, which passes the requests to
+    :func:`handle` and sends back its response.
+
+    The main listener serves the ``ge`` stream (the game engine). Vehicle streams, named by the
+    vehicle IDs, are opened on demand by :func:`open_vehicle_endpoint`, which is meant to be used
+    to handle the ``StartVehicleConnection`` requests.
+
+    Args:
+        host: The host to listen on.
+        port: The port to listen on. If 0, then a free port is chosen, see :attr:`port`.
+    """
+
+    GE_STREAM = "ge"
+
+    def __init__(self, host: str = "127.0.0.1", port: int = 0):
+        self.host = host
+        self.port = port
+        self.logger = logging.getLogger(f"{LOGGER_ID}.{type(self).__name__}")
+        self._listeners: Dict[str, socket.socket] = {}
+        self._ports: Dict[str, int] = {}
+        self._clients: List[socket.socket] = []
+        self._lock = threading.Lock()
+        self._running = False
+
+    def start(self) -> ProtocolServer:
+        """
+        Starts listening for the connections to the game engine.
+
+        Returns:
+            The server itself, so that it can be used as ``server = ReplayServer(...).start()``.
+        """
+        self._running = True
+        self.port = self._listen(self.GE_STREAM, self.port)
+        self.logger.info(f"Listening at ({self.host}, {self.port}).")
+        return self
+
+    def stop(self) -> None:
+        """
+        Stops the server and closes all the connections.
+        """
+        self._running = False
+        with self._lock:
+            sockets = list(self._listeners.values()) + self._clients
+            self._listeners.clear()
+            self._ports.clear()
+            self._clients.clear()
+        for skt in sockets:
+            try:
+                skt.shutdown(socket.SHUT_RDWR)
+            except OSError:
+                pass
+            skt.close()
+
+    def __enter__(self):
+        return self.start()
+
+    def __exit__(self, exc_type, exc_val, exc_tb):
+        self.stop()
+
+    def open_vehicle_endpoint(self, vid: str) -> int:
+        """
+        Starts listening for the connections to the given vehicle, if not listening already.
+
+        Args:
+            vid: The ID of the vehicle.
+
+        Returns:
+            The port the vehicle connections are accepted on.
+        """
+        with self._lock:
+            if vid in self._ports:
+                return self._ports[vid]
+        return self._listen(vid, 0)
+
+    def handle(self, stream: str, request: StrDict) -> StrDict | None:
+        """
+        Handles a single request. Has to be implemented by the subclasses.
+
+        Args:
+            stream: The name of the stream the request was received on, ``ge`` or the vehicle ID.
+            request: The request without its ``_id`` field.
+
+        Returns:
+            The response, or None if the request is not to be answered.
+        """
+        raise NotImplementedError()
+
+    def _listen(self, stream: str, port: int) -> int:
+        listener = socket.socket(socket.AF_INET, socket.SOCK_STREAM)
+        listener.setsockopt(socket.SOL_SOCKET, socket.SO_REUSEADDR, 1)
+        listener.bind((self.host, port))
+        listener.listen()
+        port = listener.getsockname()[1]
+        with self._lock:
+            self._listeners[stream] = listener
+            self._ports[stream] = port
+        threading.Thread(
+            target=self._accept_loop,
+            args=(listener, stream),
+            name=f"{type(self).__name__} {stream} listener",
+            daemon=True,
+        ).start()
+        return port
+
+    def _accept_loop(self, listener: socket.socket, stream: str) -> None:
+        while self._running:
+            try:
+                client, _ = listener.accept()
+            except OSError:
+                return
+            client.setsockopt(socket.IPPROTO_TCP, socket.TCP_NODELAY, 1)
+            with self._lock:
+                self._clients.append(client)
+            threading.Thread(
+                target=self._serve_client,
+                args=(client, stream),
+                name=f"{type(self).__name__} {stream} client",
+                daemon=True,
+            ).start()
+
+    @staticmethod
+    def _recv_exactly(client: socket.socket, length: int) -> bytearray | None:
+        data = bytearray(length)
+        view = memoryview(data)
+        received_total = 0
+        while received_total < length:
+            received = client.recv_into(view[received_total:])
+            if not received:
+                return None
+            received_total += received
+        return data
+
+    def _serve_client(self, client: socket.socket, stream: str) -> None:
+        try:
+            while self._running:
+                header = self._recv_exactly(client, 4)
+                if header is None:
+                    break
+                data = self._recv_exactly(client, unpack("!I", header)[0])
+                if data is None:
+                    break
+                request = msgpack.unpackb(data, raw=False, strict_map_key=False)
+                req_id = request.pop("_id", None)
+                try:
+                    response = self.handle(stream, request)
+                except Exception as err:
+                    self.logger.exception(err)
+                    response = dict(type=request.get("type"), bngError=str(err))
+                if response is None:
+                    continue
+                response = dict(response, _id=req_id)
+                packed = msgpack.packb(response, use_bin_type=True)
+                client.sendall(pack("!I", len(packed)) + packed)
+        except OSError:
+            pass
+        finally:
+            with self._lock:
+                if client in self._clients:
+                    self._clients.remove(client)
+            client.close()
@@ -3,11 +3,6 @@ from __future__ import annotations
 from logging import DEBUG, getLogger
 from typing import TYPE_CHECKING, Any
 
-import matplotlib
-import matplotlib.pyplot as plt
-import seaborn as sns
-from matplotlib import collections as mc
-
 from beamngpy import vec3
 from beamngpy.connection import CommBase
 from beamngpy.logging import LOGGER_ID
@@ -178,6 +173,11 @@ class NavigraphData(CommBase):
             path_segments: The collection of individual 'path segments' to plot.
             coords3d: The 3d coordinates data from the navgraph (comes from the exporter file).
         """
+        import matplotlib
+        import matplotlib.pyplot as plt
+        import seaborn as sns
+        from matplotlib import collections as mc
+
         sns.set_theme()  # Let seaborn apply better styling to all matplotlib graphs
 
         fig, ax = plt.subplots(figsize=(15, 15))
@@ -0,0 +1,334 @@
+from __future__ import annotations
+
+from concurrent.futures import Future, ThreadPoolExecutor
+from logging import getLogger
+from time import perf_counter
+from typing import (
+    TYPE_CHECKING,
+    Any,
+    Dict,
+    Iterable,
+    Iterator,
+    List,
+    NamedTuple,
+    Tuple,
+)
+
+from beamngpy.connection import CommBase, Response
+from beamngpy.logging import LOGGER_ID, BNGDisconnectedError
+from beamngpy.sensors import Camera, Lidar
+from beamngpy.types import StrDict
+from beamngpy.vehicle import Vehicle
+
+if TYPE_CHECKING:
+    from beamngpy.beamng import BeamNGpy
+
+
+class SimulationFrame(NamedTuple):
+    """
+    The readings of a single frame of a :class:`SimulationLoop`.
+
+    Attributes:
+        index: The index of the frame, starting from zero.
+        steps: The number of steps simulated by the loop when the readings were taken.
+        readings: The readings in the order of the sensors of the loop. For vehicles, a
+                  dictionary from the sensor names to their readings, for the standalone
+                  sensors the return value of their ``poll`` function, or their raw readings
+                  if the loop does not decode them.
+    """
+
+    index: int
+    steps: int
+    readings: List[Any]
+
+
+class SimulationLoopStats(NamedTuple):
+    """
+    The timing statistics of a :class:`SimulationLoop`, see :func:`SimulationLoop.stats`.
+    All the times are in seconds of wall time.
+
+    Attributes:
+        frames: The number of frames produced.
+        steps: The number of steps simulated.
+        wall_time: The time spent inside of :func:`SimulationLoop.run`, including the time
+                   spent processing the frames.
+        simulated_time: The simulated time, the number of steps divided by the steps per second.
+        real_time_factor: The ratio of the simulated time and the wall time.
+        client_stall: The time Python spent waiting for the simulator to finish the steps.
+        simulator_stall: The time the simulator spent idle between finishing the steps and
+                         receiving the next step request, i.e. waiting for Python.
+        poll_time: The time spent polling the sensors and applying the controls, during which
+                   the simulation is paused.
+    """
+
+    frames: int
+    steps: int
+    wall_time: float
+    simulated_time: float
+    real_time_factor: float
+    client_stall: float
+    simulator_stall: float
+    poll_time: float
+
+
+class _FrameBuffers:
+    """
+    Reusable copies of the shared memory buffers of the sensors, so that the readings of a frame
+    are not overwritten by the simulator while the next steps are simulated.
+    """
+
+    def __init__(self):
+        self._buffers: Dict[Tuple[int, str], bytearray] = {}
+
+    def store(self, key: Tuple[int, str], data: memoryview) -> memoryview:
+        buffer = self._buffers.get(key)
+        if buffer is None or len(buffer) < len(data):
+            buffer = self._buffers[key] = bytearray(len(data))
+        view = memoryview(buffer)[: len(data)]
+        view[:] = data
+        return view
+
+
+class SimulationLoop:
+    """
+    A helper running the simulation in lockstep with Python code, overlapping the simulation of
+    the next steps with the processing of the current frame. The simulation needs to be paused
+    and in deterministic mode, see :func:`.SettingsApi.set_deterministic`.
+
+    For each frame, the loop waits for the steps to be simulated, polls all its sensors and
+    applies the queued controls, then issues the next steps and only afterwards decodes the
+    readings and hands them over. While the frame is processed, for example by running the
+    inference of a policy network, the simulator is already computing the next steps.
+
+    The readings of the sensors using shared memory are copied out of it before the next steps
+    are issued, alternating between two sets of buffers. The raw readings of a frame therefore
+    stay valid while the following frame is produced.
+
+    As the next steps are issued before a frame is handed over, the controls set by
+    :func:`control` while processing frame ``k`` are applied after the steps of frame ``k + 1``.
+
+    Args:
+        bng: An instance of the simulator.
+        steps: The number of steps to simulate per frame.
+        sensors: The vehicles whose attached sensors should be polled, and the standalone
+                 sensors (e.g. :class:`.Camera` or :class:`.Lidar`) to poll.
+        steps_per_second: The steps per second of the simulator, used to compute the real-time factor.
+        decode: Whether to decode the raw readings of the cameras and LiDARs. If False, the
+                frames contain the raw readings as returned by their ``poll_raw`` function.
+
+    Example:
+
+    .. code-block:: python
+
+        bng.settings.set_deterministic(60)
+        bng.control.pause()
+        loop = SimulationLoop(bng, steps=6, sensors=[vehicle, camera])
+        for frame in loop.run(1000):
+            vehicle_readings, images = frame.readings
+            throttle, steering = policy(images['colour'])
+            loop.control(vehicle, throttle=throttle, steering=steering)
+        print(loop.stats())
+    """
+
+    def __init__(
+        self,
+        bng: BeamNGpy,
+        steps: int,
+        sensors: Iterable[Vehicle | CommBase] = (),
+        steps_per_second: int = 60,
+        decode: bool = True,
+    ):
+        self.logger = getLogger(f"{LOGGER_ID}.SimulationLoop")
+        self.bng = bng
+        self.steps = steps
+        self.sensors = list(sensors)
+        self.steps_per_second = steps_per_second
+        self.decode = decode
+
+        self._vehicles = [
+            sensor for sensor in self.sensors if isinstance(sensor, Vehicle)
+        ]
+        self._controls: Dict[Vehicle, StrDict] = {}
+        self._buffers = (_FrameBuffers(), _FrameBuffers())
+        self._executor: ThreadPoolExecutor | None = None
+        self._pending_step: Future | None = None
+        self._stepped_at: float | None = None
+        self.reset_stats()
+
+    def control(self, vehicle: Vehicle, **kwargs: Any) -> None:
+        """
+        Queues controls for the given vehicle, which are applied right before the next steps
+        are issued. The arguments are the same as of :func:`.Vehicle.control`. The controls
+        queued for the same vehicle are merged.
+
+        Args:
+            vehicle: The vehicle to control.
+            **kwargs: The controls to apply.
+        """
+        self._controls.setdefault(vehicle, {}).update(kwargs)
+
+    def run(self, frames: int | None = None) -> Iterator[SimulationFrame]:
+        """
+        Runs the simulation, yielding the readings of the sensors after each ``steps`` steps.
+        No steps are issued after the last frame, so the simulation stops right after it.
+
+        Args:
+            frames: The number of frames to produce. If None, the loop runs until the generator
+                    is closed.
+
+        Returns:
+            An iterator over the frames.
+        """
+        if not self.bng.connection:
+            raise BNGDisconnectedError("The simulator is not connected!")
+        if frames is not None and frames <= 0:
+            return
+        start = perf_counter()
+        self._executor = ThreadPoolExecutor(1, thread_name_prefix="SimulationLoop")
+        try:
+            self._issue_step()
+            produced = 0
+            while frames is None or produced < frames:
+                self._finish_step()
+                raw_readings = self._poll()
+                produced += 1
+                if frames is None or produced < frames:
+                    self._issue_step()
+                yield SimulationFrame(
+                    self._frames, self._steps, self._decode(raw_readings)
+                )
+                self._frames += 1
+        finally:
+            # keep the connection consistent if the loop was interrupted
+            if self._pending_step is not None:
+                self._finish_step()
+            self._executor.shutdown()
+            self._executor = None
+            self._wall_time += perf_counter() - start
+            stats = self.stats()
+            self.logger.info(
+                f"Simulation loop: {stats.frames} frames, real-time factor "
+                f"{stats.real_time_factor:.2f}, client stall {stats.client_stall:.3f} s, "
+                f"simulator stall {stats.simulator_stall:.3f} s."
+            )
+
+    def stats(self) -> SimulationLoopStats:
+        """
+        Returns the timing statistics of the loop, accumulated since its creation
+        or the last :func:`reset_stats` call.
+        """
+        simulated_time = self._steps / self.steps_per_second
+        return SimulationLoopStats(
+            frames=self._frames,
+            steps=self._steps,
+            wall_time=self._wall_time,
+            simulated_time=simulated_time,
+            real_time_factor=(
+                simulated_time / self._wall_time if self._wall_time > 0 else 0.0
+            ),
+            client_stall=self._client_stall,
+            simulator_stall=self._simulator_stall,
+            poll_time=self._poll_time,
+        )
+
+    def reset_stats(self) -> None:
+        """
+        Resets the timing statistics of the loop.
+        """
+        self._frames = 0
+        self._steps = 0
+        self._wall_time = 0.0
+        self._client_stall = 0.0
+        self._simulator_stall = 0.0
+        self._poll_time = 0.0
+
+    @staticmethod
+    def _wait_step(response: Response) -> float:
+        response.ack("Stepped")
+        return perf_counter()
+
+    def _issue_step(self) -> None:
+        assert self._executor
+        now = perf_counter()
+        if self._stepped_at is not None:
+            self._simulator_stall += now - self._stepped_at
+            self._stepped_at = None
+        response = self.bng._send(dict(type="Step", count=self.steps, ack=True))
+        # the step is awaited in the background to know when the simulator became idle
+        self._pending_step = self._executor.submit(self._wait_step, response)
+
+    def _finish_step(self) -> None:
+        assert self._pending_step
+        start = perf_counter()
+        try:
+            self._stepped_at = self._pending_step.result()
+        finally:
+            self._pending_step = None
+            self._client_stall += perf_counter() - start
+        self._steps += self.steps
+
+    def _poll(self) -> Dict[int, Any]:
+        """
+        Polls all the sensors of the loop and applies the queued controls, with a single round-trip
+        for the vehicles, cameras and LiDARs. The shared memory readings are copied out.
+
+        Returns:
+            The raw readings by the indices of the standalone sensors.
+        """
+        start = perf_counter()
+        engine_request, engine_keys, vehicle_requests = (
+            self.bng.vehicles._encode_sensor_requests(self._vehicles, ())
+        )
+        controls, self._controls = self._controls, {}
+        engine_response: Response | None = None
+        poll_responses: Dict[int, Response | None] = {}
+        # the sensors are requested before the controls, which use the same vehicle connections
+        with self.bng.batch(vehicles={*self._vehicles, *controls}):
+            vehicle_responses = [
+                (vehicle, vehicle._send(request))
+                for vehicle, request in vehicle_requests
+            ]
+            for vehicle, control in controls.items():
+                vehicle.control(**control)
+            if engine_keys:
+                engine_response = self.bng._send(engine_request)
+            for index, sensor in enumerate(self.sensors):
+                if isinstance(sensor, (Camera, Lidar)):
+                    poll_responses[index] = sensor._send_poll()
+        self.bng.vehicles._collect_sensor_data(
+            self._vehicles, engine_response, engine_keys, vehicle_responses
+        )
+
+        buffers = self._buffers[self._frames % 2]
+        raw_readings: Dict[int, Any] = {}
+        for index, sensor in enumerate(self.sensors):
+            if index in poll_responses:
+                readings = sensor._collect_poll(poll_responses[index])  # type: ignore
+                raw_readings[index] = {
+                    key: (
+                        buffers.store((index, key), value)
+                        if isinstance(value, memoryview)
+                        else value
+                    )
+                    for key, value in readings.items()
+                }
+            elif isinstance(sensor, Vehicle):
+                raw_readings[index] = {
+                    name: dict(readings) for name, readings in sensor.sensors.items()
+                }
+            else:
+                # the other sensors have no split poll, they are polled before the next steps
+                raw_readings[index] = sensor.poll()  # type: ignore
+        self._poll_time += perf_counter() - start
+        return raw_readings
+
+    def _decode(self, raw_readings: Dict[int, Any]) -> List[Any]:
+        readings: List[Any] = []
+        for index, sensor in enumerate(self.sensors):
+            value = raw_readings[index]
+            if self.decode and isinstance(sensor, Camera):
+                value = sensor._binary_to_image(value)
+            elif self.decode and isinstance(sensor, Lidar):
+                value = sensor._convert_binary_to_array(value)
+            readings.append(value)
+        return readings
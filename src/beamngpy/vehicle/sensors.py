@@ -138,6 +138,16 @@ class Sensors:
         if vehicle_resp:
             resp = vehicle_resp.recv("SensorData")
             sensor_data.update(resp["data"])
+        self._update_readings(sensor_data)
+
+    def _update_readings(self, sensor_data: StrDict) -> None:
+        """
+        Decodes the given raw sensor data and replaces the readings of the
+        corresponding sensors with it.
+
+        Args:
+            sensor_data: The raw sensor data keyed by the sensor names.
+        """
         result = self._decode_response(sensor_data)
 
         for sensor, data in result.items():
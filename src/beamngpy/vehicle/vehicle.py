@@ -224,26 +224,58 @@ class Vehicle:
         Args:
             bng: An instance of the simulator.
         """
+        if self._create_connection(bng):
+            # If we do not have a port (ie because it is the first time we wish to send to the given vehicle), then fetch a new port from the simulator.
+            self._set_connection_port(
+                bng.vehicles.start_connection(self, self.extensions)
+            )
+
+        # Now attempt to connect to the given vehicle.
+        assert self.connection
+        self.connection.connect_to_vehicle(self)
+        self._connect_sensors(bng)
+
+    def _create_connection(self, bng: BeamNGpy) -> bool:
+        """
+        Creates the connection object of the vehicle, if it does not exist yet.
+
+        Args:
+            bng: An instance of the simulator.
+
+        Returns:
+            True if the port of the connection has to be requested from the simulator.
+        """
         if not bng.connection:
             raise BNGError("The simulator is not connected to BeamNGpy!")
         if self.connection is None:
-            self.connection = Connection(bng.host, self.port)
+            self.connection = Connection(
+                bng.host, self.port, receiver_thread=bng.receiver_thread
+            )
+        return self.connection.port is None
 
-            # If we do not have a port (ie because it is the first time we wish to send to the given vehicle), then fetch a new port from the simulator.
-            if self.connection.port is None:
-                resp = bng.vehicles.start_connection(self, self.extensions)
-                vid = resp["vid"]
-                assert vid == self.vid
-                self.connection.port = int(resp["result"])
-                self.logger.debug(
-                    f"Created new vehicle connection on port {self.connection.port}"
-                )
-                self.logger.info(f"Vehicle {vid} connected to simulation.")
+    def _set_connection_port(self, resp: StrDict) -> None:
+        """
+        Sets the port of the vehicle connection from the response to the ``StartVehicleConnection`` request.
 
-        # Now attempt to connect to the given vehicle.
-        self.connection.connect_to_vehicle(self)
+        Args:
+            resp: The response of the simulator.
+        """
+        assert self.connection
+        vid = resp["vid"]
+        assert vid == self.vid
+        self.connection.port = int(resp["result"])
+        self.logger.debug(
+            f"Created new vehicle connection on port {self.connection.port}"
+        )
+        self.logger.info(f"Vehicle {vid} connected to simulation.")
 
-        # Connect the vehicle sensors.
+    def _connect_sensors(self, bng: BeamNGpy) -> None:
+        """
+        Connects the vehicle sensors and the vehicle API after the connection to the vehicle was established.
+
+        Args:
+            bng: An instance of the simulator.
+        """
         for _, sensor in self.sensors.items():
             sensor.connect(bng, self)
         self.bng = bng
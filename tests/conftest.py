@@ -4,6 +4,7 @@ import matplotlib
 import pytest
 
 from beamngpy import BeamNGpy
+from beamngpy.testing import MockSimulator
 
 
 @pytest.fixture(autouse=True, scope="session")
@@ -16,3 +17,20 @@ def run_before_tests():
 @pytest.fixture(scope="session")
 def beamng() -> BeamNGpy:
     return BeamNGpy("localhost", 25252, quit_on_close=False, debug=False)
+
+
+@pytest.fixture
+def mock_latency() -> float | dict:
+    """
+    The latency of the mock simulator of the ``mock_bng`` fixture, overridden by the modules
+    needing a slower simulator.
+    """
+    return 0.0
+
+
+@pytest.fixture
+def mock_bng(mock_latency: float | dict):
+    with MockSimulator(lidar_points=1000, latency=mock_latency) as sim:
+        bng = BeamNGpy("127.0.0.1", sim.port).open(launch=False)
+        yield bng, sim
+        bng.disconnect()
@@ -4,6 +4,7 @@ from time import sleep
 
 import matplotlib.pyplot as plt
 import numpy as np
+import pytest
 
 from beamngpy import BeamNGpy, Scenario, Vehicle, set_up_simple_logging
 from beamngpy.sensors import Camera
@@ -268,6 +269,98 @@ def test_camera(beamng: BeamNGpy):
         bng.ui.show_hud()
 
 
+def test_extract_bounding_boxes():
+    car, person = (255, 0, 0), (0, 0, 255)
+    classes = {0: "BACKGROUND", 255 * 65536: "CAR", 255: "PERSON"}
+    semantic = np.zeros((20, 30, 3), dtype=np.uint8)
+    instance = np.zeros((20, 30, 3), dtype=np.uint8)
+    semantic[2:5, 10:20] = car
+    instance[2:5, 10:20] = (1, 2, 3)
+    semantic[8:18, 3:6] = person
+    instance[8:18, 3:6] = (4, 5, 6)
+    instance[0, 0] = (7, 8, 9)  # an instance on the background
+
+    boxes = Camera.extract_bounding_boxes(semantic, instance, classes)
+    assert boxes == [
+        {"bbox": [10, 2, 19, 4], "class": "CAR", "color": [1, 2, 3]},
+        {"bbox": [3, 8, 5, 17], "class": "PERSON", "color": [4, 5, 6]},
+    ]
+    batch = Camera.extract_bounding_boxes_batch(
+        np.stack([semantic, semantic[::-1]]), np.stack([instance, instance[::-1]]), classes
+    )
+    assert batch[0] == boxes
+    assert [box["bbox"] for box in batch[1]] == [[3, 2, 5, 11], [10, 15, 19, 17]]
+
+
+@pytest.mark.parametrize("shmem", [False, True])
+def test_mock_camera(mock_bng, shmem: bool):
+    bng, sim = mock_bng
+    camera = Camera(
+        "camera",
+        bng,
+        resolution=(64, 32),
+        is_using_shared_memory=shmem,
+        is_render_annotations=True,
+        is_render_depth=True,
+    )
+    images = camera.poll()
+    assert images["colour"].size == (64, 32)
+    assert images["annotation"].size == (64, 32)
+    assert images["depth"].size == (64, 32)
+    camera.remove()
+
+
+def test_mock_camera_depth_postprocessing(mock_bng):
+    bng, sim = mock_bng
+    camera = Camera(
+        "camera",
+        bng,
+        resolution=(64, 32),
+        is_render_annotations=False,
+        postprocess_depth=True,
+        depth_marks_refresh=3,
+    )
+    depth = np.asarray(camera.poll()["depth"])
+    assert depth.shape == (32, 64)
+    assert depth.min() >= 0 and depth.max() <= 255
+    # the intensity grows with the depth
+    raw = np.frombuffer(sim.cameras["camera"].buffers["depth"], dtype=np.float32)
+    order = np.argsort(raw)
+    assert np.all(np.diff(depth.ravel()[order]) >= 0)
+
+    marks = camera._depth_marks
+    camera.poll()
+    camera.poll()
+    assert camera._depth_marks is marks
+    camera.poll()
+    assert camera._depth_marks is not marks
+    camera.remove()
+
+
+@pytest.mark.parametrize("shmem,streaming", [(False, False), (True, False), (True, True)])
+def test_mock_camera_arrays(mock_bng, shmem: bool, streaming: bool):
+    bng, sim = mock_bng
+    camera = Camera(
+        "camera",
+        bng,
+        resolution=(64, 32),
+        is_using_shared_memory=shmem,
+        is_streaming=streaming,
+        is_render_annotations=True,
+        is_render_depth=True,
+    )
+    bng.control.step(1)
+    images = camera.stream() if streaming else camera.poll()
+    pool = camera.frame_pool
+    for i in range(3):
+        arrays = camera.stream_array() if streaming else camera.poll_array()
+        # the frames of the pool are reused in turn
+        assert arrays["colour"] is pool[i % 2]["colour"]
+        for key in ("colour", "annotation", "depth"):
+            assert np.array_equal(arrays[key], np.asarray(images[key]))
+    camera.remove()
+
+
 # Executing this file will perform various tests on all available functionality relating to the camera sensor.
 # It is provided to give examples on how to use all camera sensor functions currently available in beamngpy.
 if __name__ == "__main__":
@@ -3,9 +3,11 @@ from __future__ import annotations
 from time import sleep
 
 import numpy as np
+import pytest
 
 from beamngpy import BeamNGpy, Scenario, Vehicle, set_up_simple_logging
 from beamngpy.sensors import Lidar
+from beamngpy.testing import MockSimulator
 
 ATTEMPTS = 3
 
@@ -211,6 +213,144 @@ def test_lidar(beamng: BeamNGpy):
         print("LiDAR test complete.")
         bng.ui.show_hud()
 
+
+@pytest.mark.parametrize("shmem,streaming", [(False, False), (True, False), (True, True)])
+def test_mock_lidar(mock_bng, shmem: bool, streaming: bool):
+    bng, sim = mock_bng
+    lidar = Lidar(
+        "lidar",
+        bng,
+        is_using_shared_memory=shmem,
+        is_streaming=streaming,
+        is_visualised=False,
+    )
+    if streaming:
+        bng.control.step(1)
+        readings = lidar.stream()
+    else:
+        readings = lidar.poll()
+    assert readings["pointCloud"].shape == (1000, 3)
+    assert readings["colours"].shape == (1000, 3)
+    assert np.all(np.isfinite(readings["pointCloud"]))
+    lidar.remove()
+
+
+def test_mock_lidar_views():
+    with MockSimulator(lidar_points=1000) as sim:
+        bng = BeamNGpy("127.0.0.1", sim.port).open(launch=False)
+        lidar = Lidar(
+            "lidar",
+            bng,
+            is_using_shared_memory=True,
+            is_visualised=False,
+            max_points=200,
+        )
+        views = lidar.poll(copy=False)
+        assert not views["pointCloud"].flags.writeable
+        old_shmem = lidar.point_cloud_shmem
+        # the overflowing readings grow the shared memory, the old one is kept while it is viewed
+        for _ in range(4):
+            lidar.poll()
+        assert lidar.max_points >= 1000
+        assert old_shmem in lidar._retired_shmem
+        del views
+        readings = lidar.poll(copy=False)
+        assert readings["pointCloud"].shape == (1000, 3)
+        assert not lidar._retired_shmem
+        # the views must be dropped before the removal, but they do not break it
+        lidar.remove()
+        assert lidar._retired_shmem
+        del readings
+        assert lidar._close_retired_shared_memory()
+
+        lidar = Lidar(
+            "lidar",
+            bng,
+            is_using_shared_memory=True,
+            is_streaming=True,
+            is_visualised=False,
+            stream_slots=3,
+        )
+        bng.control.step(1)
+        readings = lidar.stream_view()
+        frame = lidar.last_frame
+        assert frame is not None
+        assert readings["pointCloud"][0, 0] == frame.frame
+        assert not readings["colours"].flags.writeable
+        # the view stays intact until its slot is reused
+        bng.control.step(1)
+        assert lidar.frame_header.is_current(frame)
+        assert readings["pointCloud"][0, 0] == frame.frame
+        bng.control.step(2)
+        assert not lidar.frame_header.is_current(frame)
+        del readings
+        lidar.remove()
+
+        # with a single slot, the frame cannot be handed over and is copied
+        lidar = Lidar(
+            "lidar",
+            bng,
+            is_using_shared_memory=True,
+            is_streaming=True,
+            is_visualised=False,
+        )
+        bng.control.step(1)
+        readings = lidar.stream_view()
+        assert readings["pointCloud"].flags.writeable
+        lidar.remove()
+        assert not lidar._retired_shmem
+        bng.disconnect()
+
+
+@pytest.mark.parametrize(
+    "frame_headers,streaming",
+    [(True, False), (False, True), (True, True)],
+)
+def test_mock_lidar_shmem_growth(frame_headers: bool, streaming: bool):
+    with MockSimulator(lidar_points=1000, frame_headers=frame_headers) as sim:
+        bng = BeamNGpy("127.0.0.1", sim.port).open(launch=False)
+        lidar = Lidar(
+            "lidar",
+            bng,
+            is_using_shared_memory=True,
+            is_streaming=streaming,
+            is_visualised=False,
+            max_points=200,
+        )
+        assert lidar.point_cloud_shmem_size == 200 * 12
+
+        sizes = []
+        for _ in range(5):
+            bng.control.step(1)
+            readings = lidar.stream() if streaming else lidar.poll()
+            sizes.append(len(readings["pointCloud"]))
+        # the truncated readings keep their first points and grow the shared memory before the next one
+        assert 0 < sizes[0] < 1000
+        assert lidar.max_points >= 1000
+        assert readings["pointCloud"].shape == (1000, 3)
+        lidar.remove()
+        bng.disconnect()
+
+
+def test_lidar_max_points_estimate():
+    # 64 rays, 360 degrees at 1 degree steps, 2 revolutions per update and the margin
+    assert Lidar.estimate_max_points() == 64 * 360 * 2 * 1.25
+    assert Lidar.estimate_max_points(density=1) == 3200000
+    sparse = Lidar.estimate_max_points(
+        vertical_resolution=16, horizontal_angle=90, is_360_mode=False
+    )
+    assert sparse == 4096
+
+    with MockSimulator(lidar_points=1000) as sim:
+        bng = BeamNGpy("127.0.0.1", sim.port).open(launch=False)
+        lidar = Lidar("lidar", bng, is_using_shared_memory=True, is_visualised=False)
+        # a default sensor asked for the memory of 3200000 points before
+        assert sim.lidars["lidar"].point_cloud_slot_size == 57600 * 12
+        assert sim.lidars["lidar"].point_cloud_slot_size < 3200000 * 12 // 50
+        lidar.remove()
+        bng.disconnect()
+
+
 # Executing this file will perform various tests on all available functionality relating to the LiDAR sensor.
 # It is provided to give examples on how to use all LiDAR sensor functions currently available in beamngpy.
 if __name__ == "__main__":
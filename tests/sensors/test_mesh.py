@@ -1,7 +1,14 @@
+from __future__ import annotations
+
 from time import sleep
 
+import matplotlib.pyplot as plt
+import numpy as np
+import pytest
+
 from beamngpy import BeamNGpy, Scenario, Vehicle, set_up_simple_logging
 from beamngpy.sensors import Mesh
+from beamngpy.sensors.mesh import MeshArrays, MeshPlot
 
 
 def test_mesh(beamng: BeamNGpy, steps: int = 3):
@@ -43,6 +50,88 @@ def test_mesh(beamng: BeamNGpy, steps: int = 3):
         bng.ui.show_hud()
 
 
+@pytest.mark.parametrize("binary", [False, True])
+def test_mock_mesh_arrays(mock_bng, binary: bool):
+    bng, sim = mock_bng
+    vehicle = Vehicle("ego", model="etk800")
+    bng.vehicles.connect_all([vehicle])
+
+    # four nodes in two groups, with a beam between each pair of consecutive nodes
+    groups = ["body", "body", "wheel", "body"]
+    beams = {str(i): [i, i + 1, 0, 0] for i in range(3)}
+    broken = set()
+
+    def record(i: int) -> list:
+        position = i + sim.time
+        return [position, 2 * position, 3 * position, 0.5, 1.0, 1.5, -1.0, -2.0, -3.0, 10.0 + i]
+
+    def node(i: int) -> list:
+        pos, force, vel, mass = record(i)[0:3], record(i)[3:6], record(i)[6:9], record(i)[9]
+        vectors = [dict(x=x, y=y, z=z) for x, y, z in (pos, force, vel)]
+        return [*vectors, mass, groups[i]]
+
+    def poll_mesh(stream, request):
+        if binary and request["binary"]:
+            records = np.array([record(i) for i in range(4)], dtype=np.float32)
+            data = dict(time=sim.time, nodeData=records.tobytes())
+        else:
+            data = dict(time=sim.time, nodes={i: node(i) for i in range(4)})
+        return dict(type="PollMeshVE", data=data)
+
+    def beam_data(stream, request):
+        data = {key: [*value[:3], 5 if key in broken else 0] for key, value in beams.items()}
+        if request.get("brokenOnly") and binary:
+            data = {key: value for key, value in data.items() if key in broken}
+        return dict(type="GetBeamData", data=data)
+
+    sim.set_handler("OpenMesh", lambda stream, request: dict(type="OpenedMesh"))
+    sim.set_handler("CloseMesh", lambda stream, request: dict(type="ClosedMesh"))
+    sim.set_handler("GetMeshId", lambda stream, request: dict(type="GetMeshId", data=7))
+    sim.set_handler("PollMeshVE", poll_mesh)
+    sim.set_handler("GetBeamData", beam_data)
+
+    mesh = Mesh("mesh", bng, vehicle, groups_list=["body"])
+    readings = mesh.poll_arrays()
+    assert readings is not None
+    assert readings.node_ids.tolist() == [0, 1, 3]
+    assert readings.pos.dtype == np.float32 and readings.pos.shape == (3, 3)
+    assert readings.mass.tolist() == [10.0, 11.0, 13.0]
+    # only the beam between the nodes 0 and 1 has both ends in the selected groups
+    assert readings.beams.tolist() == [[0, 1]]
+
+    bng.control.step(30)
+    broken.add("0")
+    readings = mesh.poll_arrays()
+    assert readings is not None
+    assert readings.pos[2].tolist() == pytest.approx([3.5, 7.0, 10.5])
+    assert readings.vel[0].tolist() == pytest.approx([-1.0, -2.0, -3.0])
+    assert len(readings.beam_ids) == 0
+    mesh.remove()
+
+
+def test_mesh_plot_update():
+    readings = MeshArrays(
+        time=0.0,
+        node_ids=np.arange(3, dtype=np.int32),
+        pos=np.array([[0, 0, 0], [1, 0, 0], [0, 1, 1]], dtype=np.float32),
+        force=np.array([[0, 0, 1], [2, 0, 0], [0, 0, 0]], dtype=np.float32),
+        vel=np.zeros((3, 3), dtype=np.float32),
+        mass=np.ones(3, dtype=np.float32),
+        beam_ids=np.arange(2, dtype=np.int32),
+        beams=np.array([[0, 1], [1, 2]], dtype=np.int32),
+    )
+    plot = MeshPlot("force", arrows=True)
+    plot.update(readings)
+    points, lines = plot._points[0], plot._lines[0]
+    plot.update(readings._replace(pos=readings.pos + 1.0))
+    # the artists are updated in place
+    assert plot._points[0] is points and plot._lines[0] is lines
+    assert points.get_offsets()[0].tolist() == [1.0, 1.0]
+    assert len(lines.get_segments()) == 2
+    assert plot._quivers[0].U.tolist() == [0.0, 1.0, 0.0]
+    plt.close(plot.fig)
+
+
 if __name__ == "__main__":
     set_up_simple_logging()
 
@@ -2,6 +2,7 @@ from __future__ import annotations
 
 from time import sleep
 import numpy as np
+import pytest
 
 from beamngpy import BeamNGpy, Scenario, Vehicle, set_up_simple_logging
 from beamngpy.sensors import Radar
@@ -167,6 +168,28 @@ def test_radar(beamng: BeamNGpy):
         bng.ui.show_hud()
 
 
+def test_radar_bin_readings():
+    # (range, doppler velocity, azimuth, elevation, RCS, SNR, weight)
+    readings = np.array(
+        [
+            [10.0, 2.0, 0.0, 0.0, 10.0, 100.0, 1.0],
+            [10.2, 4.0, 0.0, 0.0, 100.0, 10.0, 0.5],
+            [150.0, 1.0, -3.0, 0.0, 1.0, 1.0, 1.0],
+        ]
+    )
+    bins = Radar.bin_readings(
+        readings, (200, 100), 70, 0.0, 100.0, range_bins=10, azimuth_bins=8
+    )
+    assert bins.velocity.shape == bins.tally.shape == (11, 9)
+    assert bins.tally[1, 4] == 2
+    assert bins.velocity[1, 4] == pytest.approx((2.0 + 4.0 * 0.5) / 2)
+    assert bins.rcs[1, 4] == pytest.approx((10.0 + 20.0 * 0.5) / 2)
+    assert bins.snr[1, 4] == pytest.approx((20.0 + 10.0 * 0.5) / 2)
+    # the readings out of range are snapped to the edge bins
+    assert bins.tally[10, 0] == 1
+    assert bins.tally.sum() == 3
+
+
 # Executing this file will perform various tests on all available functionality relating to the RADAR sensor.
 # It is provided to give examples on how to use all RADAR sensor functions currently available in beamngpy.
 if __name__ == "__main__":
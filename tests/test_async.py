@@ -0,0 +1,52 @@
+from __future__ import annotations
+
+import asyncio
+
+import pytest
+
+from beamngpy import AsyncBeamNGpy, Vehicle
+from beamngpy.connection import AsyncConnection, Connection
+from beamngpy.sensors import Camera, Electrics, Timer
+
+
+def test_mock_async_client(mock_bng):
+    bng, sim = mock_bng
+    vehicles = [Vehicle(f"vehicle{i}", model="etk800") for i in range(3)]
+    for vehicle in vehicles:
+        vehicle.sensors.attach("electrics", Electrics())
+        vehicle.sensors.attach("timer", Timer())
+    bng.vehicles.connect_all(vehicles)
+    camera = Camera("camera", bng, resolution=(64, 32), is_render_depth=True)
+
+    async def run():
+        async with AsyncBeamNGpy("127.0.0.1", sim.port) as abng:
+            assert isinstance(abng.connection, AsyncConnection)
+            await abng.control.step(30)
+            assert sim.steps == 30
+
+            states = await abng.vehicles.get_states([v.vid for v in vehicles])
+            assert set(states) == {v.vid for v in vehicles}
+            assert states["vehicle0"]["pos"][0] == pytest.approx(5.0)
+
+            await asyncio.gather(*(abng.vehicles.connect(v) for v in vehicles))
+            await asyncio.gather(*(abng.sensors.poll(v) for v in vehicles))
+            for vehicle in vehicles:
+                assert vehicle.sensors["timer"]["time"] == pytest.approx(0.5)
+
+            # the requests in flight at the same time are matched to their responses by the ID
+            images, _ = await asyncio.gather(
+                abng.sensors.poll_camera(camera), abng.control.step(30)
+            )
+            assert images["colour"].size == (64, 32)
+            assert images["depth"].size == (64, 32)
+            assert sim.steps == 60
+
+    asyncio.run(run())
+    camera.remove()
+
+
+def test_async_connection_is_not_a_connection():
+    connection = AsyncConnection("127.0.0.1", 1)
+    assert not isinstance(connection, Connection)
+    assert connection.RETRY_TIMEOUT == Connection.RETRY_TIMEOUT
+    assert connection.BINARY_RESPONSES is Connection.BINARY_RESPONSES
@@ -0,0 +1,25 @@
+from __future__ import annotations
+
+import json
+
+import pytest
+
+from beamngpy.testing.benchmark import run_benchmarks
+
+
+def test_benchmark_report():
+    report = run_benchmarks(["protocol", "lidar"], repeat=1)
+    report = json.loads(json.dumps(report))
+    assert report["metadata"]["beamngpy"]
+    names = {result["name"] for result in report["results"]}
+    assert names == {
+        "protocol.pack",
+        "protocol.unpack",
+        "lidar.convert_binary_to_array",
+    }
+    for result in report["results"]:
+        assert result["runs"] == 1
+        assert 0 < result["best"] <= result["median"]
+
+    with pytest.raises(ValueError):
+        run_benchmarks(["unknown"])
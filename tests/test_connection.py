@@ -0,0 +1,145 @@
+from __future__ import annotations
+
+import json
+import socket
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+import msgpack
+import pytest
+
+from beamngpy.connection import Connection
+from beamngpy.connection.prefixed_length_socket import PrefixedLengthSocket
+from beamngpy.logging import BNGError
+from beamngpy.sensors import Camera
+from beamngpy.testing import MockSimulator
+
+
+def test_connection_retries():
+    assert len(list(Connection._retry_delays(3, None))) == 2
+    delays = list(Connection._retry_delays(10, 10.0))
+    assert delays[:3] == pytest.approx([0.05, 0.1, 0.2])
+    assert delays[-1] == Connection.RETRY_DELAY_MAX
+    assert Connection.RETRY_TIMEOUT == 120.0
+
+    # a free port, nothing is listening on it
+    with socket.socket() as skt:
+        skt.bind(("127.0.0.1", 0))
+        port = skt.getsockname()[1]
+    start = time.perf_counter()
+    assert not Connection("127.0.0.1", port).connect_to_beamng(log_tries=False, timeout=0.3)
+    assert 0.3 <= time.perf_counter() - start < 2.0
+
+
+def test_mock_pipeline_threads():
+    with MockSimulator() as sim:
+        connection = Connection("127.0.0.1", sim.port, receiver_thread=True)
+        connection.connect_to_beamng()
+        pipelining, other_done = threading.Event(), threading.Event()
+
+        def pipeline_thread():
+            with connection.pipeline():
+                connection.send(dict(type="Step", count=5, ack=True)).ack("Stepped")
+                pipelining.set()
+                assert other_done.wait(5)
+                # the requests of the other thread neither joined nor flushed this pipeline
+                assert len(connection._pipeline.queue) == 1
+                assert sim.steps == 0
+            assert sim.steps == 5
+
+        def other_thread():
+            assert pipelining.wait(5)
+            assert not connection.is_pipelining()
+            state = connection.send(dict(type="GameStateRequest")).recv("GameState")
+            assert state["state"] == "scenario"
+            # the acknowledgement is checked right away, not deferred to the other pipeline
+            with pytest.raises(BNGError):
+                connection.send(dict(type="Pause")).ack("Resumed")
+            other_done.set()
+
+        with ThreadPoolExecutor(2) as executor:
+            futures = [executor.submit(pipeline_thread), executor.submit(other_thread)]
+            for future in futures:
+                future.result(10)
+        connection.disconnect()
+
+
+def test_mock_binary_responses():
+    def blobs(stream, request):
+        return dict(type="Blobs", image=b"\xff\xfe", name=b"abc", nested=dict(image=b"\x00\x01"))
+
+    with MockSimulator() as sim:
+        sim.set_handler("Blobs", blobs)
+        connection = Connection("127.0.0.1", sim.port)
+        connection.connect_to_beamng()
+        try:
+            # only the values of the registered keys are kept as bytes
+            Connection.register_binary_response("Blobs", ["image"])
+            resp = connection.send(dict(type="Blobs")).recv("Blobs")
+            assert resp["image"] == b"\xff\xfe" and resp["nested"]["image"] == b"\x00\x01"
+            assert resp["name"] == "abc"
+
+            # the whole response is kept as it is
+            Connection.register_binary_response("Blobs")
+            resp = connection.send(dict(type="Blobs")).recv("Blobs")
+            assert resp["image"] == b"\xff\xfe" and resp["name"] == b"abc"
+        finally:
+            Connection.unregister_binary_response("Blobs")
+
+        # the default decoding converts every string which is valid utf-8
+        assert "Blobs" not in Connection.BINARY_RESPONSES
+        resp = connection.send(dict(type="Blobs")).recv("Blobs")
+        assert resp["name"] == "abc" and resp["nested"]["image"] == "\x00\x01"
+        assert resp["image"] == b"\xff\xfe"
+        connection.disconnect()
+
+
+def test_mock_stats(mock_bng, tmp_path):
+    bng, sim = mock_bng
+    camera = Camera("camera", bng, resolution=(64, 32), is_render_annotations=False)
+    connection = bng.connection
+    json_path, prometheus_path = tmp_path / "stats.json", tmp_path / "stats.prom"
+    stats = connection.enable_stats(str(json_path), dump_interval=0.05)
+    dump_thread = stats._dump_thread
+    assert dump_thread is not None and dump_thread.is_alive()
+
+    requests = [dict(type="Step", count=1, ack=True) for _ in range(3)]
+    for request in requests:
+        connection.send(request).ack("Stepped")
+    for _ in range(2):
+        camera.poll()
+    snapshot = connection.stats()
+
+    step, poll = snapshot["Step"], snapshot["PollCamera"]
+    assert (step["requests"], step["responses"]) == (3, 3)
+    assert (poll["requests"], poll["responses"]) == (2, 2)
+    header_bytes = PrefixedLengthSocket.HEADER_BYTES
+    assert step["bytes_sent"] == sum(
+        len(msgpack.packb(request, use_bin_type=True)) + header_bytes
+        for request in requests
+    )
+    # the RGBA colour images are sent in the responses
+    assert poll["bytes_received"] > 2 * 64 * 32 * 4
+    assert sum(step["latency"]["buckets"].values()) == 3
+    assert sum(poll["latency"]["buckets"].values()) == 2
+    assert step["latency"]["max"] <= step["latency"]["sum"]
+
+    stats.dump(str(prometheus_path), "prometheus")
+    lines = prometheus_path.read_text().splitlines()
+    labels = f'connection="127.0.0.1:{sim.port}",type="Step"'
+    assert f"beamngpy_requests_total{{{labels}}} 3" in lines
+    assert f'beamngpy_request_latency_seconds_bucket{{{labels},le="+Inf"}} 3' in lines
+    assert f"beamngpy_request_latency_seconds_count{{{labels}}} 3" in lines
+
+    connection.disable_stats()
+    assert not dump_thread.is_alive()
+    # the statistics are written one last time when the dump thread stops
+    dumped = json.loads(json_path.read_text())
+    assert dumped["connection"] == f"127.0.0.1:{sim.port}"
+    assert dumped["types"]["Step"]["requests"] == 3
+    assert dumped["types"]["PollCamera"]["responses"] == 2
+    assert connection.stats() == {}
+    connection.send(dict(type="Step", count=1, ack=True)).ack("Stepped")
+    assert connection.stats() == {}
+    camera.remove()
@@ -2,7 +2,10 @@ from __future__ import annotations
 
 import time
 
+import pytest
+
 from beamngpy import BeamNGpy, Scenario, Vehicle
+from beamngpy.sensors import Camera, Electrics, Lidar, Timer
 
 
 def test_camera_control(beamng: BeamNGpy):
@@ -41,3 +44,69 @@ def test_camera_control(beamng: BeamNGpy):
 
         assert current_camera["orbit"]["focused"]
         assert (abs(current_camera["orbit"]["camDist"])-50) < 0.5
+
+
+def test_mock_step_and_poll(mock_bng):
+    bng, sim = mock_bng
+    vehicles = [Vehicle(f"vehicle{i}", model="etk800") for i in range(3)]
+    for vehicle in vehicles:
+        vehicle.sensors.attach("electrics", Electrics())
+        vehicle.sensors.attach("timer", Timer())
+    bng.vehicles.connect_all(vehicles)
+    camera = Camera("camera", bng, resolution=(64, 32), is_render_depth=False)
+    lidar = Lidar("lidar", bng, is_visualised=False)
+
+    controls = {vehicle: dict(throttle=1.0) for vehicle in vehicles}
+    for step in range(1, 4):
+        sensors, images, readings = bng.control.step_and_poll(
+            30, sensors=[vehicles[0], camera, lidar], controls=controls
+        )
+        assert sensors is vehicles[0].sensors
+        assert sensors["timer"]["time"] == pytest.approx(0.5 * step)
+        assert images["colour"].size == (64, 32)
+        assert readings["pointCloud"].shape == (1000, 3)
+    assert vehicles[1].sensors["timer"] == {}
+    camera.remove()
+    lidar.remove()
+
+
+def test_mock_batch(mock_bng):
+    bng, sim = mock_bng
+    vehicle = Vehicle("vehicle", model="etk800")
+    vehicle.sensors.attach("timer", Timer())
+    vehicle.connect(bng)
+    controls = []
+
+    def control(stream, request):
+        controls.append((stream, request["throttle"]))
+        return dict(type="Controlled")
+
+    sim.set_handler("Control", control)
+    connections = (bng.connection, vehicle.connection)
+    timer_request = dict(type="SensorRequest", sensors=dict(timer=dict(type="Timer")))
+
+    with bng.batch(vehicles=[vehicle]):
+        bng.control.step(30)
+        vehicle.control(throttle=1.0)
+        state = bng.connection.send(dict(type="GameStateRequest"))
+        timer = vehicle.connection.send(dict(timer_request))
+        # nothing was sent yet, the acknowledgements are deferred
+        assert sim.steps == 0 and controls == []
+        assert all(connection.is_pipelining() for connection in connections)
+    assert sim.steps == 30
+    assert controls == [("vehicle", 1.0)]
+    assert state.recv("GameState")["state"] == "scenario"
+    assert timer.recv("SensorData")["data"]["timer"]["time"] == pytest.approx(0.5)
+
+    with pytest.raises(RuntimeError):
+        with bng.batch(vehicles=[vehicle]):
+            bng.control.step(30)
+            vehicle.control(throttle=0.5)
+            raise RuntimeError("failed inside of the batch")
+    # the queued requests were still sent and the connections left the pipelines
+    assert not any(connection.is_pipelining() for connection in connections)
+    assert sim.steps == 60
+    assert controls[-1] == ("vehicle", 0.5)
+    assert bng.control.get_gamestate()["state"] == "scenario"
+    vehicle.sensors.poll("timer")
+    assert vehicle.sensors["timer"]["time"] == pytest.approx(1.0)
@@ -0,0 +1,99 @@
+from __future__ import annotations
+
+import pytest
+
+from beamngpy import BeamNGpy
+from beamngpy.logging import BNGError
+from beamngpy.sensors import Camera, Lidar
+from beamngpy.sensors.shmem import BNGSharedMemory, FrameHeader, SharedMemoryFrame
+from beamngpy.testing import MockSimulator
+
+
+def copy_first_byte(buffer: BNGSharedMemory, slot_size: int):
+    return lambda frame: bytes(buffer.read_slot(frame.slot, slot_size, 1))
+
+
+def test_frame_header_ring():
+    reader = FrameHeader(slots=2)
+    writer = FrameHeader(slots=2, name=reader.name)
+    buffer = BNGSharedMemory(2 * 16)
+    assert not reader.is_active()
+    assert reader.read(copy_first_byte(buffer, 16)) is None
+
+    for frame in (1, 2):
+        with writer.write(frame, timestamp=frame / 60, count=frame) as slot:
+            buffer.buf[slot * 16] = frame
+    assert reader.is_active()
+    assert reader.latest() == SharedMemoryFrame(2, 2 / 60, 2, 0)
+
+    # the newest complete frame is read while the next one is being written
+    with writer.write(3, timestamp=3 / 60) as slot:
+        buffer.buf[slot * 16] = 3
+        frame, data = reader.read(copy_first_byte(buffer, 16))
+        assert frame.frame == 2 and data == b"\x02"
+    frame, data = reader.read(copy_first_byte(buffer, 16))
+    assert frame.frame == 3 and data == b"\x03"
+
+    writer.try_close()
+    reader.try_close()
+    buffer.try_close()
+
+
+def test_frame_header_torn_read():
+    reader = FrameHeader(slots=1)
+    writer = FrameHeader(slots=1, name=reader.name)
+    with writer.write(1, timestamp=0.0):
+        pass
+
+    def copy_while_writing(frame: SharedMemoryFrame) -> None:
+        # the writer starts the next frame while the reader copies the data
+        with writer.write(frame.frame + 1, timestamp=0.0):
+            pass
+
+    reader.MAX_READ_TRIES = 5
+    with pytest.raises(BNGError):
+        reader.read(copy_while_writing)
+    writer.try_close()
+    reader.try_close()
+
+
+@pytest.mark.parametrize("frame_headers", [False, True])
+def test_mock_stream_frames(frame_headers: bool):
+    with MockSimulator(lidar_points=1000, frame_headers=frame_headers) as sim:
+        bng = BeamNGpy("127.0.0.1", sim.port).open(launch=False)
+        lidar = Lidar(
+            "lidar",
+            bng,
+            is_using_shared_memory=True,
+            is_streaming=True,
+            is_visualised=False,
+            stream_slots=3,
+        )
+        camera = Camera(
+            "camera",
+            bng,
+            resolution=(64, 32),
+            is_using_shared_memory=True,
+            is_streaming=True,
+            stream_slots=2,
+        )
+        for step in range(1, 5):
+            bng.control.step(1)
+            readings = lidar.stream_new()
+            assert readings is not None
+            assert readings["pointCloud"].shape == (1000, 3)
+            # the mock marks the frames in the first coordinate
+            assert readings["pointCloud"][0, 0] == step
+            images = camera.stream_new()
+            assert images is not None and images["colour"].size == (64, 32)
+        if frame_headers:
+            assert lidar.last_frame is not None and lidar.last_frame.frame == 4
+            assert lidar.last_frame.timestamp == pytest.approx(4 / 60)
+            assert lidar.stream_new() is None
+            assert camera.stream_new() is None
+        else:
+            assert lidar.last_frame is None
+            assert lidar.stream_new() is not None
+        lidar.remove()
+        camera.remove()
+        bng.disconnect()
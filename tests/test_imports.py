@@ -0,0 +1,21 @@
+from __future__ import annotations
+
+import subprocess
+import sys
+
+import pytest
+
+HEAVY_MODULES = ["matplotlib.pyplot", "seaborn", "PyPDF2", "scipy"]
+
+
+@pytest.mark.parametrize("package", ["beamngpy", "beamngpy.sensors", "beamngpy.tools"])
+def test_import_is_lazy(package: str):
+    # a fresh interpreter, as the other tests may have imported the plotting modules already
+    code = (
+        f"import sys, {package}; "
+        f"print(','.join(m for m in {HEAVY_MODULES!r} if m in sys.modules))"
+    )
+    result = subprocess.run(
+        [sys.executable, "-c", code], capture_output=True, text=True, check=True
+    )
+    assert result.stdout.strip() == ""
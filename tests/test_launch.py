@@ -0,0 +1,53 @@
+from __future__ import annotations
+
+import socket
+import time
+
+import pytest
+
+from beamngpy import BeamNGpy
+from beamngpy.logging import BNGError
+
+
+class StubProcess:
+    """
+    Stands in for the launched simulator process, which exits after the given time.
+    """
+
+    def __init__(self, exit_after: float | None = None, returncode: int = 1):
+        self.exit_time = None if exit_after is None else time.perf_counter() + exit_after
+        self.returncode: int | None = None
+        self._exit_code = returncode
+
+    def poll(self) -> int | None:
+        if self.exit_time is not None and time.perf_counter() >= self.exit_time:
+            self.returncode = self._exit_code
+        return self.returncode
+
+
+def launch(process: StubProcess, monkeypatch, timeout: float) -> None:
+    # a free port, nothing is listening on it, so the connections are refused
+    with socket.socket() as skt:
+        skt.bind(("127.0.0.1", 0))
+        port = skt.getsockname()[1]
+    bng = BeamNGpy("127.0.0.1", port)
+
+    def start_beamng(self, *args, **kwargs):
+        self.process = process
+
+    monkeypatch.setattr(BeamNGpy, "_start_beamng", start_beamng)
+    bng.open(launch_timeout=timeout)
+
+
+def test_launch_timeout(monkeypatch):
+    start = time.perf_counter()
+    with pytest.raises(BNGError, match="did not become ready"):
+        launch(StubProcess(), monkeypatch, timeout=0.5)
+    assert 0.5 <= time.perf_counter() - start < 3.0
+
+
+def test_launch_process_exited(monkeypatch):
+    start = time.perf_counter()
+    with pytest.raises(BNGError, match="exited with code 3"):
+        launch(StubProcess(exit_after=0.2, returncode=3), monkeypatch, timeout=60.0)
+    assert time.perf_counter() - start < 3.0
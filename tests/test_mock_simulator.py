@@ -0,0 +1,27 @@
+from __future__ import annotations
+
+import pytest
+
+from beamngpy import Vehicle
+from beamngpy.sensors import Electrics, Timer
+
+
+def test_mock_vehicles(mock_bng):
+    bng, sim = mock_bng
+    vehicles = [Vehicle(f"vehicle{i}", model="etk800") for i in range(20)]
+    for vehicle in vehicles:
+        vehicle.sensors.attach("electrics", Electrics())
+        vehicle.sensors.attach("timer", Timer())
+    bng.vehicles.connect_all(vehicles)
+    assert all(vehicle.is_connected() for vehicle in vehicles)
+
+    bng.control.step(60)
+    for vehicle in vehicles:
+        vehicle.sensors.poll()
+        assert vehicle.sensors["timer"]["time"] == pytest.approx(1.0)
+        assert vehicle.sensors["electrics"]["rpm"] > 0
+        assert vehicle.state["pos"][0] == pytest.approx(10.0)
+        vehicle.control(throttle=1.0)
+
+    states = bng.vehicles.get_states([vehicle.vid for vehicle in vehicles])
+    assert len(states) == len(vehicles)
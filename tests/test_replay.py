@@ -0,0 +1,79 @@
+from __future__ import annotations
+
+from pathlib import Path
+
+import pytest
+
+from beamngpy import Vehicle
+from beamngpy.connection import Connection
+from beamngpy.logging import BNGError
+from beamngpy.testing import ProtocolServer, ReplayServer, read_capture, record_session
+from beamngpy.types import StrDict
+
+
+class CountingServer(ProtocolServer):
+    def __init__(self):
+        super().__init__()
+        self.counter = 0
+
+    def handle(self, stream: str, request: StrDict) -> StrDict | None:
+        req_type = request["type"]
+        if req_type == "Hello":
+            return dict(type="Hello", protocolVersion=Connection.PROTOCOL_VERSION)
+        if req_type == "Step":
+            return dict(type="Stepped") if request["ack"] else None
+        if req_type == "StartVehicleConnection":
+            port = self.open_vehicle_endpoint(request["vid"])
+            return dict(type=req_type, vid=request["vid"], result=port)
+        self.counter += 1
+        return dict(type=req_type, stream=stream, counter=self.counter)
+
+
+def run_session(port: int) -> list:
+    results = []
+    bng = Connection("127.0.0.1", port)
+    bng.connect_to_beamng()
+    for i in range(3):
+        bng.send(dict(type="Step", count=1, ack=False))
+        results.append(bng.message("Counter"))
+        bng.send(dict(type="Step", count=1, ack=True)).ack("Stepped")
+    results.append(bng.send(dict(type="Counter")).recv("Counter")["counter"])
+
+    vehicle = Vehicle("ego", model="etk800")
+    resp = bng.send(dict(type="StartVehicleConnection", vid=vehicle.vid)).recv()
+    vehicle_connection = Connection("127.0.0.1", resp["result"])
+    vehicle_connection.connect_to_vehicle(vehicle)
+    resp = vehicle_connection.send(dict(type="Counter")).recv("Counter")
+    results.append((resp["stream"], resp["counter"]))
+
+    vehicle_connection.disconnect()
+    bng.disconnect()
+    return results
+
+
+def test_record_and_replay(tmp_path: Path):
+    capture = str(tmp_path / "session.capture")
+    with CountingServer() as server, record_session(capture):
+        recorded = run_session(server.port)
+
+    records = list(read_capture(capture))
+    assert {record.stream for record in records} == {"ge", "ego"}
+    assert {record.direction for record in records} == {"in", "out"}
+
+    with ReplayServer(capture) as server:
+        assert run_session(server.port) == recorded
+
+
+def test_replay_unknown_request(tmp_path: Path):
+    capture = str(tmp_path / "session.capture")
+    with CountingServer() as server, record_session(capture):
+        run_session(server.port)
+
+    with ReplayServer(capture, loop=False) as server:
+        connection = Connection("127.0.0.1", server.port)
+        connection.connect_to_beamng()
+        with pytest.raises(BNGError):
+            connection.message("NotRecorded")
+        with pytest.raises(BNGError):
+            connection.message("Hello")
+        connection.disconnect()
@@ -176,3 +176,29 @@ def test_get_scenetree(beamng: BeamNGpy):
 
         prefab = find_object_name(scenario.scene, "test_scenario")
         assert prefab is not None
+
+
+def test_mock_scenario_update(mock_bng):
+    bng, sim = mock_bng
+    scenario = Scenario("tech_ground", "update")
+    vehicle = Vehicle("ego", model="etk800")
+    scenario.add_vehicle(vehicle, pos=(0, 0, 0))
+    scenario.connect(bng, connect_player=False, connect_existing=False)
+    bng.vehicles.connect_all([vehicle])
+    bng.control.step(30)
+    vehicle.sensors.poll("state")
+    polled = dict(vehicle.state)
+
+    def turned(stream, request):
+        state = dict(pos=[1.0, 2.0, 0.0], dir=[0.0, 1.0, 0.0], up=[0.0, 0.0, 1.0])
+        state["vel"] = [0.0, 10.0, 0.0]
+        return dict(type="ScenarioUpdate", vehicles={"ego": state})
+
+    sim.set_handler("UpdateScenario", turned)
+    scenario.update()
+    # the bulk fields are updated, the other fields of the State sensor are kept
+    assert vehicle.state["pos"] == [1.0, 2.0, 0.0]
+    assert vehicle.state["dir"] == [0.0, 1.0, 0.0]
+    assert vehicle.state["vel"] == [0.0, 10.0, 0.0]
+    assert vehicle.state["time"] == pytest.approx(0.5)
+    assert vehicle.state["rotation"] == polled["rotation"]
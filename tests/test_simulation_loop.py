@@ -0,0 +1,62 @@
+from __future__ import annotations
+
+import time
+
+import pytest
+
+from beamngpy import Vehicle
+from beamngpy.sensors import Camera, Electrics, Lidar, Timer
+from beamngpy.tools import SimulationLoop
+
+
+@pytest.fixture
+def mock_latency():
+    return {"Step": 0.02}
+
+
+def test_simulation_loop(mock_bng):
+    bng, sim = mock_bng
+    vehicle = Vehicle("ego", model="etk800")
+    vehicle.sensors.attach("electrics", Electrics())
+    vehicle.sensors.attach("timer", Timer())
+    bng.vehicles.connect_all([vehicle])
+    camera = Camera("camera", bng, resolution=(64, 32), is_render_depth=False)
+    lidar = Lidar(
+        "lidar", bng, is_using_shared_memory=True, is_streaming=True, is_visualised=False
+    )
+
+    loop = SimulationLoop(bng, steps=6, sensors=[vehicle, camera, lidar])
+    frames = []
+    for frame in loop.run(5):
+        vehicle_readings, images, readings = frame.readings
+        assert vehicle_readings["timer"]["time"] == pytest.approx(0.1 * (frame.index + 1))
+        assert images["colour"].size == (64, 32)
+        assert readings["pointCloud"].shape == (1000, 3)
+        loop.control(vehicle, throttle=1.0)
+        time.sleep(0.02)  # processing overlapped with the next steps
+        frames.append(frame)
+
+    assert [frame.index for frame in frames] == list(range(5))
+    assert sim.time == pytest.approx(0.5)
+    stats = loop.stats()
+    assert stats.frames == 5
+    assert stats.steps == 30
+    assert stats.simulated_time == pytest.approx(0.5)
+    assert stats.real_time_factor > 0
+    # the four overlapped steps finish while the frames are processed
+    assert stats.client_stall < 5 * 0.02
+    camera.remove()
+    lidar.remove()
+
+
+def test_simulation_loop_interrupted(mock_bng):
+    bng, sim = mock_bng
+    loop = SimulationLoop(bng, steps=60, decode=False)
+    for frame in loop.run():
+        if frame.index == 2:
+            break
+    # the step issued before the last frame is completed when the loop is closed
+    assert sim.time == pytest.approx(4.0)
+    assert loop.stats().steps == 240
+    bng.control.step(60)
+    assert sim.time == pytest.approx(5.0)
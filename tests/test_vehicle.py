@@ -8,6 +8,7 @@ import pytest
 
 from beamngpy import BeamNGpy, Scenario, Vehicle, angle_to_quat, sensors
 from beamngpy.logging import BNGValueError
+from beamngpy.sensors import Electrics, Timer
 from beamngpy.types import Float3, StrDict
 
 
@@ -379,6 +380,28 @@ def test_part_configs(beamng: BeamNGpy):
             if k in options_flat:
                 assert v == options_flat[k]
 
+
+def test_mock_poll_sensors(mock_bng):
+    bng, sim = mock_bng
+    vehicles = [Vehicle(f"vehicle{i}", model="etk800") for i in range(10)]
+    for vehicle in vehicles:
+        vehicle.sensors.attach("electrics", Electrics())
+        vehicle.sensors.attach("timer", Timer())
+    bng.vehicles.connect_all(vehicles)
+
+    bng.control.step(30)
+    bng.poll_sensors(vehicles)
+    for i, vehicle in enumerate(vehicles):
+        assert vehicle.sensors["timer"]["time"] == pytest.approx(0.5)
+        assert vehicle.sensors["electrics"]["rpm"] > 0
+        assert vehicle.state["pos"][1] == pytest.approx(5.0 * i)
+
+    bng.control.step(30)
+    bng.poll_sensors(vehicles[:2], "timer")
+    assert vehicles[0].sensors["timer"]["time"] == pytest.approx(1.0)
+    assert vehicles[2].sensors["timer"]["time"] == pytest.approx(0.5)
+
+
 if __name__ == '__main__':
     beamng = BeamNGpy('localhost', 25252, quit_on_close=False)
     test_part_configs(beamng)
\ No newline at end of file